@@ -1,7 +1,8 @@
 import csv
-import gzip
 import time
 from pathlib import Path
+from engine.hash_utils import open_hashed_text
+from engine.manifest import describe_columns
 from engine.runtime_state import stop_event
 
 def export_sql_to_csv(
@@ -13,6 +14,8 @@ def export_sql_to_csv(
     fetch_size=10000,
     stall_seconds=1800,
     log_prefix="",
+    hash_algo=None,
+    meta=None,
 ):
     """
     fetchmany 기반 고속 CSV export
@@ -53,6 +56,8 @@ def export_sql_to_csv(
             return 0
 
         columns = [col[0] for col in cursor.description]
+        if meta is not None:
+            meta["columns"] = describe_columns(cursor.description)
 
         out_file = Path(out_file)
         tmp_file = out_file.with_suffix(out_file.suffix + ".tmp")
@@ -62,13 +67,8 @@ def export_sql_to_csv(
         last_log_ts = time.time()
 
         try:
-            if compression == "gzip":
-                f = gzip.open(tmp_file, "wt", newline="", encoding="utf-8")
-            else:
-                f = open(tmp_file, "w", newline="", encoding="utf-8")
-
             interrupted = False
-            with f:
+            with open_hashed_text(tmp_file, compression, hash_algo) as (f, hw):
                 writer = csv.writer(f)
                 writer.writerow(columns)
 
@@ -103,6 +103,9 @@ def export_sql_to_csv(
                 return total_rows
 
             tmp_file.replace(out_file)
+            if meta is not None:
+                meta.update(rows=total_rows, bytes=hw.bytes_written,
+                            hash_algo=hash_algo, hash=hw.hexdigest())
             logger.debug("File committed: %s", out_file)
 
             logger.info(
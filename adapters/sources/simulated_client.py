@@ -0,0 +1,142 @@
+# file: v2/adapters/sources/simulated_client.py
+"""
+Simulated source (DB-API stand-in) — 운영 DB 없이 export 경로를 측정하기 위한 가짜 소스.
+
+env.yml 예시:
+  sources:
+    simulated:
+      hosts:
+        bench:
+          rows: 200000          # SQL 1개당 반환 row 수
+          type_mix: "int:4,float:2,str:3,date:1"   # 컬럼 구성 (type:개수)
+          str_len: 12           # 문자열 컬럼 길이
+          latency_ms: 0         # fetchmany 1회당 지연 (네트워크 왕복 모사)
+          seed: 42
+
+row는 seed 고정 pool(8192행)을 순환하여 반환한다 → 소스 측 생성 비용을 최소화하고
+같은 설정이면 커밋 간 동일한 데이터가 나온다.
+"""
+
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+_POOL_SIZE = 8192
+
+# cursor.description type_code — python-oracledb 타입명과 동일하게 맞춤
+_TYPE_CODES = {
+    "int":   "DB_TYPE_NUMBER",
+    "float": "DB_TYPE_NUMBER",
+    "str":   "DB_TYPE_VARCHAR",
+    "date":  "DB_TYPE_DATE",
+}
+
+
+def parse_type_mix(spec: str) -> list:
+    """"int:4,float:2,str:3" → ["int","int","int","int","float","float","str","str","str"]"""
+    types = []
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, cnt = part.partition(":")
+        name = name.strip().lower()
+        if name not in _TYPE_CODES:
+            raise ValueError(f"Unsupported simulated column type: {name} (int/float/str/date)")
+        types.extend([name] * int(cnt or 1))
+    if not types:
+        raise ValueError(f"Empty simulated type_mix: {spec!r}")
+    return types
+
+
+def _build_pool(col_types: list, str_len: int, seed: int) -> list:
+    rnd = random.Random(seed)
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    base_date = datetime(2020, 1, 1)
+
+    def gen(t):
+        if t == "int":
+            return rnd.randint(0, 10_000_000)
+        if t == "float":
+            return round(rnd.uniform(0, 1_000_000), 4)
+        if t == "str":
+            return "".join(rnd.choice(alphabet) for _ in range(str_len))
+        return base_date + timedelta(days=rnd.randint(0, 3650), seconds=rnd.randint(0, 86399))
+
+    return [tuple(gen(t) for t in col_types) for _ in range(_POOL_SIZE)]
+
+
+class SimulatedCursor:
+    def __init__(self, conn):
+        self._conn = conn
+        self.arraysize = 100
+        self.description = None
+        self._remaining = 0
+        self._pos = 0
+
+    def execute(self, sql_text, *args, **kwargs):
+        cfg = self._conn
+        self.description = [
+            (f"COL_{i + 1:03d}", _TYPE_CODES[t], None,
+             cfg.str_len if t == "str" else None,
+             18 if t == "int" else None,
+             0 if t == "int" else (4 if t == "float" else None),
+             True)
+            for i, t in enumerate(cfg.col_types)
+        ]
+        self._remaining = cfg.rows
+        self._pos = 0
+        return self
+
+    def fetchmany(self, size=None):
+        size = size or self.arraysize
+        if self._conn.latency:
+            time.sleep(self._conn.latency)
+        n = min(size, self._remaining)
+        if n <= 0:
+            return []
+
+        pool = self._conn.pool
+        out = []
+        while len(out) < n:
+            take = min(n - len(out), len(pool) - self._pos)
+            out.extend(pool[self._pos:self._pos + take])
+            self._pos = (self._pos + take) % len(pool)
+        self._remaining -= n
+        return out
+
+    def close(self):
+        self.description = None
+
+
+class SimulatedConnection:
+    def __init__(self, rows: int, col_types: list, str_len: int, latency_ms: float, seed: int):
+        self.rows = rows
+        self.col_types = col_types
+        self.str_len = str_len
+        self.latency = latency_ms / 1000.0
+        self.pool = _build_pool(col_types, str_len, seed)
+
+    def cursor(self):
+        return SimulatedCursor(self)
+
+    def close(self):
+        self.pool = []
+
+
+def get_simulated_conn(host_cfg: dict):
+    host_cfg = host_cfg or {}
+    col_types = parse_type_mix(host_cfg.get("type_mix", "int:4,float:2,str:3,date:1"))
+    conn = SimulatedConnection(
+        rows=int(host_cfg.get("rows", 100_000)),
+        col_types=col_types,
+        str_len=int(host_cfg.get("str_len", 12)),
+        latency_ms=float(host_cfg.get("latency_ms", 0)),
+        seed=int(host_cfg.get("seed", 42)),
+    )
+    logger.debug("Simulated connection opened | rows=%d cols=%d latency=%.1fms",
+                 conn.rows, len(col_types), conn.latency * 1000)
+    return conn
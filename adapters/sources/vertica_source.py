@@ -1,9 +1,10 @@
 # file: v2/adapters/sources/vertica_source.py
 
 import csv
-import gzip
 import time
 from pathlib import Path
+from engine.hash_utils import open_hashed_text
+from engine.manifest import describe_columns
 from engine.runtime_state import stop_event
 
 
@@ -16,6 +17,8 @@ def export_sql_to_csv(
     fetch_size=10000,
     stall_seconds=1800,
     log_prefix="",
+    hash_algo=None,
+    meta=None,
 ):
     cursor = conn.cursor()
 
@@ -27,6 +30,8 @@ def export_sql_to_csv(
             return 0
 
         columns = [col[0] for col in cursor.description]
+        if meta is not None:
+            meta["columns"] = describe_columns(cursor.description)
 
         out_file = Path(out_file)
         tmp_file = out_file.with_suffix(out_file.suffix + ".tmp")
@@ -36,13 +41,8 @@ def export_sql_to_csv(
         last_log_ts = time.time()
 
         try:
-            if compression == "gzip":
-                f = gzip.open(tmp_file, "wt", newline="", encoding="utf-8")
-            else:
-                f = open(tmp_file, "w", newline="", encoding="utf-8")
-
             interrupted = False
-            with f:
+            with open_hashed_text(tmp_file, compression, hash_algo) as (f, hw):
                 writer = csv.writer(f)
                 writer.writerow(columns)
 
@@ -83,6 +83,9 @@ def export_sql_to_csv(
                 return total_rows
 
             tmp_file.replace(out_file)
+            if meta is not None:
+                meta.update(rows=total_rows, bytes=hw.bytes_written,
+                            hash_algo=hash_algo, hash=hw.hexdigest())
             logger.debug("File committed: %s", out_file)
 
             logger.info(
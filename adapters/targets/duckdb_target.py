@@ -5,7 +5,9 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
+from engine.column_types import read_csv_header
 from engine.connection import now_str
+from engine.sql_utils import match_param_columns
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +28,46 @@ def _ensure_history(conn, schema: str = None):
             file_hash     VARCHAR,
             file_size     BIGINT,
             mtime         VARCHAR,
-            loaded_at     VARCHAR
+            loaded_at     VARCHAR,
+            run_id        VARCHAR
         )
         """
     )
+    # 이전 버전 히스토리 테이블 마이그레이션
+    conn.execute(f"ALTER TABLE {prefix}_LOAD_HISTORY ADD COLUMN IF NOT EXISTS run_id VARCHAR")
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS IX_LOAD_HISTORY ON {prefix}_LOAD_HISTORY (job_name, table_name, file_hash)"
+    )
+
+
+def load_catalog(conn, job_name: str, schema: str = None, prefetch: bool = True) -> dict:
+    """
+    load 1회 동안 재사용하는 조회 캐시.
+      loaded: {(table_name, file_hash)} — job의 적재 이력을 쿼리 1회로 조회 (append skip 판단용)
+              prefetch=False면 None → 파일마다 _history_exists 조회
+    """
+    loaded = None
+    if prefetch:
+        prefix = f'"{schema}".' if schema else ""
+        loaded = set(conn.execute(
+            f"SELECT table_name, file_hash FROM {prefix}_LOAD_HISTORY WHERE job_name = ?",
+            [job_name],
+        ).fetchall())
+    return {"loaded": loaded}
+
+
+def _already_loaded(conn, schema: str, job_name: str, full_table: str, file_hash: str,
+                    catalog: dict = None) -> bool:
+    loaded = (catalog or {}).get("loaded")
+    if loaded is not None:
+        return (full_table, file_hash) in loaded
+    return _history_exists(conn, schema, job_name, full_table, file_hash)
+
+
+def _mark_loaded(catalog: dict, full_table: str, file_hash: str):
+    loaded = (catalog or {}).get("loaded")
+    if loaded is not None:
+        loaded.add((full_table, file_hash))
 
 
 def _history_exists(conn, schema: str, job_name: str, table_name: str, file_hash: str) -> bool:
@@ -48,18 +86,40 @@ def _history_exists(conn, schema: str, job_name: str, table_name: str, file_hash
 
 
 def _insert_history(conn, schema: str, job_name: str, table_name: str, csv_file: str,
-                    file_hash: str, file_size: int, mtime: str):
+                    file_hash: str, file_size: int, mtime: str, run_id: str = None):
     prefix = f'"{schema}".' if schema else ""
     conn.execute(
         f"""
         INSERT INTO {prefix}_LOAD_HISTORY
-            (job_name, table_name, csv_file, file_hash, file_size, mtime, loaded_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
+            (job_name, table_name, csv_file, file_hash, file_size, mtime, loaded_at, run_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """,
-        [job_name, table_name, csv_file, file_hash, file_size, mtime, now_str()],
+        [job_name, table_name, csv_file, file_hash, file_size, mtime, now_str(), run_id],
     )
 
 
+def is_unchanged(conn, job_name: str, table_name: str, file_hashes: list, schema: str = None) -> bool:
+    """
+    테이블이 존재하고, 마지막 적재(run_id 기준)에 사용된 파일 해시 목록이 file_hashes와 같으면 True.
+    load.skip_unchanged (replace/truncate)에서 DROP·재적재 생략 판단에 사용.
+    """
+    if not _table_exists(conn, schema, table_name):
+        return False
+    prefix = f'"{schema}".' if schema else ""
+    full_table = f"{schema}.{table_name}" if schema else table_name
+    rows = conn.execute(
+        f"""
+        SELECT file_hash FROM {prefix}_LOAD_HISTORY
+         WHERE job_name = ? AND table_name = ?
+           AND run_id = (SELECT run_id FROM {prefix}_LOAD_HISTORY
+                          WHERE job_name = ? AND table_name = ? AND run_id IS NOT NULL
+                          ORDER BY loaded_at DESC LIMIT 1)
+        """,
+        [job_name, full_table, job_name, full_table],
+    ).fetchall()
+    return bool(rows) and sorted(r[0] for r in rows) == sorted(file_hashes)
+
+
 def _table_exists(conn, schema: str, table_name: str) -> bool:
     if schema:
         rows = conn.execute(
@@ -80,20 +140,23 @@ def _table_exists(conn, schema: str, table_name: str) -> bool:
 
 def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
              file_hash: str, mode: str, schema: str = None,
-             load_mode: str = "replace") -> int:
+             load_mode: str = "replace", run_id: str = None, catalog: dict = None,
+             merge_keys: list = None, params: dict = None) -> int:
     """
     CSV를 DuckDB 테이블에 적재.
     schema 지정 시 해당 스키마에 생성/INSERT.
     load_mode: replace(DROP+CREATE) | truncate(DELETE+INSERT) | append(INSERT)
-    반환값: 적재된 row 수 (-1이면 skip)
+               | delete(params 기반 DELETE+INSERT) | merge(merge_keys 기준, 바뀐 row만 UPDATE / 새 키만 INSERT)
+    catalog: load_catalog() 결과 (이력 일괄 조회)
+    반환값: 적재된 row 수 (merge는 INSERT·UPDATE된 row 수, -1이면 skip)
     """
     file_size = csv_path.stat().st_size
     mtime = datetime.fromtimestamp(csv_path.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
     full_table = f"{schema}.{table_name}" if schema else table_name
 
     # replace/truncate 시 히스토리 체크 스킵 (어차피 덮어쓰므로)
-    if load_mode == "append":
-        if mode != "retry" and _history_exists(conn, schema, job_name, full_table, file_hash):
+    if load_mode in ("append", "merge"):
+        if mode != "retry" and _already_loaded(conn, schema, job_name, full_table, file_hash, catalog):
             logger.info("LOAD skip (already loaded) | %s | %s", full_table, csv_path.name)
             return -1
 
@@ -108,6 +171,9 @@ def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
         logger.info("LOAD mode=truncate → DELETE FROM %s", tbl)
         conn.execute(f"DELETE FROM {tbl}")
 
+    if load_mode == "delete" and _table_exists(conn, schema, table_name):
+        _delete_by_params(conn, schema, table_name, params or {})
+
     if not _table_exists(conn, schema, table_name):
         logger.info("Table not found, creating: %s", tbl)
         conn.execute(
@@ -115,6 +181,8 @@ def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
             [str(csv_path)],
         )
         row_count = conn.execute(f"SELECT COUNT(*) FROM {tbl}").fetchone()[0]
+    elif load_mode == "merge":
+        row_count = _merge_csv(conn, tbl, csv_path, merge_keys)
     else:
         logger.debug("Table exists: %s", tbl)
         before = conn.execute(f"SELECT COUNT(*) FROM {tbl}").fetchone()[0]
@@ -123,7 +191,9 @@ def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
             [str(csv_path)],
         )
         row_count = conn.execute(f"SELECT COUNT(*) FROM {tbl}").fetchone()[0] - before
-    _insert_history(conn, schema, job_name, full_table, str(csv_path), file_hash, file_size, mtime)
+    _insert_history(conn, schema, job_name, full_table, str(csv_path), file_hash, file_size, mtime,
+                    run_id)
+    _mark_loaded(catalog, full_table, file_hash)
 
     elapsed = time.time() - start
     logger.info("LOAD done | table=%s rows=%d elapsed=%.2fs | mode=%s",
@@ -131,6 +201,369 @@ def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
     return row_count
 
 
+def _delete_by_params(conn, schema: str, table_name: str, params: dict):
+    """params(CSV 파일명) 기반 WHERE 조건으로 DELETE. params가 없으면 전체 DELETE"""
+    tbl = f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
+    if not params:
+        count = conn.execute(f"DELETE FROM {tbl}").fetchone()[0]
+        logger.info("DELETE %s | %d rows (no params, full delete)", tbl, count)
+        return
+
+    # 파라미터 값은 문자열 → 컬럼 타입으로 CAST (BIGINT 컬럼 = VARCHAR 비교 오류 방지)
+    col_types = dict(conn.execute(
+        "SELECT column_name, data_type FROM information_schema.columns"
+        " WHERE table_name = ? AND table_schema = COALESCE(?, current_schema())",
+        [table_name, schema],
+    ).fetchall())
+    matched, unmatched = match_param_columns(params, list(col_types))
+    for key in unmatched:
+        logger.warning("DELETE condition skipped (column not found): %s.%s", tbl, key)
+    if not matched:
+        raise ValueError(
+            f"DELETE 조건 컬럼 매칭 실패: {tbl} — 파라미터 키가 테이블 컬럼과 일치하지 않습니다. "
+            f"params={list(params.keys())}"
+        )
+
+    where = " AND ".join(f'"{col}" = CAST(? AS {col_types[col]})' for col, _ in matched)
+    count = conn.execute(f"DELETE FROM {tbl} WHERE {where}", [val for _, val in matched]).fetchone()[0]
+    logger.info("DELETE %s | %d rows | WHERE %s", tbl, count,
+                " AND ".join(f'"{col}" = {val}' for col, val in matched))
+
+
+def _merge_csv(conn, tbl: str, csv_path: Path, keys: list) -> int:
+    """
+    merge: CSV → TEMP staging(테이블 컬럼 타입으로 변환) → 테이블에 없는/다른 row만 추출(EXCEPT)
+    → 키가 있으면 UPDATE, 없으면 INSERT. 값이 같은 row는 쓰지 않는다.
+    키 제약조건(PK/UNIQUE)이 없는 기존 테이블에도 동작하도록 ON CONFLICT 대신 UPDATE ... FROM 사용.
+    반환: INSERT·UPDATE된 row 수
+    """
+    headers = read_csv_header(csv_path)
+    if not keys:
+        raise ValueError(f"load.mode=merge requires key columns for {tbl} "
+                         f"(--[table] keys=COL1,COL2 or load.merge_keys)")
+    by_lower = {h.lower(): h for h in headers}
+    missing = [k for k in keys if k.lower() not in by_lower]
+    if missing:
+        raise ValueError(f"merge key column(s) not in CSV header: {tbl} {missing}")
+    keys = [by_lower[k.lower()] for k in keys]
+    values = [h for h in headers if h not in keys]
+
+    col_list = ", ".join(f'"{h}"' for h in headers)
+    on = " AND ".join(f't."{k}" IS NOT DISTINCT FROM c."{k}"' for k in keys)
+
+    conn.begin()
+    try:
+        conn.execute(f"CREATE OR REPLACE TEMP TABLE __merge_stage AS SELECT {col_list} FROM {tbl} LIMIT 0")
+        conn.execute("INSERT INTO __merge_stage BY NAME SELECT * FROM read_csv_auto(?, header=True)",
+                     [str(csv_path)])
+        conn.execute(
+            f"CREATE OR REPLACE TEMP TABLE __merge_changed AS "
+            f"SELECT {col_list} FROM __merge_stage EXCEPT SELECT {col_list} FROM {tbl}"
+        )
+        updated = 0
+        if values:
+            sets = ", ".join(f'"{c}" = c."{c}"' for c in values)
+            updated = conn.execute(
+                f"UPDATE {tbl} AS t SET {sets} FROM __merge_changed AS c WHERE {on}"
+            ).fetchone()[0]
+        inserted = conn.execute(
+            f"INSERT INTO {tbl} ({col_list}) SELECT {col_list} FROM __merge_changed AS c "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {tbl} AS t WHERE {on})"
+        ).fetchone()[0]
+        staged = conn.execute("SELECT COUNT(*) FROM __merge_stage").fetchone()[0]
+        conn.execute("DROP TABLE __merge_stage")
+        conn.execute("DROP TABLE __merge_changed")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    logger.info("LOAD merge | table=%s staged=%d inserted=%d updated=%d", tbl, staged, inserted, updated)
+    return inserted + updated
+
+
+def _insert_history_batch(conn, schema: str, rows: list, run_id: str = None):
+    """rows: [(job_name, table_name, csv_file, file_hash, file_size, mtime), ...] — 한 번에 기록"""
+    if not rows:
+        return
+    prefix = f'"{schema}".' if schema else ""
+    loaded_at = now_str()
+    conn.executemany(
+        f"""
+        INSERT INTO {prefix}_LOAD_HISTORY
+            (job_name, table_name, csv_file, file_hash, file_size, mtime, loaded_at, run_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [list(r) + [loaded_at, run_id] for r in rows],
+    )
+
+
+def parse_csv_group(conn, csv_paths: list):
+    """
+    CSV 묶음을 별도 cursor에서 Arrow 테이블로 파싱 (filename 컬럼 포함).
+    load_stage가 다음 테이블들을 미리 파싱하는 동안 writer는 load_csv_group(staged=...)으로 적재.
+    pyarrow 필요.
+    """
+    cur = conn.cursor()
+    try:
+        return cur.execute(
+            "SELECT * FROM read_csv(?, header=true, filename=true)",
+            [[str(p) for p in csv_paths]],
+        ).fetch_arrow_table()
+    finally:
+        cur.close()
+
+
+def load_csv_group(conn, job_name: str, table_name: str, csv_paths: list,
+                   file_hashes: list, mode: str, schema: str = None,
+                   load_mode: str = "replace", staged=None, run_id: str = None,
+                   catalog: dict = None, file_params: list = None) -> list:
+    """
+    같은 테이블로 가는 CSV 여러 개를 read_csv([...]) 한 번으로 적재.
+      - 스니핑/파싱 1회 (DuckDB가 파일들을 병렬 파싱), COUNT(*) 없음
+      - 파일별 row 수는 filename=true 컬럼으로 집계
+      - DROP/DELETE 1회, _LOAD_HISTORY는 한 번에 기록, 전체를 1 트랜잭션으로 처리
+    load_mode: replace(DROP 후 전체 적재) | truncate(DELETE 후 INSERT) | append(INSERT)
+               | delete(파일별 params 기반 DELETE 후 INSERT)
+    staged: parse_csv_group()으로 미리 파싱한 Arrow 테이블 (있으면 CSV를 다시 읽지 않음)
+    file_params: csv_paths와 같은 순서의 파일명 params (delete 모드)
+    catalog: load_catalog() 결과 (이력 일괄 조회)
+    반환값: csv_paths와 같은 순서의 row 수 리스트 (-1이면 skip)
+    """
+    full_table = f"{schema}.{table_name}" if schema else table_name
+    tbl = f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
+    results = [-1] * len(csv_paths)
+
+    pending = []
+    for i, (csv_path, file_hash) in enumerate(zip(csv_paths, file_hashes)):
+        # replace/truncate 시 히스토리 체크 스킵 (어차피 덮어쓰므로)
+        if load_mode == "append" and mode != "retry" \
+                and _already_loaded(conn, schema, job_name, full_table, file_hash, catalog):
+            logger.info("LOAD skip (already loaded) | %s | %s", full_table, csv_path.name)
+            continue
+        pending.append(i)
+
+    if not pending:
+        return results
+
+    files = [str(csv_paths[i]) for i in pending]
+    start = time.time()
+
+    conn.begin()
+    try:
+        exists = _table_exists(conn, schema, table_name)
+        if exists and load_mode == "replace":
+            logger.info("LOAD mode=replace → DROP TABLE %s", tbl)
+            conn.execute(f"DROP TABLE IF EXISTS {tbl}")
+            exists = False
+        elif exists and load_mode == "truncate":
+            logger.info("LOAD mode=truncate → DELETE FROM %s", tbl)
+            conn.execute(f"DELETE FROM {tbl}")
+        elif exists and load_mode == "delete":
+            for i in pending:
+                _delete_by_params(conn, schema, table_name, file_params[i] if file_params else {})
+
+        if not exists:
+            logger.info("Table not found, creating: %s", tbl)
+
+        if staged is not None:
+            conn.register("__load_arrow", staged)
+            try:
+                src = "__load_arrow"
+                if len(files) < len(csv_paths):
+                    src = "(SELECT * FROM __load_arrow WHERE list_contains(?, filename))"
+                args = [files] if len(files) < len(csv_paths) else []
+                counts = dict(conn.execute(
+                    f"SELECT filename, COUNT(*) FROM {src} GROUP BY filename", args
+                ).fetchall())
+                stmt = f"CREATE TABLE {tbl} AS" if not exists else f"INSERT INTO {tbl}"
+                conn.execute(f"{stmt} SELECT * EXCLUDE (filename) FROM {src}", args)
+            finally:
+                conn.unregister("__load_arrow")
+        elif len(files) == 1:
+            # 단일 파일: CREATE/INSERT 결과 row 수를 그대로 사용
+            stmt = f"CREATE TABLE {tbl} AS" if not exists else f"INSERT INTO {tbl}"
+            count = conn.execute(f"{stmt} SELECT * FROM read_csv_auto(?, header=True)",
+                                 [files[0]]).fetchone()[0]
+            counts = {files[0]: count}
+        else:
+            conn.execute(
+                "CREATE OR REPLACE TEMP TABLE __load_stage AS "
+                "SELECT * FROM read_csv(?, header=true, filename=true)",
+                [files],
+            )
+            counts = dict(conn.execute(
+                "SELECT filename, COUNT(*) FROM __load_stage GROUP BY filename"
+            ).fetchall())
+            stmt = f"CREATE TABLE {tbl} AS" if not exists else f"INSERT INTO {tbl}"
+            conn.execute(f"{stmt} SELECT * EXCLUDE (filename) FROM __load_stage")
+            conn.execute("DROP TABLE __load_stage")
+
+        history = []
+        for i in pending:
+            csv_path = csv_paths[i]
+            st = csv_path.stat()
+            mtime = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+            results[i] = counts.get(str(csv_path), 0)
+            history.append((job_name, full_table, str(csv_path), file_hashes[i], st.st_size, mtime))
+        _insert_history_batch(conn, schema, history, run_id)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    for i in pending:
+        _mark_loaded(catalog, full_table, file_hashes[i])
+
+    elapsed = time.time() - start
+    logger.info("LOAD done | table=%s files=%d rows=%d elapsed=%.2fs | mode=%s",
+                full_table, len(files), sum(counts.values()), elapsed, load_mode)
+    return results
+
+
+def _sql_str(value: str) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _clear_history(conn, job_name: str, table_name: str, schema: str = None):
+    """view ↔ table 전환으로 객체를 DROP했을 때 해당 테이블의 job 적재 이력 삭제 (다음 append/merge가 skip하지 않도록)"""
+    prefix = f'"{schema}".' if schema else ""
+    conn.execute(f"DELETE FROM {prefix}_LOAD_HISTORY WHERE job_name = ? AND table_name = ?",
+                 [job_name, table_name])
+
+
+def create_view(conn, table_name: str, sources: list, schema: str = None, param_keys: list = None,
+                job_name: str = None):
+    """
+    load.mode=view: 데이터를 DB로 복사하지 않고 export 파일 위에 VIEW 생성 (CREATE OR REPLACE).
+    sources: 파일 glob 목록 — 조회할 때마다 glob을 다시 펼치므로 이후 export된 파일도 바로 보인다
+             .parquet → read_parquet, 그 외 read_csv (형식이 섞이면 UNION ALL BY NAME)
+    param_keys: 파일명 파라미터(__clsYymm_202303)를 VARCHAR 컬럼으로 추가 (hive partition 컬럼과 같은 용도).
+                파일에 이미 같은 컬럼(CLS_YYMM 등)이 있는 키는 추가하지 않는다.
+    같은 이름의 테이블이 있으면 DROP 후 VIEW로 대체 (WARNING 로그 + job_name의 적재 이력 삭제).
+    """
+    tbl = f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
+    parquet = [s for s in sources if s.endswith(".parquet")]
+    csv = [s for s in sources if not s.endswith(".parquet")]
+    # VIEW 정의(DDL)에는 bind 불가 → 문자열 리터럴
+    readers = []
+    if csv:
+        readers.append(f"read_csv([{', '.join(map(_sql_str, csv))}], header=true, "
+                       f"union_by_name=true, filename=true)")
+    if parquet:
+        readers.append(f"read_parquet([{', '.join(map(_sql_str, parquet))}], "
+                       f"union_by_name=true, filename=true)")
+
+    extras = []
+    new_keys = []
+    if param_keys:
+        file_cols = [r[0] for r in conn.execute(f"DESCRIBE SELECT * FROM {readers[0]}").fetchall()]
+        _, new_keys = match_param_columns(dict.fromkeys(param_keys, ""), file_cols)
+        for key in new_keys:
+            pattern = _sql_str(f"__{key}_(.+?)(__|\\.csv|\\.parquet)")
+            extras.append(f"NULLIF(regexp_extract(parse_filename(filename), {pattern}, 1), '') AS \"{key}\"")
+
+    select = ", ".join(["* EXCLUDE (filename)"] + extras)
+    body = " UNION ALL BY NAME ".join(f"SELECT {select} FROM {r}" for r in readers)
+
+    existing = conn.execute(
+        "SELECT table_type FROM information_schema.tables"
+        " WHERE table_name = ? AND table_schema = COALESCE(?, current_schema())",
+        [table_name, schema],
+    ).fetchone()
+    if existing and existing[0] == "BASE TABLE":
+        logger.warning("LOAD mode=view → DROP TABLE %s (loaded rows are replaced by the view)", tbl)
+        conn.execute(f"DROP TABLE {tbl}")
+        if job_name:
+            _clear_history(conn, job_name, table_name, schema)
+    conn.execute(f"CREATE OR REPLACE VIEW {tbl} AS {body}")
+    logger.info("VIEW done | table=%s | sources=%s%s", tbl, ", ".join(sources),
+                f" | param_columns={','.join(new_keys)}" if new_keys else "")
+
+
+def has_unique_index(conn, table_name: str, schema: str = None) -> bool:
+    """테이블에 UNIQUE 인덱스 / PRIMARY KEY·UNIQUE 제약조건이 있는지"""
+    row = conn.execute(
+        "SELECT 1 FROM duckdb_indexes()"
+        " WHERE table_name = ? AND schema_name = COALESCE(?, current_schema()) AND is_unique"
+        " UNION ALL "
+        "SELECT 1 FROM duckdb_constraints()"
+        " WHERE table_name = ? AND schema_name = COALESCE(?, current_schema())"
+        " AND constraint_type IN ('PRIMARY KEY', 'UNIQUE')"
+        " LIMIT 1",
+        [table_name, schema, table_name, schema],
+    ).fetchone()
+    return row is not None
+
+
+def drop_views(conn, table_names: list, schema: str = None, job_name: str = None):
+    """
+    load.mode=view로 만든 VIEW를 테이블 적재 전에 제거 (같은 이름으로 테이블 생성).
+    view 전환 전의 적재 이력이 남아 있으면 append/merge가 전부 skip되므로 job_name의 이력도 삭제.
+    """
+    for table_name in table_names:
+        row = conn.execute(
+            "SELECT table_type FROM information_schema.tables"
+            " WHERE table_name = ? AND table_schema = COALESCE(?, current_schema())",
+            [table_name, schema],
+        ).fetchone()
+        if row and row[0] == "VIEW":
+            tbl = f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
+            logger.warning("LOAD view → table: DROP VIEW %s (load history cleared, full reload)", tbl)
+            conn.execute(f"DROP VIEW {tbl}")
+            if job_name:
+                _clear_history(conn, job_name, table_name, schema)
+
+
+def post_load(conn, table_name: str, indexes: list, analyze: bool, schema: str = None) -> dict:
+    """
+    적재 완료 후 인덱스 생성 + 통계 갱신 (load.post_load).
+    indexes: [{"name", "columns", "unique"}, ...]
+      같은 이름 인덱스가 이미 있으면 건너뜀 (정의가 다르면 경고 — 자동으로 다시 만들지 않음)
+    반환: {"indexes": 실제 생성 수, "analyze": bool}
+    """
+    tbl = f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
+    created = 0
+    for idx in indexes:
+        existing = _index_definition(conn, idx["name"], schema)
+        if existing:
+            _warn_index_mismatch(idx, existing, table_name)
+            continue
+        col_list = ", ".join(f'"{c}"' for c in idx["columns"])
+        unique = "UNIQUE " if idx.get("unique") else ""
+        conn.execute(f'CREATE {unique}INDEX "{idx["name"]}" ON {tbl} ({col_list})')
+        created += 1
+    if analyze:
+        conn.execute(f"ANALYZE {tbl}")
+    return {"indexes": created, "analyze": bool(analyze)}
+
+
+def _index_definition(conn, index_name: str, schema: str = None):
+    """duckdb_indexes() → (테이블명, [컬럼], unique) / 없으면 None"""
+    row = conn.execute(
+        "SELECT table_name, expressions, is_unique FROM duckdb_indexes()"
+        " WHERE index_name = ? AND schema_name = COALESCE(?, current_schema())",
+        [index_name, schema],
+    ).fetchone()
+    if not row:
+        return None
+    exprs = row[1]
+    if isinstance(exprs, str):   # 구버전: '[A, B]' 문자열
+        exprs = [e for e in exprs.strip("[]").split(",") if e.strip()]
+    return row[0], [str(e).strip().strip('"') for e in exprs], bool(row[2])
+
+
+def _warn_index_mismatch(idx: dict, existing, table_name: str):
+    """설정과 기존 인덱스(테이블·컬럼·unique) 비교 — 다르면 경고"""
+    ex_table, ex_columns, ex_unique = existing
+    wanted = (table_name.upper(), [c.upper() for c in idx["columns"]], bool(idx.get("unique")))
+    if (ex_table.upper(), [c.upper() for c in ex_columns], ex_unique) != wanted:
+        logger.warning("POST_LOAD index %s exists with a different definition "
+                       "(existing: %s(%s)%s, configured: %s(%s)%s) → kept, drop it to rebuild",
+                       idx["name"], ex_table, ",".join(ex_columns), " unique" if ex_unique else "",
+                       table_name, ",".join(idx["columns"]), " unique" if idx.get("unique") else "")
+    else:
+        logger.debug("POST_LOAD index exists, skipped: %s", idx["name"])
+
+
 def connect(db_path: Path):
     import duckdb
     return duckdb.connect(str(db_path))
\ No newline at end of file
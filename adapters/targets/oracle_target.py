@@ -1,13 +1,18 @@
 # file: v2/adapters/targets/oracle_target.py
 
 import csv
-import gzip
+import io
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
+from engine.column_types import column_kind, columns_by_name, read_csv_header, scan_csv_types
 from engine.connection import now_str
+from engine.csv_reader import open_csv_rows
+from engine.sql_utils import match_param_columns
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +88,65 @@ def _ensure_history(cur, conn, schema: str = None):
         """)
         conn.commit()
         logger.info("CREATE TABLE %s", tbl)
+    _ensure_history_index(cur, conn, schema)
+
+
+def _ensure_history_index(cur, conn, schema: str = None):
+    """(job_name, table_name, file_hash) 인덱스 — 이력이 쌓여도 skip 판단이 full scan 되지 않도록"""
+    if schema:
+        cur.execute(
+            "SELECT COUNT(1) FROM all_indexes WHERE owner = :1 AND index_name = '_LOAD_HISTORY_IX'",
+            (schema.upper(),),
+        )
+    else:
+        cur.execute("SELECT COUNT(1) FROM user_indexes WHERE index_name = '_LOAD_HISTORY_IX'")
+    if cur.fetchone()[0] == 0:
+        idx = _qualified(schema, "_LOAD_HISTORY_IX")
+        cur.execute(
+            f"CREATE INDEX {idx} ON {_qualified(schema, '_LOAD_HISTORY')} (job_name, table_name, file_hash)"
+        )
+        conn.commit()
+        logger.info("CREATE INDEX %s", idx)
+
+
+def load_catalog(conn, job_name: str, schema: str = None, prefetch: bool = True) -> dict:
+    """
+    load 1회 동안 재사용하는 조회 캐시 (파일마다 반복되던 딕셔너리·이력 조회 제거).
+      loaded: {(table_name, file_hash)} — job의 적재 이력을 쿼리 1회로 조회 (append skip 판단용)
+              prefetch=False면 None → 파일마다 _history_exists 조회
+      ("exists"|"columns"|"types"|"partkeys", TABLE): all_tables / all_tab_columns / all_part_key_columns 조회 결과
+    _LOAD_HISTORY 생성 확인도 여기서 1회 수행한다.
+    """
+    cur = conn.cursor()
+    try:
+        _ensure_history(cur, conn, schema)
+        loaded = None
+        if prefetch:
+            cur.arraysize = 5000
+            cur.execute(
+                f"SELECT table_name, file_hash FROM {_qualified(schema, '_LOAD_HISTORY')} WHERE job_name = :1",
+                (job_name,),
+            )
+            loaded = set(cur.fetchall())
+    finally:
+        cur.close()
+    return {"history": True, "loaded": loaded}
+
+
+def _cached(catalog: dict, key, fn):
+    """catalog가 있으면 key별로 fn() 결과를 재사용"""
+    if catalog is None:
+        return fn()
+    if key not in catalog:
+        catalog[key] = fn()
+    return catalog[key]
+
+
+def _forget_table(catalog: dict, table_name: str):
+    """테이블 생성 후 캐시된 딕셔너리 정보 폐기"""
+    if catalog is not None:
+        for kind in ("exists", "columns", "types", "partkeys"):
+            catalog.pop((kind, table_name.upper()), None)
 
 
 def _history_exists(cur, schema: str, job_name: str, table_name: str, file_hash: str) -> bool:
@@ -126,50 +190,67 @@ def _table_exists(cur, schema: str, table_name: str) -> bool:
     return cur.fetchone()[0] > 0
 
 
-def _infer_oracle_type(values: list) -> str:
-    non_empty = [v for v in values if v.strip() != ""]
-    if not non_empty:
-        return "VARCHAR2(4000)"
-    try:
-        [int(v) for v in non_empty]
+def _infer_oracle_type(kind: str, max_len: int) -> str:
+    """scan_csv_types() 추론 결과 → Oracle 컬럼 타입 (문자열은 CHAR 기준 길이)"""
+    if kind in ("int", "float"):
         return "NUMBER"
-    except ValueError:
-        pass
-    try:
-        [float(v) for v in non_empty]
+    if kind is None:
+        return "VARCHAR2(4000 CHAR)"
+    for limit in (100, 500, 2000, 4000):
+        if max_len <= limit:
+            return f"VARCHAR2({limit} CHAR)"
+    return "CLOB"
+
+
+def _oracle_type_from_meta(col: dict):
+    """소스 컬럼 메타 → Oracle 컬럼 타입 (모르는 타입이면 None → CSV 추론)"""
+    kind, size, precision, scale = column_kind(col)
+    if precision and precision > 38:
+        precision = None
+    if kind == "int":
+        return f"NUMBER({precision})" if precision else "NUMBER(19)"
+    if kind == "decimal":
+        if precision and scale is not None and 0 <= scale <= precision:
+            return f"NUMBER({precision},{scale})"
         return "NUMBER"
-    except ValueError:
-        pass
-    max_len = max(len(v) for v in non_empty)
-    if max_len <= 100:
-        return "VARCHAR2(100)"
-    elif max_len <= 500:
-        return "VARCHAR2(500)"
-    elif max_len <= 2000:
-        return "VARCHAR2(2000)"
-    else:
-        return "VARCHAR2(4000)"
-
-
-def _create_table_from_csv(cur, conn, schema: str, table_name: str, csv_path: Path):
-    open_fn = gzip.open if str(csv_path).endswith(".gz") else open
-    with open_fn(csv_path, "rt", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        headers = next(reader)
-        samples = [[] for _ in headers]
-        for i, row in enumerate(reader):
-            if i >= 100:
-                break
-            for j, val in enumerate(row):
-                if j < len(samples):
-                    samples[j].append(val)
-
-    col_defs = [f'  "{col.upper()}" {_infer_oracle_type(vals)}'
-                for col, vals in zip(headers, samples)]
+    if kind == "float":
+        return "NUMBER"
+    if kind == "string" and size:
+        return f"VARCHAR2({int(size)} CHAR)" if int(size) <= 4000 else "CLOB"
+    if kind == "clob":
+        return "CLOB"
+    if kind == "date":
+        return "DATE"
+    if kind == "timestamp":
+        return "TIMESTAMP"
+    return None
+
+
+def _create_table_from_csv(cur, conn, schema: str, table_name: str, csv_path: Path,
+                           columns: list = None):
+    """
+    CSV 헤더 기준으로 테이블 자동 생성.
+    columns(manifest 소스 메타)가 있으면 소스 타입·정밀도 사용, 없는 컬럼만 CSV 전체 스캔으로 추론.
+    """
+    headers = read_csv_header(csv_path)
+    meta = columns_by_name(columns)
+
+    col_types = {}
+    for col in headers:
+        if col.upper() in meta:
+            col_types[col] = _oracle_type_from_meta(meta[col.upper()])
+    missing = [col for col in headers if not col_types.get(col)]
+    if missing:
+        logger.debug("CREATE TABLE %s | inferring %d column(s) from CSV", table_name, len(missing))
+        scanned = scan_csv_types(csv_path, set(missing))
+        for col in missing:
+            col_types[col] = _infer_oracle_type(*scanned.get(col, (None, 0)))
+
+    col_defs = [f'  "{col.upper()}" {col_types[col]}' for col in headers]
     tbl = _qualified(schema, table_name)
     ddl = f"CREATE TABLE {tbl} (\n" + ",\n".join(col_defs) + "\n)"
 
-    logger.info("CREATE TABLE %s", tbl)
+    logger.info("CREATE TABLE %s%s", tbl, " (source types)" if len(missing) < len(headers) else "")
     logger.debug("DDL:\n%s", ddl)
     cur.execute(ddl)
     conn.commit()
@@ -194,8 +275,363 @@ def _get_table_columns(cur, schema: str, table_name: str) -> list:
     return [row[0] for row in cur.fetchall()]
 
 
-def _delete_by_params(cur, conn, schema: str, table_name: str, params: dict):
-    """params 기반 WHERE 조건으로 DELETE 실행"""
+def _get_column_types(cur, schema: str, table_name: str) -> dict:
+    """{컬럼명(UPPER): (data_type, data_length, char_length)}"""
+    if schema:
+        cur.execute(
+            "SELECT column_name, data_type, data_length, char_length FROM all_tab_columns"
+            " WHERE owner = :1 AND table_name = :2",
+            (schema.upper(), table_name.upper()),
+        )
+    else:
+        cur.execute(
+            "SELECT column_name, data_type, data_length, char_length FROM user_tab_columns"
+            " WHERE table_name = :1",
+            (table_name.upper(),),
+        )
+    return {row[0]: tuple(row[1:]) for row in cur.fetchall()}
+
+
+_STRING_TYPES = ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR")
+_NUMBER_TYPES = ("NUMBER", "FLOAT", "BINARY_DOUBLE", "BINARY_FLOAT")
+_NUMBER_BIND_SIZE = 64   # 숫자도 CSV 문자열로 bind → 서버에서 변환
+_DATE_BIND_SIZE = 40
+
+
+def _input_sizes(headers: list, col_types: dict) -> list:
+    """
+    setinputsizes용 bind 크기 (테이블 컬럼 타입 기준).
+    미지정 시 드라이버가 batch마다 값 길이로 bind 버퍼를 다시 잡는다.
+    LOB 등 그 외 타입은 None (드라이버 기본).
+    """
+    sizes = []
+    for h in headers:
+        data_type, data_length, char_length = col_types.get(h.upper(), (None, None, None))
+        data_type = data_type or ""
+        if data_type in _STRING_TYPES:
+            sizes.append(int(char_length or data_length or 4000))
+        elif data_type in _NUMBER_TYPES:
+            sizes.append(_NUMBER_BIND_SIZE)
+        elif data_type == "DATE" or data_type.startswith("TIMESTAMP"):
+            sizes.append(_DATE_BIND_SIZE)
+        else:
+            sizes.append(None)
+    return sizes
+
+
+def _set_date_formats(cur, col_types: dict):
+    """DATE/TIMESTAMP 컬럼이 있으면 export CSV 형식(YYYY-MM-DD HH24:MI:SS)으로 세션 NLS 설정"""
+    if not any(t[0] == "DATE" or (t[0] or "").startswith("TIMESTAMP") for t in col_types.values()):
+        return
+    cur.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD HH24:MI:SS'")
+    cur.execute("ALTER SESSION SET NLS_TIMESTAMP_FORMAT = 'YYYY-MM-DD HH24:MI:SS.FF'")
+
+
+def _iter_rows(reader):
+    """빈 문자열·공백만 있는 값 → None"""
+    for row in reader:
+        yield [None if not v or v.isspace() else v for v in row]
+
+
+def _insert_rows(cur, conn, insert_sql: str, rows, input_sizes: list, batch_size: int,
+                 direct_path: bool, bad_file: Path = None, headers: list = None):
+    """
+    batch 단위 executemany.
+    direct_path: batch마다 commit (APPEND_VALUES 이후 같은 트랜잭션에서 재적재 불가, ORA-12838)
+    bad_file: batcherrors=True → 거부 row를 bad_file(CSV + ORA_ERROR 컬럼)에 기록
+    반환: (적재 row 수, 거부 row 수)
+    """
+    loaded = 0
+    rejected = 0
+    bad_f = bad_writer = None
+    try:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            cur.setinputsizes(*input_sizes)
+            if bad_file is None:
+                cur.executemany(insert_sql, batch)
+                loaded += len(batch)
+            else:
+                cur.executemany(insert_sql, batch, batcherrors=True)
+                errors = cur.getbatcherrors()
+                if errors:
+                    if bad_writer is None:
+                        bad_f = open(bad_file, "w", newline="", encoding="utf-8")
+                        bad_writer = csv.writer(bad_f)
+                        bad_writer.writerow(list(headers) + ["ORA_ERROR"])
+                    for err in errors:
+                        bad_writer.writerow(
+                            ["" if v is None else v for v in batch[err.offset]] + [err.message.strip()]
+                        )
+                rejected += len(errors)
+                loaded += len(batch) - len(errors)
+            if direct_path:
+                conn.commit()
+    finally:
+        if bad_f:
+            bad_f.close()
+    return loaded, rejected
+
+
+# --------------------------------------------------
+# 대용량 파일 chunk 병렬 적재
+# --------------------------------------------------
+
+_SCAN_BLOCK = 64 * 1024 * 1024
+_SCAN_READ = 1024 * 1024
+
+
+def _count_quotes(f, start: int, end: int) -> int:
+    f.seek(start)
+    n = 0
+    remaining = end - start
+    while remaining > 0:
+        b = f.read(min(_SCAN_BLOCK, remaining))
+        if not b:
+            break
+        n += b.count(b'"')
+        remaining -= len(b)
+    return n
+
+
+def _next_record_start(f, pos: int, in_quotes: bool, size: int) -> int:
+    """pos 이후 따옴표 밖에 있는 첫 줄바꿈의 다음 위치 (없으면 size)"""
+    f.seek(pos)
+    while pos < size:
+        block = f.read(_SCAN_READ)
+        if not block:
+            break
+        i = 0
+        while True:
+            nl = block.find(b"\n", i)
+            if nl < 0:
+                if block.count(b'"', i) % 2:
+                    in_quotes = not in_quotes
+                break
+            if block.count(b'"', i, nl) % 2:
+                in_quotes = not in_quotes
+            if not in_quotes:
+                return pos + nl + 1
+            i = nl + 1
+        pos += len(block)
+    return size
+
+
+def _chunk_ranges(csv_path: Path, n_chunks: int) -> list:
+    """
+    헤더 이후 데이터를 n_chunks개의 byte 범위로 분할. 경계는 레코드 시작에 맞춘다.
+    따옴표 개수의 홀짝(quote parity)으로 quoted 필드 안의 줄바꿈을 경계로 오인하지 않음
+    (csv.writer 출력처럼 "" 이스케이프를 쓰는 표준 CSV 전제).
+    반환: [(start, end), ...]
+    """
+    size = csv_path.stat().st_size
+    with open(csv_path, "rb") as f:
+        data_start = _next_record_start(f, 0, False, size)
+        targets = [data_start + (size - data_start) * i // n_chunks for i in range(1, n_chunks)]
+        bounds = [data_start]
+        for t in targets:
+            if t <= bounds[-1]:
+                continue
+            in_quotes = _count_quotes(f, bounds[-1], t) % 2 == 1
+            b = _next_record_start(f, t, in_quotes, size)
+            if b >= size:
+                break
+            bounds.append(b)
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+class _RangeReader(io.RawIOBase):
+    """파일의 [start, end) 구간만 읽는 raw stream"""
+
+    def __init__(self, path: Path, start: int, end: int):
+        self._f = open(path, "rb")
+        self._f.seek(start)
+        self._left = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._left <= 0:
+            return 0
+        n = self._f.readinto(memoryview(b)[:min(len(b), self._left)])
+        self._left -= n or 0
+        return n
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            super().close()
+        finally:
+            self._f.close()
+
+
+def _load_chunk(pool, csv_path: Path, start: int, end: int, insert_sql: str, headers: list,
+                col_types: dict, batch_size: int, bad_file: Path):
+    """chunk 1개 적재 (commit 안 함). 반환: (conn, loaded, rejected) — 실패 시 rollback 후 예외"""
+    conn = pool.acquire()
+    try:
+        cur = conn.cursor()
+        try:
+            _set_date_formats(cur, col_types)
+            raw = io.BufferedReader(_RangeReader(csv_path, start, end), buffer_size=_SCAN_READ)
+            with io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+                loaded, rejected = _insert_rows(
+                    cur, conn, insert_sql, _iter_rows(csv.reader(f)),
+                    _input_sizes(headers, col_types), batch_size, False, bad_file, headers,
+                )
+        finally:
+            cur.close()
+        return conn, loaded, rejected
+    except Exception:
+        try:
+            conn.rollback()
+        finally:
+            pool.release(conn)
+        raise
+
+
+def _merge_bad_files(parts: list, bad_file: Path):
+    """chunk별 .bad 파일을 하나로 합침 (헤더 1회)"""
+    parts = [p for p in parts if p.exists()]
+    if not parts:
+        return
+    with open(bad_file, "w", newline="", encoding="utf-8") as out:
+        for i, p in enumerate(parts):
+            with open(p, encoding="utf-8", newline="") as f:
+                header = f.readline()
+                if i == 0:
+                    out.write(header)
+                for line in f:
+                    out.write(line)
+            p.unlink()
+
+
+def _insert_chunked(pool, csv_path: Path, insert_sql: str, headers: list, col_types: dict,
+                    batch_size: int, workers: int, bad_file: Path = None, log_name: str = ""):
+    """
+    파일을 byte 범위 chunk로 나눠 pool 커넥션별로 병렬 INSERT.
+    모든 chunk가 성공해야 commit (하나라도 실패하면 전체 rollback).
+    commit 자체는 커넥션별로 순차 실행 → commit 도중 장애 시 일부만 반영될 수 있음.
+    반환: (적재 row 수, 거부 row 수)
+    """
+    ranges = _chunk_ranges(csv_path, workers)
+    logger.info("LOAD chunked | %s | chunks=%d", log_name, len(ranges))
+    bad_parts = [bad_file.with_name(f"{bad_file.name}.{i:03d}") for i in range(len(ranges))] if bad_file else []
+
+    results = []
+    errors = []
+    with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="chunk") as executor:
+        futures = [
+            executor.submit(_load_chunk, pool, csv_path, a, b, insert_sql, headers, col_types,
+                            batch_size, bad_parts[i] if bad_file else None)
+            for i, (a, b) in enumerate(ranges)
+        ]
+        for fut in futures:
+            try:
+                results.append(fut.result())
+            except Exception as e:
+                errors.append(e)
+
+    try:
+        if errors:
+            for conn, _, _ in results:
+                conn.rollback()
+            raise errors[0]
+        for conn, _, _ in results:
+            conn.commit()
+    finally:
+        for conn, _, _ in results:
+            pool.release(conn)
+        if bad_file:
+            _merge_bad_files(bad_parts, bad_file)
+
+    return sum(r[1] for r in results), sum(r[2] for r in results)
+
+
+def _get_partition_keys(cur, schema: str, table_name: str) -> list:
+    """
+    RANGE(INTERVAL 포함) / LIST 파티션 테이블의 파티션 키 컬럼 (column_position 순서).
+    파티션 테이블이 아니거나 HASH 등 값으로 파티션을 지정할 수 없으면 []
+    """
+    owner = ":1" if schema else "SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA')"
+    binds = (schema.upper(), table_name.upper()) if schema else (table_name.upper(),)
+    name = ":2" if schema else ":1"
+    cur.execute(f"SELECT partitioning_type FROM all_part_tables WHERE owner = {owner} AND table_name = {name}",
+                binds)
+    row = cur.fetchone()
+    if not row or row[0] not in ("RANGE", "LIST"):
+        return []
+    cur.execute(
+        f"SELECT column_name FROM all_part_key_columns"
+        f" WHERE owner = {owner} AND name = {name} AND object_type = 'TABLE' ORDER BY column_position",
+        binds,
+    )
+    return [r[0] for r in cur.fetchall()]
+
+
+def _partition_literal(value: str, col_type: tuple):
+    """PARTITION FOR (...) 용 리터럴 (DDL이라 bind 불가). 지원하지 않는 타입·값이면 None"""
+    data_type = (col_type or (None,))[0] or ""
+    if data_type in _NUMBER_TYPES:
+        try:
+            float(value)
+        except ValueError:
+            return None
+        return value
+    if data_type in _STRING_TYPES:
+        return "'" + value.replace("'", "''") + "'"
+    return None
+
+
+def _truncate_partition(cur, schema: str, table_name: str, matched: list, catalog: dict = None) -> bool:
+    """
+    load.partition_aware: 파라미터 컬럼이 파티션 키와 정확히 일치하면 DELETE 대신 TRUNCATE PARTITION.
+    (row 단위 undo/redo 없음, HWM 초기화 → 이후 direct path INSERT도 빈 세그먼트에 적재)
+    파티션에 다른 키 값의 row가 섞여 있으면(RANGE 범위가 넓은 경우 등) False → 기존 DELETE.
+    TRUNCATE는 DDL이라 즉시 commit된다. 반환: TRUNCATE 수행 여부
+    """
+    key = table_name.upper()
+    tbl = _qualified(schema, table_name)
+    part_keys = _cached(catalog, ("partkeys", key), lambda: _get_partition_keys(cur, schema, table_name))
+    values = dict(matched)
+    if not part_keys or set(part_keys) != set(values):
+        return False
+
+    col_types = _cached(catalog, ("types", key), lambda: _get_column_types(cur, schema, table_name))
+    literals = [_partition_literal(values[k], col_types.get(k)) for k in part_keys]
+    if any(lit is None for lit in literals):
+        logger.debug("TRUNCATE PARTITION skipped (unsupported key type): %s %s", tbl, part_keys)
+        return False
+    part_for = f"PARTITION FOR ({', '.join(literals)})"
+
+    try:
+        # 파티션에 대상 키 값 이외의 row가 있으면 TRUNCATE하면 안 됨 (DECODE: NULL-safe 비교)
+        others = " AND ".join(f'DECODE("{k}", {lit}, 1, 0) = 1' for k, lit in zip(part_keys, literals))
+        cur.execute(f"SELECT COUNT(*) FROM {tbl} {part_for} WHERE NOT ({others}) AND ROWNUM = 1")
+        if cur.fetchone()[0]:
+            logger.info("TRUNCATE PARTITION skipped (partition holds other key values) → DELETE | %s %s",
+                        tbl, part_for)
+            return False
+        cur.execute(f"ALTER TABLE {tbl} TRUNCATE {part_for} UPDATE INDEXES")
+    except Exception as e:
+        # 해당 값의 파티션이 아직 없음(ORA-14702 등) / 권한 부족 → 기존 DELETE
+        logger.info("TRUNCATE PARTITION not applicable → DELETE | %s %s | %s", tbl, part_for, e)
+        return False
+    logger.info("TRUNCATE %s | %s", tbl, part_for)
+    return True
+
+
+def _delete_by_params(cur, conn, schema: str, table_name: str, params: dict, catalog: dict = None,
+                      partition_aware: bool = False):
+    """
+    params 기반 WHERE 조건으로 DELETE 실행.
+    partition_aware: 조건 컬럼 = 파티션 키면 TRUNCATE PARTITION (_truncate_partition)
+    """
     tbl = _qualified(schema, table_name)
 
     if not params:
@@ -205,27 +641,17 @@ def _delete_by_params(cur, conn, schema: str, table_name: str, params: dict):
         return
 
     # Column matching with underscore-removal normalization (clsYymm -> CLS_YYMM)
-    table_cols = _get_table_columns(cur, schema, table_name)
-    norm_map = {col.replace("_", "").lower(): col for col in table_cols}
-
-    conditions = []
-    values = []
-    idx = 1
-    for key, val in params.items():
-        col_upper = key.upper()
-        if col_upper in table_cols:
-            matched_col = col_upper
-        else:
-            norm_key = key.replace("_", "").lower()
-            matched_col = norm_map.get(norm_key)
-            if matched_col:
-                logger.debug("DELETE param mapped: %s -> %s", key, matched_col)
-            else:
-                logger.warning("DELETE condition skipped (column not found): %s.%s", tbl, col_upper)
-                continue
-        conditions.append(f'"{matched_col}" = :{idx}')
-        values.append(val)
-        idx += 1
+    table_cols = _cached(catalog, ("columns", table_name.upper()),
+                         lambda: _get_table_columns(cur, schema, table_name))
+    matched, unmatched = match_param_columns(params, table_cols)
+    for key in unmatched:
+        logger.warning("DELETE condition skipped (column not found): %s.%s", tbl, key.upper())
+
+    if partition_aware and matched and _truncate_partition(cur, schema, table_name, matched, catalog):
+        return
+
+    conditions = [f'"{col}" = :{i}' for i, (col, _) in enumerate(matched, 1)]
+    values = [val for _, val in matched]
 
     if not conditions:
         raise ValueError(
@@ -239,15 +665,38 @@ def _delete_by_params(cur, conn, schema: str, table_name: str, params: dict):
                 tbl, cur.rowcount, " AND ".join(conditions) if conditions else "(all)")
 
 
+# direct path는 batch마다 commit → batch마다 high-water mark 위에 새 블록을 할당하므로 최소 batch 크기 보장
+DIRECT_PATH_MIN_BATCH = 50000
+
+
 def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
              file_hash: str, mode: str, schema: str = None,
-             load_mode: str = "delete", params: dict = None) -> int:
+             load_mode: str = "delete", params: dict = None,
+             batch_size: int = 1000, direct_path: bool = False, batch_errors: bool = False,
+             pool=None, chunk_workers: int = 1, chunk_min_bytes: int = 256 * 1024 * 1024,
+             columns: list = None, catalog: dict = None, csv_reader: str = "python",
+             merge_keys: list = None, partition_aware: bool = False) -> int:
     """
     CSV를 Oracle 테이블에 적재.
     schema 지정 시 해당 스키마에 테이블 생성/INSERT.
     테이블 없으면 CSV 헤더로 자동 생성.
     load_mode: delete(params 기반 DELETE+INSERT) | append(INSERT)
-    반환값: row 수 (-1이면 skip)
+               | merge(staging 테이블 적재 후 merge_keys 기준 MERGE, 값이 바뀐 row만 UPDATE)
+    batch_size: executemany 배치 크기
+    direct_path: INSERT /*+ APPEND_VALUES */ (batch마다 commit → 파일 단위 원자성 없음:
+                 중간 실패 시 앞 batch는 commit된 채 남고 _LOAD_HISTORY는 기록되지 않는다.
+                 batch 크기는 최소 DIRECT_PATH_MIN_BATCH. append 모드에서는 load_stage가 끔 —
+                 재실행 시 중복 적재. 트리거·FK가 있는 테이블은 Oracle이 conventional insert로 처리)
+    batch_errors: 오류 row만 거부하고 계속 적재, 거부 row는 {csv}.bad 에 기록
+                  (direct path와 함께 쓸 수 없음 → batch_errors 우선)
+    pool / chunk_workers / chunk_min_bytes: 비압축 CSV가 chunk_min_bytes 이상이면 byte 범위
+                  chunk로 나눠 pool 커넥션에서 병렬 INSERT (conventional). delete는 chunk 시작 전
+                  1회 실행·commit, _LOAD_HISTORY는 모든 chunk commit 후 기록.
+    columns: 소스 컬럼 메타(manifest) — 테이블 자동 생성 시 타입으로 사용
+    catalog: load_catalog() 결과 — 이력 일괄 조회 + 딕셔너리 조회 캐시 (load 동안 공유)
+    csv_reader: python | arrow (engine.csv_reader). chunk 적재는 byte 범위 단위라 항상 python
+    partition_aware: delete 조건 컬럼이 파티션 키와 같으면 DELETE 대신 TRUNCATE PARTITION
+    반환값: row 수 (merge는 MERGE된 row 수, -1이면 skip)
     """
     cur = conn.cursor()
     file_size = csv_path.stat().st_size
@@ -255,52 +704,96 @@ def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
     full_table = f"{schema.upper()}.{table_name.upper()}" if schema else table_name.upper()
 
     try:
-        _ensure_history(cur, conn, schema)
+        _cached(catalog, "history", lambda: _ensure_history(cur, conn, schema) or True)
+        loaded = (catalog or {}).get("loaded")
 
-        # append 모드에서만 히스토리 체크
-        if load_mode == "append":
-            if mode != "retry" and _history_exists(cur, schema, job_name, full_table, file_hash):
+        # append / merge 모드에서만 히스토리 체크
+        if load_mode in ("append", "merge") and mode != "retry":
+            if loaded is not None:
+                already = (full_table, file_hash) in loaded
+            else:
+                already = _history_exists(cur, schema, job_name, full_table, file_hash)
+            if already:
                 logger.info("LOAD skip (already loaded) | %s | %s", full_table, csv_path.name)
                 return -1
 
-        if not _table_exists(cur, schema, table_name):
+        key = table_name.upper()
+        if not _cached(catalog, ("exists", key), lambda: _table_exists(cur, schema, table_name)):
             logger.info("Table not found, creating: %s", _qualified(schema, table_name))
-            _create_table_from_csv(cur, conn, schema, table_name, csv_path)
+            _create_table_from_csv(cur, conn, schema, table_name, csv_path, columns)
+            _forget_table(catalog, table_name)
         else:
             logger.debug("Table exists: %s", _qualified(schema, table_name))
             # delete 모드: INSERT 전 기존 데이터 삭제
             if load_mode == "delete":
-                _delete_by_params(cur, conn, schema, table_name, params or {})
+                _delete_by_params(cur, conn, schema, table_name, params or {}, catalog, partition_aware)
+
+        if direct_path and batch_errors:
+            logger.warning("Oracle: direct_path is not supported with batch_errors (ORA-38910) "
+                           "→ conventional insert | %s", full_table)
+            direct_path = False
+
+        merge = load_mode == "merge"
+        if merge:
+            direct_path = False   # staging 적재 후 MERGE → 대상 테이블에는 direct path 미적용
+        chunked = (pool is not None and chunk_workers > 1 and not merge
+                   and not str(csv_path).endswith(".gz") and file_size >= chunk_min_bytes)
+        if chunked and direct_path:
+            # APPEND_VALUES는 테이블 exclusive lock → 병렬 세션이 서로 대기
+            logger.info("Oracle: chunked load uses conventional insert (direct_path ignored) | %s", full_table)
+            direct_path = False
+
+        if direct_path and batch_size < DIRECT_PATH_MIN_BATCH:
+            batch_size = DIRECT_PATH_MIN_BATCH
 
         start = time.time()
-        total_rows = 0
         tbl = _qualified(schema, table_name)
+        col_types = _cached(catalog, ("types", key), lambda: _get_column_types(cur, schema, table_name))
+        _set_date_formats(cur, col_types)
+        bad_file = csv_path.with_name(csv_path.name + ".bad") if batch_errors else None
+        if bad_file and bad_file.exists():
+            bad_file.unlink()
 
-        open_fn = gzip.open if str(csv_path).endswith(".gz") else open
-        with open_fn(csv_path, "rt", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            headers = next(reader)
+        with open_csv_rows(csv_path, "python" if chunked else csv_reader) as (headers, rows):
             col_list = ", ".join(f'"{h.upper()}"' for h in headers)
             placeholders = ", ".join([f":{j + 1}" for j in range(len(headers))])
-            insert_sql = f"INSERT INTO {tbl} ({col_list}) VALUES ({placeholders})"
-
-            batch = []
-            for row in reader:
-                batch.append([v if v.strip() != "" else None for v in row])
-                total_rows += 1
-                if len(batch) >= 1000:
-                    cur.executemany(insert_sql, batch)
-                    batch.clear()
-            if batch:
-                cur.executemany(insert_sql, batch)
+            hint = "/*+ APPEND_VALUES */ " if direct_path else ""
+            insert_into = _create_merge_stage(cur, schema, table_name, col_list) if merge else tbl
+            insert_sql = f"INSERT {hint}INTO {insert_into} ({col_list}) VALUES ({placeholders})"
+
+            if not chunked:
+                try:
+                    total_rows, rejected = _insert_rows(
+                        cur, conn, insert_sql, rows, _input_sizes(headers, col_types),
+                        batch_size, direct_path, bad_file, headers,
+                    )
+                    if merge:
+                        total_rows = _merge_from_stage(cur, tbl, insert_into, headers, merge_keys,
+                                                       col_types, full_table, total_rows)
+                finally:
+                    if merge:
+                        cur.execute(f"DROP TABLE {insert_into} PURGE")
+
+        if chunked:
+            conn.commit()   # delete 반영 (chunk 커넥션과 lock 대기 방지)
+            total_rows, rejected = _insert_chunked(
+                pool, csv_path, insert_sql, headers, col_types, batch_size,
+                chunk_workers, bad_file, full_table,
+            )
 
         conn.commit()
         _insert_history(cur, conn, schema, job_name, full_table, str(csv_path),
                         file_hash, file_size, mtime)
+        if loaded is not None:
+            loaded.add((full_table, file_hash))
 
         elapsed = time.time() - start
-        logger.info("LOAD done | table=%s rows=%d elapsed=%.2fs | mode=%s",
-                    full_table, total_rows, elapsed, load_mode)
+        if rejected:
+            logger.warning("LOAD rejected rows | table=%s rejected=%d | bad file=%s",
+                           full_table, rejected, bad_file)
+        logger.info("LOAD done | table=%s rows=%d elapsed=%.2fs | mode=%s%s",
+                    full_table, total_rows, elapsed, load_mode,
+                    " (direct path)" if direct_path else (" (chunked)" if chunked else ""))
         return total_rows
 
     finally:
@@ -308,23 +801,145 @@ def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
 
 
 # --------------------------------------------------
-# 연결 (target은 항상 thin 모드)
+# merge (staging 테이블 + MERGE)
 # --------------------------------------------------
 
-def connect(env_config: dict, schema: str = None, schema_password: str = None):
+_LOB_TYPES = ("CLOB", "NCLOB", "BLOB")
+
+
+def _create_merge_stage(cur, schema: str, table_name: str, col_list: str) -> str:
+    """대상 테이블과 같은 컬럼 타입의 빈 staging 테이블 생성 (이전 실행의 잔여 테이블은 삭제)"""
+    stage_name = f"{table_name.upper()[:26]}_MRG"
+    stage = _qualified(schema, stage_name)
+    if _table_exists(cur, schema, stage_name):
+        cur.execute(f"DROP TABLE {stage} PURGE")
+    cur.execute(f"CREATE TABLE {stage} NOLOGGING AS SELECT {col_list} FROM {_qualified(schema, table_name)} "
+                f"WHERE 1 = 0")
+    return stage
+
+
+def _merge_from_stage(cur, tbl: str, stage: str, headers: list, keys: list,
+                      col_types: dict, log_name: str, staged: int) -> int:
     """
-    target 연결은 항상 thin 모드 (Instant Client 불필요).
-    schema 지정 시 해당 스키마 유저가 없으면 자동 생성 (DBA 권한 필요).
+    MERGE INTO 대상 USING staging ON (키) — 키가 있고 값이 다른 row만 UPDATE, 없는 키는 INSERT.
+    값 비교는 NULL-safe (DECODE, LOB은 DBMS_LOB.COMPARE). 반환: MERGE된 row 수
     """
-    import oracledb
+    cols = [h.upper() for h in headers]
+    if not keys:
+        raise ValueError(f"load.mode=merge requires key columns for {log_name} "
+                         f"(--[table] keys=COL1,COL2 or load.merge_keys)")
+    keys = [k.upper() for k in keys]
+    missing = [k for k in keys if k not in cols]
+    if missing:
+        raise ValueError(f"merge key column(s) not in CSV header: {log_name} {missing}")
+    values = [c for c in cols if c not in keys]
+
+    def _differs(c):
+        if (col_types.get(c, (None,))[0] or "") in _LOB_TYPES:
+            return (f'((t."{c}" IS NULL AND s."{c}" IS NOT NULL) OR (t."{c}" IS NOT NULL AND s."{c}" IS NULL)'
+                    f' OR DBMS_LOB.COMPARE(t."{c}", s."{c}") <> 0)')
+        return f'DECODE(t."{c}", s."{c}", 0, 1) = 1'
+
+    on = " AND ".join(f't."{k}" = s."{k}"' for k in keys)
+    sql = f"MERGE INTO {tbl} t USING {stage} s ON ({on})"
+    if values:
+        sets = ", ".join(f't."{c}" = s."{c}"' for c in values)
+        where = " OR ".join(_differs(c) for c in values)
+        sql += f" WHEN MATCHED THEN UPDATE SET {sets} WHERE {where}"
+    sql += (f" WHEN NOT MATCHED THEN INSERT ({', '.join(f'{chr(34)}{c}{chr(34)}' for c in cols)})"
+            f" VALUES ({', '.join(f's.{chr(34)}{c}{chr(34)}' for c in cols)})")
+    cur.execute(sql)
+    merged = cur.rowcount
+    logger.info("LOAD merge | table=%s staged=%d merged=%d (unchanged=%d)",
+                log_name, staged, merged, max(staged - merged, 0))
+    return merged
+
+
+# --------------------------------------------------
+# 적재 후 인덱스·통계 (load.post_load)
+# --------------------------------------------------
+
+def post_load(conn, table_name: str, indexes: list, analyze: bool, schema: str = None,
+              degree: int = 1) -> dict:
+    """
+    적재 완료 후 인덱스 생성 + DBMS_STATS.GATHER_TABLE_STATS.
+    indexes: [{"name", "columns", "unique"}, ...]
+      degree > 1이면 PARALLEL degree로 생성 후 NOPARALLEL로 되돌린다 (이후 쿼리가 병렬 실행되지 않도록)
+      같은 이름(ORA-00955) / 같은 컬럼 목록(ORA-01408) 인덱스가 이미 있으면 건너뜀
+    analyze: GATHER_TABLE_STATS(degree, cascade=TRUE → 인덱스 통계 포함)
+    반환: {"indexes": 생성 수, "analyze": bool}
+    """
+    tbl = _qualified(schema, table_name)
+    cur = conn.cursor()
+    created = 0
+    try:
+        for idx in indexes:
+            name = _qualified(schema, idx["name"].upper())
+            col_list = ", ".join(f'"{c.upper()}"' for c in idx["columns"])
+            unique = "UNIQUE " if idx.get("unique") else ""
+            parallel = f" PARALLEL {degree}" if degree > 1 else ""
+            try:
+                cur.execute(f"CREATE {unique}INDEX {name} ON {tbl} ({col_list}){parallel}")
+            except Exception as e:
+                if "ORA-00955" in str(e) or "ORA-01408" in str(e):
+                    logger.debug("POST_LOAD index exists, skipped: %s (%s)", name, str(e).split(":")[0])
+                    continue
+                raise
+            if degree > 1:
+                cur.execute(f"ALTER INDEX {name} NOPARALLEL")
+            created += 1
+        if analyze:
+            cur.execute(
+                "BEGIN DBMS_STATS.GATHER_TABLE_STATS("
+                "ownname => NVL(:1, SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA')), tabname => :2, "
+                "degree => :3, cascade => TRUE); END;",
+                (schema.upper() if schema else None, table_name.upper(), degree),
+            )
+    finally:
+        cur.close()
+    return {"indexes": created, "analyze": bool(analyze)}
+
 
+# --------------------------------------------------
+# 연결 (target은 항상 thin 모드)
+# --------------------------------------------------
+
+def _local_host_cfg(env_config: dict) -> dict:
     oracle_cfg = env_config.get("sources", {}).get("oracle", {})
     if not oracle_cfg:
         raise RuntimeError("oracle config not found in env_config['sources']['oracle']")
-
     host_cfg = oracle_cfg.get("hosts", {}).get("local")
     if not host_cfg:
         raise RuntimeError("Oracle target requires hosts.local in env.yml")
+    return host_cfg
+
+
+def create_pool(env_config: dict, max_size: int):
+    """병렬 적재용 커넥션 pool (thin). 스키마 생성은 connect()에서 이미 처리된 것으로 본다."""
+    import oracledb
+
+    host_cfg = _local_host_cfg(env_config)
+    pool = oracledb.create_pool(
+        user=host_cfg["user"],
+        password=host_cfg["password"],
+        dsn=host_cfg["dsn"],
+        min=1,
+        max=max_size,
+        increment=1,
+        expire_time=10,
+    )
+    logger.info("Oracle target pool created | dsn=%s | max=%d", host_cfg["dsn"], max_size)
+    return pool
+
+
+def connect(env_config: dict, schema: str = None, schema_password: str = None):
+    """
+    target 연결은 항상 thin 모드 (Instant Client 불필요).
+    schema 지정 시 해당 스키마 유저가 없으면 자동 생성 (DBA 권한 필요).
+    """
+    import oracledb
+
+    host_cfg = _local_host_cfg(env_config)
 
     # target은 항상 thin 모드로 직접 연결
     conn = oracledb.connect(
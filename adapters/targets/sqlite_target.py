@@ -1,13 +1,16 @@
 # file: v2/adapters/targets/sqlite_target.py
 
-import csv
-import gzip
 import time
 import logging
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
+from engine.column_types import column_kind, columns_by_name, read_csv_header, scan_csv_types
 from engine.connection import now_str
+from engine.csv_reader import open_csv_rows
+from engine.sql_utils import extract_params_from_csv, match_param_columns
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +25,48 @@ def _ensure_history(conn):
             file_hash     TEXT,
             file_size     INTEGER,
             mtime         TEXT,
-            loaded_at     TEXT
+            loaded_at     TEXT,
+            run_id        TEXT
         )
         """
     )
+    # 이전 버전 히스토리 테이블 마이그레이션
+    cols = [r[1] for r in conn.execute("PRAGMA table_info(_LOAD_HISTORY)").fetchall()]
+    if "run_id" not in cols:
+        conn.execute("ALTER TABLE _LOAD_HISTORY ADD COLUMN run_id TEXT")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS IX_LOAD_HISTORY ON _LOAD_HISTORY (job_name, table_name, file_hash)"
+    )
     conn.commit()
 
 
+def load_catalog(conn, job_name: str, prefetch: bool = True) -> dict:
+    """
+    load 1회 동안 재사용하는 조회 캐시.
+      loaded: {(table_name, file_hash)} — job의 적재 이력을 쿼리 1회로 조회 (append skip 판단용)
+              prefetch=False면 None → 파일마다 _history_exists 조회
+    """
+    loaded = None
+    if prefetch:
+        loaded = set(conn.execute(
+            "SELECT table_name, file_hash FROM _LOAD_HISTORY WHERE job_name = ?", (job_name,)
+        ).fetchall())
+    return {"loaded": loaded}
+
+
+def _already_loaded(conn, job_name: str, table_name: str, file_hash: str, catalog: dict = None) -> bool:
+    loaded = (catalog or {}).get("loaded")
+    if loaded is not None:
+        return (table_name, file_hash) in loaded
+    return _history_exists(conn, job_name, table_name, file_hash)
+
+
+def _mark_loaded(catalog: dict, table_name: str, file_hash: str):
+    loaded = (catalog or {}).get("loaded")
+    if loaded is not None:
+        loaded.add((table_name, file_hash))
+
+
 def _history_exists(conn, job_name: str, table_name: str, file_hash: str) -> bool:
     cur = conn.cursor()
     cur.execute(
@@ -45,17 +83,39 @@ def _history_exists(conn, job_name: str, table_name: str, file_hash: str) -> boo
 
 
 def _insert_history(conn, job_name: str, table_name: str, csv_file: str,
-                    file_hash: str, file_size: int, mtime: str):
+                    file_hash: str, file_size: int, mtime: str, commit: bool = True,
+                    run_id: str = None):
     cur = conn.cursor()
     cur.execute(
         """
         INSERT INTO _LOAD_HISTORY
-            (job_name, table_name, csv_file, file_hash, file_size, mtime, loaded_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
+            (job_name, table_name, csv_file, file_hash, file_size, mtime, loaded_at, run_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """,
-        (job_name, table_name, csv_file, file_hash, file_size, mtime, now_str()),
+        (job_name, table_name, csv_file, file_hash, file_size, mtime, now_str(), run_id),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
+
+
+def is_unchanged(conn, job_name: str, table_name: str, file_hashes: list) -> bool:
+    """
+    테이블이 존재하고, 마지막 적재(run_id 기준)에 사용된 파일 해시 목록이 file_hashes와 같으면 True.
+    load.skip_unchanged (replace/truncate)에서 DROP·재적재 생략 판단에 사용.
+    """
+    if not _table_exists(conn, table_name):
+        return False
+    rows = conn.execute(
+        """
+        SELECT file_hash FROM _LOAD_HISTORY
+         WHERE job_name = ? AND table_name = ?
+           AND run_id = (SELECT run_id FROM _LOAD_HISTORY
+                          WHERE job_name = ? AND table_name = ? AND run_id IS NOT NULL
+                          ORDER BY loaded_at DESC LIMIT 1)
+        """,
+        (job_name, table_name, job_name, table_name),
+    ).fetchall()
+    return bool(rows) and sorted(r[0] for r in rows) == sorted(file_hashes)
 
 
 def _table_exists(conn, table_name: str) -> bool:
@@ -67,130 +127,466 @@ def _table_exists(conn, table_name: str) -> bool:
     return cur.fetchone() is not None
 
 
-def _infer_sqlite_type(values: list) -> str:
-    """샘플 값으로 SQLite 컬럼 타입 추론"""
-    non_empty = [v for v in values if v.strip() != ""]
-    if not non_empty:
-        return "TEXT"
-
-    try:
-        [int(v) for v in non_empty]
+def _infer_sqlite_type(kind: str) -> str:
+    """scan_csv_types() 추론 결과 → SQLite 컬럼 타입"""
+    if kind == "int":
         return "INTEGER"
-    except ValueError:
-        pass
-
-    try:
-        [float(v) for v in non_empty]
+    if kind == "float":
         return "REAL"
-    except ValueError:
-        pass
-
     return "TEXT"
 
 
-def _create_table_from_csv(conn, table_name: str, csv_path: Path):
-    """CSV 헤더 + 샘플 100행으로 SQLite 테이블 자동 생성"""
-    open_fn = gzip.open if str(csv_path).endswith(".gz") else open
-
-    with open_fn(csv_path, "rt", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        headers = next(reader)
-
-        samples = [[] for _ in headers]
-        for i, row in enumerate(reader):
-            if i >= 100:
-                break
-            for j, val in enumerate(row):
-                if j < len(samples):
-                    samples[j].append(val)
+def _sqlite_type_from_meta(col: dict):
+    """소스 컬럼 메타 → SQLite 컬럼 타입 (모르는 타입이면 None → CSV 추론)"""
+    kind = column_kind(col)[0]
+    if kind == "int":
+        return "INTEGER"
+    if kind == "float":
+        return "REAL"
+    if kind == "decimal":
+        return "NUMERIC"   # 정수 값은 INTEGER, 소수 값은 REAL로 저장
+    if kind in ("string", "clob", "date", "timestamp"):
+        return "TEXT"
+    return None
 
-    col_defs = []
-    for col, vals in zip(headers, samples):
-        sqlite_type = _infer_sqlite_type(vals)
-        col_defs.append(f'  "{col}" {sqlite_type}')
 
+def _create_table_from_csv(conn, table_name: str, csv_path: Path, commit: bool = True,
+                           columns: list = None):
+    """
+    CSV 헤더 기준으로 SQLite 테이블 자동 생성.
+    columns(manifest 소스 메타)가 있으면 소스 타입 사용, 없는 컬럼만 CSV 전체 스캔으로 추론.
+    """
+    headers = read_csv_header(csv_path)
+    meta = columns_by_name(columns)
+
+    col_types = {}
+    for col in headers:
+        if col.upper() in meta:
+            col_types[col] = _sqlite_type_from_meta(meta[col.upper()])
+    missing = [col for col in headers if not col_types.get(col)]
+    if missing:
+        logger.debug("CREATE TABLE %s | inferring %d column(s) from CSV", table_name, len(missing))
+        scanned = scan_csv_types(csv_path, set(missing))
+        for col in missing:
+            col_types[col] = _infer_sqlite_type(scanned.get(col, (None, 0))[0])
+
+    col_defs = [f'  "{col}" {col_types[col]}' for col in headers]
     ddl = f'CREATE TABLE "{table_name}" (\n' + ",\n".join(col_defs) + "\n)"
 
-    logger.info("CREATE TABLE %s", table_name)
+    logger.info("CREATE TABLE %s%s", table_name, " (source types)" if len(missing) < len(headers) else "")
     logger.debug("DDL:\n%s", ddl)
 
     conn.execute(ddl)
+    if commit:
+        conn.commit()
+
+
+# ────────────────────────────────────────
+# bulk mode (target.bulk_mode: true)
+# ────────────────────────────────────────
+
+_BULK_PRAGMAS = ("journal_mode", "synchronous", "cache_size", "temp_store")
+
+
+@contextmanager
+def bulk_session(conn, cache_size_mb: int = 256):
+    """
+    load 동안만 쓰기 위주 PRAGMA 적용, 종료 시 원래 값으로 복구.
+      journal_mode=MEMORY / synchronous=OFF / cache_size / temp_store=MEMORY
+    적재 도중 프로세스가 죽으면 DB 파일이 손상될 수 있음 → 재생성 가능한 로컬 DB에만 사용.
+    """
     conn.commit()
+    saved = {p: conn.execute(f"PRAGMA {p}").fetchone()[0] for p in _BULK_PRAGMAS}
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute(f"PRAGMA cache_size=-{int(cache_size_mb) * 1024}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    logger.info("SQLite bulk mode on | journal_mode=MEMORY synchronous=OFF cache=%dMB", cache_size_mb)
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        for p in _BULK_PRAGMAS:
+            conn.execute(f"PRAGMA {p}={saved[p]}")
+        logger.debug("SQLite bulk mode off | restored %s", saved)
+
+
+def _drop_indexes(conn, table_name: str) -> list:
+    """테이블의 사용자 인덱스 DDL을 보관하고 DROP (적재 후 _create_indexes로 재생성)"""
+    rows = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type='index' AND tbl_name=? AND sql IS NOT NULL",
+        (table_name,),
+    ).fetchall()
+    for name, _ in rows:
+        conn.execute(f'DROP INDEX "{name}"')
+    if rows:
+        logger.info("LOAD deferred indexes | table=%s | %s", table_name, ", ".join(r[0] for r in rows))
+    return [r[1] for r in rows]
+
+
+def _create_indexes(conn, ddls: list):
+    for ddl in ddls:
+        conn.execute(ddl)
 
 
 def load_csv(conn, job_name: str, table_name: str, csv_path: Path,
              file_hash: str, mode: str,
-             load_mode: str = "replace") -> int:
+             load_mode: str = "replace", bulk: bool = False, batch_size: int = None,
+             columns: list = None, run_id: str = None, catalog: dict = None,
+             csv_reader: str = "python", merge_keys: list = None, params: dict = None) -> int:
     """
     CSV를 SQLite 테이블에 적재. (pandas 미사용 → numexpr 로그 없음)
     테이블이 없으면 CSV 헤더 기반으로 자동 생성.
     load_mode: replace(DROP+CREATE) | truncate(DELETE+INSERT) | append(INSERT)
-    반환값: 적재된 row 수 (-1이면 skip)
+               | delete(params 기반 DELETE+INSERT) | merge(merge_keys 기준 upsert, 값이 바뀐 row만 UPDATE)
+    bulk: True면 파일 1개 = 트랜잭션 1개 (DROP/DELETE·CREATE·INSERT·히스토리 포함),
+          기존 인덱스는 적재 후 재생성. PRAGMA는 호출 측에서 bulk_session으로 감싼다.
+    columns: 소스 컬럼 메타(manifest) — 테이블 자동 생성 시 타입으로 사용
+    catalog: load_catalog() 결과 (이력 일괄 조회)
+    csv_reader: python | arrow (engine.csv_reader)
+    반환값: 적재된 row 수 (merge는 INSERT·UPDATE된 row 수, -1이면 skip)
     """
     file_size = csv_path.stat().st_size
     mtime = datetime.fromtimestamp(csv_path.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
 
     # replace/truncate 시 히스토리 체크 스킵
-    if load_mode == "append":
-        if mode != "retry" and _history_exists(conn, job_name, table_name, file_hash):
+    if load_mode in ("append", "merge"):
+        if mode != "retry" and _already_loaded(conn, job_name, table_name, file_hash, catalog):
             logger.info("LOAD skip (already loaded) | %s | %s", table_name, csv_path.name)
             return -1
 
+    if bulk:
+        try:
+            conn.execute("BEGIN")
+            total_rows, elapsed = _load_csv_body(conn, table_name, csv_path, load_mode,
+                                                 bulk=True, batch_size=batch_size or 50000,
+                                                 columns=columns, csv_reader=csv_reader,
+                                                 merge_keys=merge_keys, params=params)
+            _insert_history(conn, job_name, table_name, str(csv_path), file_hash, file_size, mtime,
+                            commit=False, run_id=run_id)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    else:
+        total_rows, elapsed = _load_csv_body(conn, table_name, csv_path, load_mode,
+                                             bulk=False, batch_size=batch_size or 1000,
+                                             columns=columns, csv_reader=csv_reader,
+                                             merge_keys=merge_keys, params=params)
+        _insert_history(conn, job_name, table_name, str(csv_path), file_hash, file_size, mtime,
+                        run_id=run_id)
+
+    _mark_loaded(catalog, table_name, file_hash)
+    logger.info("LOAD done | table=%s rows=%d elapsed=%.2fs | mode=%s%s",
+                table_name, total_rows, elapsed, load_mode, " (bulk)" if bulk else "")
+
+    return total_rows
+
+
+def _load_csv_body(conn, table_name: str, csv_path: Path, load_mode: str,
+                   bulk: bool, batch_size: int, columns: list = None, csv_reader: str = "python",
+                   merge_keys: list = None, params: dict = None):
+    """DROP/DELETE → CREATE → INSERT. bulk=True면 commit하지 않음 (호출 측 트랜잭션). 반환: (rows, elapsed)"""
+    commit = not bulk
+
     if load_mode == "replace" and _table_exists(conn, table_name):
         logger.info("LOAD mode=replace → DROP TABLE %s", table_name)
         conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
-        conn.commit()
+        if commit:
+            conn.commit()
 
     if load_mode == "truncate" and _table_exists(conn, table_name):
         logger.info("LOAD mode=truncate → DELETE FROM %s", table_name)
         conn.execute(f'DELETE FROM "{table_name}"')
-        conn.commit()
+        if commit:
+            conn.commit()
+
+    if load_mode == "delete" and _table_exists(conn, table_name):
+        _delete_by_params(conn, table_name, params or {})
+        if commit:
+            conn.commit()
 
     # 테이블 없으면 자동 생성
+    index_ddls = []
     if not _table_exists(conn, table_name):
         logger.info("Table not found, creating: %s", table_name)
-        _create_table_from_csv(conn, table_name, csv_path)
+        _create_table_from_csv(conn, table_name, csv_path, commit=commit, columns=columns)
     else:
         logger.debug("Table exists: %s", table_name)
+        if bulk and load_mode != "merge":   # merge는 기존 인덱스로 키 조회
+            index_ddls = _drop_indexes(conn, table_name)
 
     start = time.time()
-    total_rows = 0
+    if load_mode == "merge":
+        total_rows = _merge_csv(conn, table_name, csv_path, merge_keys, batch_size, csv_reader)
+        if commit:
+            conn.commit()
+        return total_rows, time.time() - start
 
-    open_fn = gzip.open if str(csv_path).endswith(".gz") else open
-    with open_fn(csv_path, "rt", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        headers = next(reader)
+    total_rows = 0
 
+    with open_csv_rows(csv_path, csv_reader) as (headers, rows):
         col_list = ", ".join(f'"{h}"' for h in headers)
         placeholders = ", ".join(["?" for _ in headers])
         insert_sql = f'INSERT INTO "{table_name}" ({col_list}) VALUES ({placeholders})'
 
-        batch = []
-        batch_size = 1000
         cur = conn.cursor()
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            cur.executemany(insert_sql, batch)
+            total_rows += len(batch)
 
-        for row in reader:
-            # 빈 문자열 → None (SQLite NULL)
-            batch.append([v if v.strip() != "" else None for v in row])
-            total_rows += 1
-            if len(batch) >= batch_size:
-                cur.executemany(insert_sql, batch)
-                batch.clear()
+    if index_ddls:
+        _create_indexes(conn, index_ddls)
+    if commit:
+        conn.commit()
 
-        if batch:
-            cur.executemany(insert_sql, batch)
+    return total_rows, time.time() - start
 
-    conn.commit()
 
-    _insert_history(conn, job_name, table_name, str(csv_path), file_hash, file_size, mtime)
+def _delete_by_params(conn, table_name: str, params: dict):
+    """params(CSV 파일명) 기반 WHERE 조건으로 DELETE (commit은 호출 측). params가 없으면 전체 DELETE"""
+    if not params:
+        cur = conn.execute(f'DELETE FROM "{table_name}"')
+        logger.info("DELETE %s | %d rows (no params, full delete)", table_name, cur.rowcount)
+        return
 
-    elapsed = time.time() - start
-    logger.info("LOAD done | table=%s rows=%d elapsed=%.2fs | mode=%s",
-                table_name, total_rows, elapsed, load_mode)
+    table_cols = [r[1] for r in conn.execute(f'PRAGMA table_info("{table_name}")').fetchall()]
+    matched, unmatched = match_param_columns(params, table_cols)
+    for key in unmatched:
+        logger.warning("DELETE condition skipped (column not found): %s.%s", table_name, key)
+    if not matched:
+        raise ValueError(
+            f"DELETE 조건 컬럼 매칭 실패: {table_name} — 파라미터 키가 테이블 컬럼과 일치하지 않습니다. "
+            f"params={list(params.keys())}"
+        )
 
-    return total_rows
+    where = " AND ".join(f'"{col}" = ?' for col, _ in matched)
+    cur = conn.execute(f'DELETE FROM "{table_name}" WHERE {where}', [val for _, val in matched])
+    logger.info("DELETE %s | %d rows | WHERE %s", table_name, cur.rowcount, where)
+
+
+def _merge_csv(conn, table_name: str, csv_path: Path, keys: list, batch_size: int,
+               csv_reader: str = "python") -> int:
+    """
+    merge: CSV → TEMP staging 테이블 → 키가 있으면 UPDATE ... FROM, 없으면 INSERT ... WHERE NOT EXISTS.
+    키가 같고 값도 같은 row는 UPDATE하지 않는다 (값 컬럼 중 하나라도 다른 row만).
+    ON CONFLICT 대신 UPDATE ... FROM을 써서 사용자 테이블에 UNIQUE 인덱스를 만들지 않는다
+    (append로 쌓인 키 중복이 있어도 동작 — 같은 키의 row는 모두 UPDATE).
+    반환: INSERT·UPDATE된 row 수
+    """
+    with open_csv_rows(csv_path, csv_reader) as (headers, rows):
+        keys = _match_columns(table_name, keys, headers)
+        col_list = ", ".join(f'"{h}"' for h in headers)
+        key_list = ", ".join(f'"{k}"' for k in keys)
+
+        # 이전 버전이 만든 merge용 UNIQUE 인덱스 제거
+        conn.execute(f'DROP INDEX IF EXISTS main."UX_{table_name}_MERGE"')
+        conn.execute('DROP TABLE IF EXISTS temp."__merge_stage"')
+        conn.execute(f'CREATE TEMP TABLE "__merge_stage" AS SELECT {col_list} FROM main."{table_name}" WHERE 0')
+
+        cur = conn.cursor()
+        insert_sql = f'INSERT INTO temp."__merge_stage" ({col_list}) VALUES ({", ".join("?" for _ in headers)})'
+        staged = 0
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            cur.executemany(insert_sql, batch)
+            staged += len(batch)
+
+    conn.execute(f'CREATE INDEX temp."__merge_stage_keys" ON "__merge_stage" ({key_list})')
+    on = " AND ".join(f'main."{table_name}"."{k}" IS c."{k}"' for k in keys)
+    values = [h for h in headers if h not in keys]
+    updated = 0
+    if values:
+        sets = ", ".join(f'"{c}" = c."{c}"' for c in values)
+        changed = " OR ".join(f'main."{table_name}"."{c}" IS NOT c."{c}"' for c in values)
+        updated = conn.execute(
+            f'UPDATE main."{table_name}" SET {sets} FROM temp."__merge_stage" AS c WHERE {on} AND ({changed})'
+        ).rowcount
+    inserted = conn.execute(
+        f'INSERT INTO main."{table_name}" ({col_list}) SELECT {col_list} FROM temp."__merge_stage" AS c '
+        f'WHERE NOT EXISTS (SELECT 1 FROM main."{table_name}" WHERE {on})'
+    ).rowcount
+    conn.execute('DROP TABLE temp."__merge_stage"')
+    logger.info("LOAD merge | table=%s staged=%d inserted=%d updated=%d", table_name, staged, inserted, updated)
+    return inserted + updated
+
+
+def _match_columns(table_name: str, keys: list, headers: list) -> list:
+    """merge 키 → CSV 헤더 컬럼명 (대소문자 무시). 키가 없거나 헤더에 없으면 ValueError"""
+    if not keys:
+        raise ValueError(f"load.mode=merge requires key columns for {table_name} "
+                         f"(--[{table_name}] keys=COL1,COL2 or load.merge_keys)")
+    by_upper = {h.upper(): h for h in headers}
+    missing = [k for k in keys if k.upper() not in by_upper]
+    if missing:
+        raise ValueError(f"merge key column(s) not in CSV header: {table_name} {missing}")
+    return [by_upper[k.upper()] for k in keys]
+
+
+def post_load(conn, table_name: str, indexes: list, analyze: bool) -> dict:
+    """
+    적재 완료 후 인덱스 생성 + ANALYZE (load.post_load). 테이블당 1 트랜잭션.
+    indexes: [{"name", "columns", "unique"}, ...]
+      같은 이름 인덱스가 이미 있으면 건너뜀 (정의가 다르면 경고 — 자동으로 다시 만들지 않음)
+    반환: {"indexes": 실제 생성 수, "analyze": bool}
+    """
+    created = 0
+    try:
+        for idx in indexes:
+            existing = _index_definition(conn, idx["name"])
+            if existing:
+                _warn_index_mismatch(idx, existing, table_name)
+                continue
+            col_list = ", ".join(f'"{c}"' for c in idx["columns"])
+            unique = "UNIQUE " if idx.get("unique") else ""
+            conn.execute(f'CREATE {unique}INDEX "{idx["name"]}" ON "{table_name}" ({col_list})')
+            created += 1
+        if analyze:
+            conn.execute(f'ANALYZE "{table_name}"')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return {"indexes": created, "analyze": bool(analyze)}
+
+
+def _index_definition(conn, index_name: str):
+    """sqlite_master + pragma index_info/index_list → (테이블명, [컬럼], unique) / 없으면 None"""
+    row = conn.execute(
+        "SELECT tbl_name FROM sqlite_master WHERE type = 'index' AND name = ? COLLATE NOCASE",
+        (index_name,),
+    ).fetchone()
+    if not row:
+        return None
+    table = row[0]
+    columns = [r[2] for r in conn.execute("SELECT seqno, cid, name FROM pragma_index_info(?) ORDER BY seqno",
+                                          (index_name,))]
+    unique = any(r[0].upper() == index_name.upper() and r[1]
+                 for r in conn.execute('SELECT name, "unique" FROM pragma_index_list(?)', (table,)))
+    return table, columns, unique
+
+
+def _warn_index_mismatch(idx: dict, existing, table_name: str):
+    """설정과 기존 인덱스(테이블·컬럼·unique) 비교 — 다르면 경고"""
+    ex_table, ex_columns, ex_unique = existing
+    wanted = (table_name.upper(), [c.upper() for c in idx["columns"]], bool(idx.get("unique")))
+    if (ex_table.upper(), [str(c).upper() for c in ex_columns], ex_unique) != wanted:
+        logger.warning("POST_LOAD index %s exists with a different definition "
+                       "(existing: %s(%s)%s, configured: %s(%s)%s) → kept, drop it to rebuild",
+                       idx["name"], ex_table, ",".join(map(str, ex_columns)), " unique" if ex_unique else "",
+                       table_name, ",".join(idx["columns"]), " unique" if idx.get("unique") else "")
+    else:
+        logger.debug("POST_LOAD index exists, skipped: %s", idx["name"])
 
 
 def connect(db_path: Path):
     import sqlite3
-    return sqlite3.connect(str(db_path))
\ No newline at end of file
+    return sqlite3.connect(str(db_path))
+
+# ────────────────────────────────────────
+# shard 병렬 적재 (load.parallel_workers + load.sqlite_shards)
+# ────────────────────────────────────────
+
+def load_shard(shard_path: str, job_name: str, groups: list,
+               bulk: bool = False, batch_size: int = None, run_id: str = None,
+               csv_reader: str = "python") -> dict:
+    """
+    별도 프로세스에서 실행: 임시 shard DB에 테이블 그룹들을 적재한다.
+    groups: [(table_name, [(csv_path, file_hash, columns), ...]), ...] — 테이블 내 파일 순서 유지
+    shard는 항상 새로 만들고 테이블별 첫 파일 replace, 이후 append. (본 DB 반영은 merge_shard)
+    반환: {table_name: [row 수 또는 오류 문자열, ...]}
+    """
+    shard = Path(shard_path)
+    if shard.exists():
+        shard.unlink()
+    conn = connect(shard)
+    out = {}
+    try:
+        _ensure_history(conn)
+        with bulk_session(conn) if bulk else nullcontext():
+            for table_name, files in groups:
+                results = []
+                for j, (csv_path, file_hash, columns) in enumerate(files):
+                    try:
+                        results.append(load_csv(conn, job_name, table_name, Path(csv_path), file_hash,
+                                                "retry", load_mode="replace" if j == 0 else "append",
+                                                bulk=bulk, batch_size=batch_size, columns=columns,
+                                                run_id=run_id, csv_reader=csv_reader))
+                    except Exception as e:
+                        results.append(f"{type(e).__name__}: {e}")
+                out[table_name] = results
+    finally:
+        conn.close()
+    return out
+
+
+def merge_shard(conn, shard_path: Path, tables: list, load_mode: str, bulk: bool = False):
+    """
+    shard DB의 테이블을 본 DB로 병합 (ATTACH). 테이블별 1 트랜잭션.
+    load_mode: replace(DROP 후 shard DDL로 생성) | truncate(DELETE) | append
+               | delete(shard에 적재된 CSV 파일명 params 기준 DELETE)
+    _LOAD_HISTORY도 shard에서 옮긴다. 병합 후 shard 파일 삭제.
+    반환: {table_name: 병합 row 수 또는 Exception}
+    """
+    out = {}
+    conn.commit()
+    conn.execute("ATTACH DATABASE ? AS shard", (str(shard_path),))
+    try:
+        for table_name in tables:
+            row = conn.execute(
+                "SELECT sql FROM shard.sqlite_master WHERE type='table' AND name=?", (table_name,)
+            ).fetchone()
+            if not row:
+                continue
+            cols = [r[1] for r in conn.execute(f'PRAGMA shard.table_info("{table_name}")').fetchall()]
+            col_list = ", ".join(f'"{c}"' for c in cols)
+
+            start = time.time()
+            conn.execute("BEGIN")
+            try:
+                exists = _table_exists(conn, table_name)
+                if exists and load_mode == "replace":
+                    conn.execute(f'DROP TABLE main."{table_name}"')
+                    exists = False
+                elif exists and load_mode == "truncate":
+                    conn.execute(f'DELETE FROM main."{table_name}"')
+                elif exists and load_mode == "delete":
+                    for (csv_file,) in conn.execute(
+                        "SELECT csv_file FROM shard._LOAD_HISTORY WHERE table_name = ?", (table_name,)
+                    ).fetchall():
+                        _delete_by_params(conn, table_name, extract_params_from_csv(Path(csv_file)))
+                if not exists:
+                    conn.execute(row[0])   # CREATE TABLE "T" (...) → main
+                index_ddls = _drop_indexes(conn, table_name) if exists and bulk else []
+                cur = conn.execute(
+                    f'INSERT INTO main."{table_name}" ({col_list}) SELECT {col_list} FROM shard."{table_name}"'
+                )
+                rows = cur.rowcount
+                _create_indexes(conn, index_ddls)
+                hist_cols = "job_name, table_name, csv_file, file_hash, file_size, mtime, loaded_at, run_id"
+                conn.execute(
+                    f"INSERT INTO main._LOAD_HISTORY ({hist_cols}) "
+                    f"SELECT {hist_cols} FROM shard._LOAD_HISTORY WHERE table_name = ?",
+                    (table_name,),
+                )
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                out[table_name] = e
+                continue
+            out[table_name] = rows
+            logger.info("LOAD merge | table=%s rows=%d elapsed=%.2fs | mode=%s",
+                        table_name, rows, time.time() - start, load_mode)
+    finally:
+        conn.execute("DETACH DATABASE shard")
+        try:
+            Path(shard_path).unlink()
+        except OSError:
+            pass
+    return out
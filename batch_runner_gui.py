@@ -1136,7 +1136,7 @@ class BatchRunnerGUI(tk.Tk):
                  bg=C["mantle"], fg=C["subtext"], width=14, anchor="w").pack(side="left")
         self._load_mode_combo = ttk.Combobox(
             self._load_mode_row, textvariable=self._ov_load_mode,
-            values=["replace", "truncate", "append"],
+            values=["replace", "truncate", "append", "delete", "merge"],
             state="readonly", font=FONTS["mono"], width=14)
         self._load_mode_combo.pack(side="left", fill="x", expand=True)
 
@@ -1972,12 +1972,15 @@ class BatchRunnerGUI(tk.Tk):
             return
         tgt = self._target_type_var.get()
         if tgt == "oracle":
-            self._load_mode_combo["values"] = ["delete", "append"]
-            if self._ov_load_mode.get() not in ("delete", "append"):
+            self._load_mode_combo["values"] = ["delete", "append", "merge"]
+            if self._ov_load_mode.get() not in ("delete", "append", "merge"):
                 self._ov_load_mode.set("delete")
         else:
-            self._load_mode_combo["values"] = ["replace", "truncate", "append"]
-            if self._ov_load_mode.get() not in ("replace", "truncate", "append"):
+            modes = ["replace", "truncate", "append", "delete", "merge"]
+            if tgt == "duckdb":
+                modes.append("view")
+            self._load_mode_combo["values"] = modes
+            if self._ov_load_mode.get() not in modes:
                 self._ov_load_mode.set("replace")
 
     def _update_target_visibility(self):
@@ -0,0 +1,291 @@
+"""
+ELT Runner — export 오프라인 벤치마크
+운영 Oracle 없이 simulated source(adapters/sources/simulated_client.py)로
+export_stage.run → export_sql_to_csv 실제 경로를 그대로 측정한다.
+
+사용법:
+  python bench_export.py
+  python bench_export.py --rows 500000 --type-mix int:4,float:2,str:3,date:1 \
+      --fetch-size 5000,10000,50000 --workers 1,4 --compression none,gzip \
+      --latency-ms 2 --repeat 3
+  python bench_export.py --baseline data/bench/export_<commit>_<ts>.json   # 이전 결과와 비교
+
+결과:  data/bench/export_{commit}_{ts}.json  (콘솔에는 요약 표)
+
+측정 항목 (sweep 조합별, repeat 중앙값):
+  rows_per_s / mb_per_s / elapsed_s / cpu_s / cpu_util / peak_rss_mb
+
+커밋 간 비교가 가능하도록 각 조합은 별도 프로세스에서 실행하고(peak RSS 분리),
+데이터는 seed 고정, 결과 JSON에 commit / python / platform / 설정을 함께 기록한다.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from itertools import product
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+SUPPORTED_FORMATS = ("csv",)       # export_stage가 현재 지원하는 format
+SUPPORTED_COMPRESSION = ("none", "gzip")
+
+
+# ────────────────────────────────────────
+# 측정 유틸
+# ────────────────────────────────────────
+
+def _peak_rss_mb():
+    """현재 프로세스 peak RSS (MB). 측정 불가 시 None."""
+    try:
+        import psutil
+        mi = psutil.Process().memory_info()
+        peak = getattr(mi, "peak_wset", None)  # Windows
+        if peak:
+            return peak / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux: KB, macOS: bytes
+        return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+    except ImportError:
+        return None
+
+
+def _git_commit() -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=BASE_DIR,
+            capture_output=True, text=True,
+        ).stdout.strip()
+        return commit + ("-dirty" if dirty else "")
+    except Exception:
+        return "unknown"
+
+
+def _split(v: str, cast=str) -> list:
+    return [cast(x.strip()) for x in str(v).split(",") if x.strip()]
+
+
+def _case_key(case: dict) -> str:
+    return (f"fmt={case['format']} comp={case['compression']} "
+            f"fetch={case['fetch_size']} workers={case['parallel_workers']}")
+
+
+# ────────────────────────────────────────
+# 단일 조합 실행 (자식 프로세스)
+# ────────────────────────────────────────
+
+def run_case(case: dict) -> dict:
+    sys.path.insert(0, str(BASE_DIR))
+    from engine.context import RunContext
+    from stages import export_stage
+
+    logger = logging.getLogger("bench")
+    logging.basicConfig(level=logging.DEBUG if case.get("verbose") else logging.WARNING,
+                        format="%(levelname)s | %(message)s")
+
+    with tempfile.TemporaryDirectory(prefix="elt_bench_") as tmp:
+        work_dir = Path(tmp)
+        sql_dir = work_dir / "sql"
+        sql_dir.mkdir()
+        for i in range(1, case["tables"] + 1):
+            (sql_dir / f"{i:02d}_bench.sql").write_text(
+                f"SELECT * FROM BENCH_{i:02d}", encoding="utf-8")
+
+        job_config = {
+            "job_name": "bench",
+            "source": {"type": "simulated", "host": "bench"},
+            "export": {
+                "sql_dir": "sql",
+                "out_dir": "out",
+                "format": case["format"],
+                "compression": case["compression"],
+                "overwrite": True,
+                "parallel_workers": case["parallel_workers"],
+                "fetch_size": case["fetch_size"],
+            },
+        }
+        env_config = {
+            "sources": {
+                "simulated": {
+                    "hosts": {
+                        "bench": {
+                            "rows": case["rows"],
+                            "type_mix": case["type_mix"],
+                            "str_len": case["str_len"],
+                            "latency_ms": case["latency_ms"],
+                            "seed": case["seed"],
+                        }
+                    }
+                }
+            }
+        }
+        ctx = RunContext(
+            job_name="bench", run_id="bench_01", job_config=job_config,
+            env_config=env_config, params={}, work_dir=work_dir, mode="run",
+            logger=logger,
+        )
+
+        run_dir = work_dir / "out" / "bench" / ctx.run_id
+        run_dir.mkdir(parents=True)
+        run_info_path = run_dir / "run_info.json"
+        run_info_path.write_text(json.dumps({"run_id": ctx.run_id, "tasks": {}}), encoding="utf-8")
+
+        cpu0 = time.process_time()
+        t0 = time.perf_counter()
+        export_stage.run(ctx)
+        elapsed = time.perf_counter() - t0
+        cpu = time.process_time() - cpu0
+
+        tasks = json.loads(run_info_path.read_text(encoding="utf-8")).get("tasks", {})
+        failed = [k for k, v in tasks.items() if v.get("status") != "success"]
+        rows = sum(v.get("rows", 0) for v in tasks.values())
+        out_bytes = sum(p.stat().st_size for p in (work_dir / "out" / "bench").glob("*.csv*"))
+
+    mb = out_bytes / (1024 * 1024)
+    return {
+        "rows": rows,
+        "bytes": out_bytes,
+        "elapsed_s": round(elapsed, 4),
+        "cpu_s": round(cpu, 4),
+        "cpu_util": round(cpu / elapsed, 3) if elapsed else None,
+        "rows_per_s": round(rows / elapsed, 1) if elapsed else None,
+        "mb_per_s": round(mb / elapsed, 3) if elapsed else None,
+        "peak_rss_mb": round(_peak_rss_mb() or 0, 1) or None,
+        "failed_tasks": len(failed),
+    }
+
+
+def _spawn_case(case: dict) -> dict:
+    proc = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--_case", json.dumps(case)],
+        cwd=BASE_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"bench case failed ({_case_key(case)}):\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+# ────────────────────────────────────────
+# sweep + 요약
+# ────────────────────────────────────────
+
+_METRICS = ("rows_per_s", "mb_per_s", "elapsed_s", "cpu_s", "cpu_util", "peak_rss_mb")
+
+
+def _median_result(samples: list) -> dict:
+    out = dict(samples[0])
+    for m in _METRICS:
+        vals = [s[m] for s in samples if s.get(m) is not None]
+        out[m] = round(statistics.median(vals), 4) if vals else None
+    out["failed_tasks"] = max(s["failed_tasks"] for s in samples)
+    return out
+
+
+def _case_id(case: dict) -> str:
+    """baseline 매칭용 — 데이터/sweep 설정이 모두 같아야 비교"""
+    return json.dumps({k: v for k, v in case.items() if k != "verbose"}, sort_keys=True)
+
+
+def _load_baseline(path: str) -> dict:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {_case_id(r["case"]): r["result"] for r in data.get("results", [])}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="export offline benchmark (simulated source)")
+    ap.add_argument("--rows", type=int, default=200_000, help="SQL 1개당 row 수 (default 200000)")
+    ap.add_argument("--tables", type=int, default=4, help="SQL(task) 수 (default 4)")
+    ap.add_argument("--type-mix", default="int:4,float:2,str:3,date:1", help="컬럼 구성 type:개수")
+    ap.add_argument("--str-len", type=int, default=12)
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="fetchmany 1회당 지연(ms)")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--fetch-size", default="10000", help="sweep: 콤마 구분")
+    ap.add_argument("--workers", default="1,4", help="sweep: parallel_workers 콤마 구분")
+    ap.add_argument("--compression", default="none,gzip", help="sweep: none,gzip")
+    ap.add_argument("--format", default="csv", help="sweep: " + ",".join(SUPPORTED_FORMATS))
+    ap.add_argument("--repeat", type=int, default=1, help="조합별 반복 횟수 (중앙값 사용)")
+    ap.add_argument("--out", default=None, help="결과 JSON 경로 (default data/bench/...)")
+    ap.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    ap.add_argument("--verbose", action="store_true", help="export 로그 출력")
+    ap.add_argument("--_case", default=None, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args._case:
+        print(json.dumps(run_case(json.loads(args._case))))
+        return
+
+    formats = _split(args.format)
+    compressions = _split(args.compression)
+    for f in formats:
+        if f not in SUPPORTED_FORMATS:
+            ap.error(f"unsupported --format: {f} ({', '.join(SUPPORTED_FORMATS)})")
+    for c in compressions:
+        if c not in SUPPORTED_COMPRESSION:
+            ap.error(f"unsupported --compression: {c} ({', '.join(SUPPORTED_COMPRESSION)})")
+
+    base_case = {
+        "rows": args.rows, "tables": args.tables, "type_mix": args.type_mix,
+        "str_len": args.str_len, "latency_ms": args.latency_ms, "seed": args.seed,
+        "verbose": args.verbose,
+    }
+    cases = [
+        dict(base_case, format=fmt, compression=comp, fetch_size=fs, parallel_workers=w)
+        for fmt, comp, fs, w in product(formats, compressions,
+                                        _split(args.fetch_size, int), _split(args.workers, int))
+    ]
+
+    baseline = _load_baseline(args.baseline) if args.baseline else {}
+    commit = _git_commit()
+
+    print(f"commit={commit} cases={len(cases)} repeat={args.repeat} "
+          f"rows/task={args.rows:,} tasks={args.tables}")
+    print(f"{'case':<48} {'rows/s':>12} {'MB/s':>9} {'cpu':>7} {'rss MB':>8} {'vs base':>8}")
+
+    results = []
+    for case in cases:
+        res = _median_result([_spawn_case(case) for _ in range(args.repeat)])
+        key = _case_key(case)
+        delta = ""
+        base = baseline.get(_case_id(case))
+        if base and base.get("rows_per_s") and res.get("rows_per_s"):
+            delta = f"{(res['rows_per_s'] / base['rows_per_s'] - 1) * 100:+.1f}%"
+        print(f"{key:<48} {res['rows_per_s'] or 0:>12,.0f} {res['mb_per_s'] or 0:>9.2f} "
+              f"{res['cpu_util'] or 0:>7.2f} {res['peak_rss_mb'] or 0:>8.1f} {delta:>8}")
+        if res["failed_tasks"]:
+            print(f"  ! failed tasks: {res['failed_tasks']}")
+        results.append({"case": {k: v for k, v in case.items() if k != "verbose"}, "result": res})
+
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    out_path = Path(args.out) if args.out else BASE_DIR / "data" / "bench" / f"export_{commit}_{ts}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "bench": "export",
+        "commit": commit,
+        "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    out_path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\n결과: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
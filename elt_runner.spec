@@ -18,11 +18,13 @@ hiddenimports = [
     "yaml", "openpyxl", "openpyxl.styles", "openpyxl.utils", "openpyxl.writer.excel",
     "tkinter", "tkinter.ttk", "tkinter.filedialog", "tkinter.messagebox", "tkinter.scrolledtext",
     "engine", "engine.sql_utils", "engine.context", "engine.path_utils",
-    "engine.runtime_state", "engine.stage_registry",
+    "engine.runtime_state", "engine.stage_registry", "engine.hash_utils", "engine.manifest",
+    "engine.column_types", "engine.csv_reader", "engine.sql_deps", "engine.profiling", "engine.resources",
     "stages", "stages.export_stage", "stages.load_stage",
     "stages.transform_stage", "stages.report_stage",
     "adapters",
     "adapters.sources.oracle_source", "adapters.sources.vertica_source",
+    "adapters.sources.simulated_client",
     "adapters.targets.oracle_target", "adapters.targets.sqlite_target",
     "adapters.targets.duckdb_target",
 ]
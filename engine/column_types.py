@@ -0,0 +1,140 @@
+# file: engine/column_types.py
+"""
+타겟 테이블 자동 생성(CREATE TABLE)용 컬럼 타입 정보.
+
+1) 소스 메타데이터: export 시 cursor.description → manifest "columns"
+   (oracledb DbType 이름 / vertica type OID 문자열) → column_kind()로 공통 분류
+2) 메타데이터가 없는 CSV(수동 배치 파일 등): scan_csv_types()로 파일 전체를 스트리밍 추론
+   (기존 100행 샘플링은 뒤쪽 row의 긴 문자열·소수값을 놓쳐 적재 실패 / 잘못된 타입이 됨)
+
+분류(kind): int / decimal / float / string / date / timestamp / clob / None(알 수 없음 → 추론)
+"""
+
+import csv
+import gzip
+from pathlib import Path
+
+_ORACLE_KINDS = {
+    "DB_TYPE_NUMBER": "decimal",
+    "DB_TYPE_BINARY_INTEGER": "int",
+    "DB_TYPE_BINARY_FLOAT": "float",
+    "DB_TYPE_BINARY_DOUBLE": "float",
+    "DB_TYPE_VARCHAR": "string",
+    "DB_TYPE_NVARCHAR": "string",
+    "DB_TYPE_CHAR": "string",
+    "DB_TYPE_NCHAR": "string",
+    "DB_TYPE_LONG": "clob",
+    "DB_TYPE_CLOB": "clob",
+    "DB_TYPE_NCLOB": "clob",
+    "DB_TYPE_DATE": "date",
+    "DB_TYPE_TIMESTAMP": "timestamp",
+    "DB_TYPE_TIMESTAMP_TZ": "timestamp",
+    "DB_TYPE_TIMESTAMP_LTZ": "timestamp",
+}
+
+# vertica_python type_code (OID)
+_VERTICA_KINDS = {
+    "6": "int",
+    "7": "float",
+    "16": "decimal",
+    "8": "string",
+    "9": "string",
+    "115": "clob",
+    "10": "date",
+    "12": "timestamp",
+    "13": "timestamp",
+}
+
+
+def column_kind(col: dict):
+    """
+    manifest 컬럼 메타 → (kind, size, precision, scale). 모르는 타입이면 kind=None.
+    Oracle NUMBER(p,0) / Vertica NUMERIC(p,0) 은 int로 분류한다.
+    """
+    type_name = str(col.get("type") or "")
+    kind = _ORACLE_KINDS.get(type_name) or _VERTICA_KINDS.get(type_name)
+    size = col.get("size")
+    precision = col.get("precision")
+    scale = col.get("scale")
+    if kind == "decimal" and precision and scale == 0:
+        kind = "int"
+    return kind, size, precision, scale
+
+
+def columns_by_name(columns: list) -> dict:
+    """{컬럼명(UPPER): 컬럼 메타}"""
+    return {str(c.get("name", "")).upper(): c for c in columns or []}
+
+
+def _open_csv(csv_path: Path):
+    open_fn = gzip.open if str(csv_path).endswith(".gz") else open
+    return open_fn(csv_path, "rt", encoding="utf-8", newline="")
+
+
+def read_csv_header(csv_path: Path) -> list:
+    with _open_csv(csv_path) as f:
+        return next(csv.reader(f), [])
+
+
+def scan_csv_types(csv_path: Path, columns: list = None) -> dict:
+    """
+    CSV 전체를 한 번 읽어 컬럼별 타입 추론 (메모리는 컬럼 수만큼만 사용).
+    columns: 추론할 헤더 목록 (None이면 전체)
+    반환: {헤더: (kind, max_len)} — kind: int / float / string / None(값 없음)
+
+    앞자리 0으로 시작하는 정수("007")는 코드값으로 보고 string 처리 (숫자 변환 시 0 손실).
+    """
+    with _open_csv(csv_path) as f:
+        reader = csv.reader(f)
+        headers = next(reader, [])
+        wanted = [j for j, h in enumerate(headers) if columns is None or h in columns]
+        kinds = {j: None for j in wanted}
+        max_len = {j: 0 for j in wanted}
+        undecided = set(wanted)   # 아직 string으로 확정되지 않은 컬럼
+
+        for row in reader:
+            for j in wanted:
+                if j >= len(row):
+                    continue
+                v = row[j]
+                n = len(v)
+                if n > max_len[j]:
+                    max_len[j] = n
+                if j not in undecided or not v or v.isspace():
+                    continue
+                kinds[j] = _widen(kinds[j], v)
+                if kinds[j] == "string":
+                    undecided.discard(j)
+
+    return {headers[j]: (kinds[j], max_len[j]) for j in wanted}
+
+
+def infer_kinds(rows, ncols: int) -> list:
+    """
+    샘플 row 목록 → 컬럼별 kind 목록 (int / float / string / None) — scan_csv_types와 같은 규칙.
+    report Excel 스트리밍 시 앞부분 샘플로 숫자 컬럼을 판단하는 데 쓴다.
+    """
+    kinds = [None] * ncols
+    for row in rows:
+        for j, v in enumerate(row[:ncols]):
+            if kinds[j] == "string" or not v or v.isspace():
+                continue
+            kinds[j] = _widen(kinds[j], v)
+    return kinds
+
+
+def _widen(kind, v: str):
+    """현재 kind에 값 v를 수용할 수 있는 가장 좁은 kind (int → float → string)"""
+    v = v.strip()
+    if kind in (None, "int"):
+        digits = v[1:] if v[:1] in "+-" else v
+        if digits.isdigit():
+            if len(digits) > 1 and digits[0] == "0":
+                return "string"
+            return "int" if len(digits) <= 18 else "float"
+        kind = "float" if kind == "int" else None
+    try:
+        float(v)
+    except ValueError:
+        return "string"
+    return "float"
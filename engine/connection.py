@@ -4,11 +4,22 @@ Target DB 연결 팩토리 및 공통 유틸.
 
 connect_target(ctx, target_cfg) → (conn, conn_type, label)
   - DuckDB / SQLite3 / Oracle 분기를 한 곳에서 처리
+
+acquire_target / release_target — run 단위 공유 연결 (ctx.connections: ConnectionManager)
+  load → transform → report 가 같은 target 연결 1개를 재사용하고 run 종료 시 닫는다
+  (DuckDB buffer cache 유지, Oracle 재접속 비용 제거).
+  target.shared_connection: false → stage마다 새 연결 (기존 동작)
+  병렬 worker용 추가 연결은 connect_target()으로 따로 연다.
 """
 
+import logging
+import threading
 from datetime import datetime
 
 from engine.path_utils import resolve_path
+from engine.resources import apply_duckdb_settings
+
+logger = logging.getLogger(__name__)
 
 
 def now_str() -> str:
@@ -33,7 +44,9 @@ def connect_target(ctx, target_cfg: dict) -> tuple:
         db_path = resolve_path(ctx, target_cfg.get("db_path", "data/local/result.duckdb"))
         db_path.parent.mkdir(parents=True, exist_ok=True)
         label = f"duckdb ({db_path.resolve()})"
-        return connect(db_path), "duckdb", label
+        conn = connect(db_path)
+        apply_duckdb_settings(ctx, conn)
+        return conn, "duckdb", label
 
     elif tgt_type == "sqlite3":
         from adapters.targets.sqlite_target import connect
@@ -51,3 +64,150 @@ def connect_target(ctx, target_cfg: dict) -> tuple:
 
     else:
         raise ValueError(f"Unsupported target type: {tgt_type}")
+
+
+def _target_key(ctx, target_cfg: dict) -> tuple:
+    """같은 DB를 가리키는 target 설정이면 같은 key"""
+    tgt_type = (target_cfg.get("type") or "").strip().lower()
+    if tgt_type in ("duckdb", "sqlite3"):
+        default = "data/local/result.duckdb" if tgt_type == "duckdb" else "data/local/result.sqlite"
+        return tgt_type, str(resolve_path(ctx, target_cfg.get("db_path", default)).resolve())
+    return tgt_type, (target_cfg.get("schema") or "").strip().upper()
+
+
+def _is_alive(conn, conn_type: str) -> bool:
+    try:
+        if conn_type == "oracle":
+            conn.ping()
+        else:
+            conn.execute("SELECT 1").fetchall()
+        return True
+    except Exception:
+        return False
+
+
+_NLS_PARAMS = ("NLS_DATE_FORMAT", "NLS_TIMESTAMP_FORMAT")
+
+
+def _session_nls(conn) -> dict:
+    """Oracle 세션의 NLS 날짜 형식 (연결 직후 값 → stage 종료 시 복원용)"""
+    cur = conn.cursor()
+    try:
+        cur.execute("SELECT parameter, value FROM nls_session_parameters"
+                    " WHERE parameter IN ('NLS_DATE_FORMAT', 'NLS_TIMESTAMP_FORMAT')")
+        return {p: v for p, v in cur.fetchall()}
+    finally:
+        cur.close()
+
+
+def _reset_session(conn, conn_type: str, nls: dict = None) -> bool:
+    """
+    stage 종료 시 공유 연결 정리 — close()와 같이 미완료 트랜잭션은 rollback, DuckDB 기본 스키마 복구,
+    Oracle은 load(_set_date_formats)가 바꾼 NLS 날짜 형식을 연결 직후 값으로 복원
+    (다음 stage가 새 연결과 같은 세션 상태에서 시작 — transform DAG worker 연결과도 동일).
+    반환: False면 복원 실패 → 호출 측에서 연결을 닫는다
+    """
+    try:
+        conn.rollback()
+    except Exception:
+        pass   # DuckDB: 활성 트랜잭션 없음
+    if conn_type == "duckdb":
+        try:
+            conn.execute("RESET schema")
+        except Exception:
+            pass
+    elif conn_type == "oracle" and nls:
+        try:
+            cur = conn.cursor()
+            try:
+                for param in _NLS_PARAMS:
+                    if param in nls:
+                        value = str(nls[param]).replace("'", "''")
+                        cur.execute(f"ALTER SESSION SET {param} = '{value}'")
+            finally:
+                cur.close()
+        except Exception as e:
+            logger.warning("shared connection session reset failed, closing: %s", e)
+            return False
+    return True
+
+
+class ConnectionManager:
+    """
+    run 단위 target 연결 보관 (thread-safe).
+    Oracle NLS 날짜 형식은 release 시 연결 직후 값으로 되돌린다 (_reset_session).
+    """
+
+    def __init__(self, ctx):
+        self._ctx = ctx
+        self._lock = threading.Lock()
+        self._conns = {}   # key → (conn, conn_type, label)
+        self._nls = {}     # key → 연결 직후 Oracle NLS 날짜 형식
+
+    def acquire(self, target_cfg: dict) -> tuple:
+        key = _target_key(self._ctx, target_cfg)
+        with self._lock:
+            entry = self._conns.get(key)
+            if entry is not None and not _is_alive(entry[0], entry[1]):
+                logger.warning("shared connection lost, reconnecting: %s", entry[2])
+                self._close(entry)
+                entry = None
+            if entry is None:
+                entry = connect_target(self._ctx, target_cfg)
+                self._conns[key] = entry
+                if entry[1] == "oracle":
+                    try:
+                        self._nls[key] = _session_nls(entry[0])
+                    except Exception as e:
+                        logger.warning("Oracle NLS settings unavailable, not sharing connection: %s", e)
+                        del self._conns[key]
+            elif entry[1] == "duckdb":
+                apply_duckdb_settings(self._ctx, entry[0])   # stage가 바뀌었으므로 예산 재적용
+                logger.debug("shared connection reused: %s", entry[2])
+            return entry
+
+    def owns(self, conn) -> bool:
+        with self._lock:
+            return any(c is conn for c, _, _ in self._conns.values())
+
+    def release(self, conn):
+        with self._lock:
+            for key, (c, conn_type, label) in list(self._conns.items()):
+                if c is conn:
+                    if _reset_session(c, conn_type, self._nls.get(key)):
+                        return
+                    del self._conns[key]
+                    self._nls.pop(key, None)
+                    break
+        conn.close()
+
+    @staticmethod
+    def _close(entry):
+        try:
+            entry[0].close()
+        except Exception as e:
+            logger.warning("connection close failed (%s): %s", entry[2], e)
+
+    def close_all(self):
+        with self._lock:
+            entries, self._conns = list(self._conns.values()), {}
+            self._nls = {}
+        for entry in entries:
+            self._close(entry)
+
+
+def acquire_target(ctx, target_cfg: dict) -> tuple:
+    """connect_target()과 같은 반환값. 공유 가능하면 run 단위 연결을 재사용한다."""
+    manager = getattr(ctx, "connections", None)
+    if manager is None or not target_cfg.get("shared_connection", True):
+        return connect_target(ctx, target_cfg)
+    return manager.acquire(target_cfg)
+
+
+def release_target(ctx, conn):
+    """stage 종료 — 공유 연결이면 세션만 정리하고 열어 둠, 아니면 close"""
+    manager = getattr(ctx, "connections", None)
+    if manager is not None and manager.owns(conn):
+        manager.release(conn)
+    else:
+        conn.close()
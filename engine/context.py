@@ -17,3 +17,6 @@ class RunContext:
     logger: logging.Logger = field(repr=False)
     include_patterns: list = field(default_factory=list)  # --include 패턴 목록
     stage_filter: list = field(default_factory=list)      # --stage 필터 목록
+    stage: str = ""                                       # 실행 중인 stage 이름
+    resources: object = field(default=None, repr=False)  # ResourceBudget (job.yml resources:)
+    connections: object = field(default=None, repr=False)  # ConnectionManager (run 단위 target 연결)
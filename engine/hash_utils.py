@@ -0,0 +1,211 @@
+# file: engine/hash_utils.py
+"""
+CSV 파일 해시 유틸 (load 히스토리용).
+
+load.hash 알고리즘:
+  sha256   — 기본값, 기존 _LOAD_HISTORY 값과 호환
+  xxh3     — xxhash 패키지 (비암호화, 가장 빠름)
+  blake3   — blake3 패키지
+  blake2b  — 표준 라이브러리 (추가 설치 불필요)
+sha256 이외는 "xxh3:..." 처럼 알고리즘 접두사를 붙여 기록한다
+→ 알고리즘을 바꿔도 이전 해시와 우연히 일치하지 않음 (append 모드는 전체 재적재됨에 주의).
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import logging
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+HASH_ALGOS = ("sha256", "xxh3", "blake3", "blake2b")
+DEFAULT_HASH_ALGO = "sha256"
+
+_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def resolve_hash_algo(algo: str) -> str:
+    """설정값 검증. 패키지가 없으면 blake2b(표준 라이브러리)로 대체."""
+    algo = (algo or DEFAULT_HASH_ALGO).strip().lower()
+    if algo not in HASH_ALGOS:
+        logger.warning("Unknown hash algorithm=%s, using %s", algo, DEFAULT_HASH_ALGO)
+        return DEFAULT_HASH_ALGO
+    try:
+        new_hasher(algo)
+    except ImportError as e:
+        logger.warning("hash=%s unavailable (%s) → falling back to blake2b", algo, e)
+        return "blake2b"
+    return algo
+
+
+def new_hasher(algo: str):
+    if algo == "sha256":
+        return hashlib.sha256()
+    if algo == "blake2b":
+        return hashlib.blake2b(digest_size=16)
+    if algo == "xxh3":
+        import xxhash
+        return xxhash.xxh3_128()
+    if algo == "blake3":
+        import blake3
+        return blake3.blake3()
+    raise ValueError(f"Unsupported hash algorithm: {algo}")
+
+
+def hexdigest(algo: str, hasher) -> str:
+    """_LOAD_HISTORY에 기록할 문자열. Oracle file_hash VARCHAR2(64)에 들어가는 길이로 맞춤."""
+    if algo == "sha256":
+        return hasher.hexdigest()
+    if algo == "blake3":
+        return f"{algo}:{hasher.hexdigest(length=16)}"
+    return f"{algo}:{hasher.hexdigest()}"
+
+
+def hash_file(path: Path, algo: str = DEFAULT_HASH_ALGO) -> str:
+    """mmap으로 파일 전체 해시 (read 버퍼 복사 없음, 큰 chunk는 GIL 해제)."""
+    h = new_hasher(algo)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    for off in range(0, size, _CHUNK_SIZE):
+                        h.update(view[off:off + _CHUNK_SIZE])
+                finally:
+                    view.release()
+    return hexdigest(algo, h)
+
+
+class HashingWriter(io.RawIOBase):
+    """
+    파일에 쓰는 바이트를 그대로 해시 (export 시 디스크 재읽기 없이 해시 계산).
+    gzip은 GzipFile(fileobj=BufferedWriter(HashingWriter)) 로 감싸 압축된 바이트를 해시
+    → load 시 hash_file() 결과와 동일.
+    """
+
+    def __init__(self, raw, algo: str = None):
+        self._raw = raw
+        self.algo = algo
+        self._hasher = new_hasher(algo) if algo else None
+        self.bytes_written = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        n = self._raw.write(b)
+        if n is None:
+            return None
+        if self._hasher is not None:
+            self._hasher.update(memoryview(b)[:n])
+        self.bytes_written += n
+        return n
+
+    def flush(self):
+        self._raw.flush()
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            super().close()   # flush 포함
+        finally:
+            self._raw.close()
+
+    def hexdigest(self):
+        return hexdigest(self.algo, self._hasher) if self._hasher is not None else None
+
+
+@contextmanager
+def open_hashed_text(path: Path, compression: str = "none", algo: str = None):
+    """
+    CSV 쓰기용 텍스트 스트림 (utf-8, newline="").
+    yield (text_file, HashingWriter) — 블록 종료 후 hw.hexdigest() / hw.bytes_written 사용
+    """
+    hw = HashingWriter(open(path, "wb"), algo)
+    buf = io.BufferedWriter(hw, buffer_size=1024 * 1024)
+    gz = gzip.GzipFile(fileobj=buf, mode="wb") if compression == "gzip" else None
+    text = io.TextIOWrapper(gz or buf, encoding="utf-8", newline="")
+    try:
+        yield text, hw
+    finally:
+        text.close()   # gzip trailer 기록
+        buf.close()    # flush → HashingWriter → 파일 close
+
+
+class HashCache:
+    """
+    (path, size, mtime_ns) → hash 영구 캐시 (JSON 파일, thread-safe).
+    크기나 mtime이 바뀐 파일은 캐시 miss → 다시 해시한다.
+    """
+
+    def __init__(self, cache_path: Path):
+        self.path = Path(cache_path)
+        self._lock = threading.Lock()
+        self._data = {}
+        self._dirty = False
+        if self.path.exists():
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except Exception as e:
+                logger.warning("hash cache unreadable, ignoring (%s): %s", self.path, e)
+
+    @staticmethod
+    def _key(path: Path, algo: str) -> str:
+        return f"{algo}|{Path(path).resolve()}"
+
+    def get(self, path: Path, algo: str, st: os.stat_result = None):
+        st = st or os.stat(path)
+        with self._lock:
+            entry = self._data.get(self._key(path, algo))
+        if entry and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+            return entry.get("hash")
+        return None
+
+    def put(self, path: Path, algo: str, digest: str, st: os.stat_result = None):
+        st = st or os.stat(path)
+        with self._lock:
+            self._data[self._key(path, algo)] = {
+                "size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": digest,
+            }
+            self._dirty = True
+
+    def prune(self):
+        """더 이상 존재하지 않는 파일 항목 제거 (캐시 파일 무한 증가 방지)"""
+        with self._lock:
+            for k in [k for k in self._data if not os.path.exists(k.split("|", 1)[1])]:
+                del self._data[k]
+                self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            try:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, ensure_ascii=False)
+                tmp.replace(self.path)
+                self._dirty = False
+            except Exception as e:
+                logger.warning("hash cache save failed (%s): %s", self.path, e)
+
+
+def cached_hash_file(path: Path, algo: str, cache: HashCache = None) -> str:
+    """캐시 hit 시 파일을 읽지 않는다."""
+    if cache is None:
+        return hash_file(path, algo)
+    st = os.stat(path)
+    digest = cache.get(path, algo, st)
+    if digest is None:
+        digest = hash_file(path, algo)
+        cache.put(path, algo, digest, st)
+    return digest
@@ -0,0 +1,133 @@
+# file: engine/manifest.py
+"""
+Export manifest (run 단위).
+
+export stage가 CSV를 쓰면서 수집한 정보를 {out_dir}/{job}/{run_id}/manifest.json 에 원자적으로 기록한다.
+  {
+    "job_name": "...", "run_id": "...", "created_at": "...",
+    "files": [
+      {"file": "01_contract__local__clsYymm_202303.csv", "sql_file": "01_contract.sql",
+       "table": "TB_CONTRACT", "params": {"clsYymm": "202303"},
+       "rows": 1234, "bytes": 5678, "mtime_ns": ...,
+       "hash_algo": "sha256", "hash": "...",
+       "columns": [{"name": "...", "type": "DB_TYPE_NUMBER", "size": null,
+                    "precision": 10, "scale": 0, "nullable": true}, ...]},
+      ...
+    ]
+  }
+
+load / report stage는 manifest 항목의 bytes·mtime_ns가 실제 파일과 일치할 때만 신뢰한다
+(수동으로 교체·수정된 파일은 기존 방식대로 다시 읽음).
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+
+def _run_number(d: Path) -> int:
+    try:
+        return int(d.name.rsplit("_", 1)[-1])
+    except (ValueError, IndexError):
+        return -1
+
+
+def describe_columns(description) -> list:
+    """DB-API cursor.description → 컬럼 메타 목록 (oracledb DbType / vertica type OID 모두 문자열화)"""
+    cols = []
+    for d in description or []:
+        d = tuple(d)
+        type_code = d[1] if len(d) > 1 else None
+        cols.append({
+            "name": d[0],
+            "type": getattr(type_code, "name", None) or (str(type_code) if type_code is not None else None),
+            "size": d[3] if len(d) > 3 else None,
+            "precision": d[4] if len(d) > 4 else None,
+            "scale": d[5] if len(d) > 5 else None,
+            "nullable": bool(d[6]) if len(d) > 6 and d[6] is not None else True,
+        })
+    return cols
+
+
+def file_entry(path: Path, **fields) -> dict:
+    """파일 stat(bytes, mtime_ns)을 포함한 manifest 항목 생성"""
+    st = os.stat(path)
+    entry = {"file": Path(path).name}
+    entry.update(fields)
+    entry["bytes"] = st.st_size
+    entry["mtime_ns"] = st.st_mtime_ns
+    return entry
+
+
+def is_valid(entry: dict, csv_path: Path) -> bool:
+    """manifest 기록 이후 파일이 바뀌지 않았는지 (bytes·mtime_ns 비교)"""
+    try:
+        st = os.stat(csv_path)
+    except OSError:
+        return False
+    return entry.get("bytes") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns
+
+
+def write_manifest(path: Path, job_name: str, run_id: str, entries: list):
+    """tmp 파일에 쓴 뒤 rename → 읽는 쪽이 반쯤 쓰인 manifest를 보지 않음"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "job_name": job_name,
+        "run_id": run_id,
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "files": sorted(entries, key=lambda e: e["file"]),
+    }
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    tmp.replace(path)
+
+
+def read_manifest(path: Path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data.get("files"), list):
+            return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("manifest unreadable, ignoring (%s): %s", path, e)
+    return None
+
+
+def find_manifest(job_dir: Path, run_id: str = None, latest: bool = True):
+    """
+    run_id의 manifest 경로 반환. 없고 latest=True면 가장 최근 run의 manifest.
+    반환: (path, is_current_run) 또는 (None, False)
+    """
+    job_dir = Path(job_dir)
+    if run_id:
+        p = job_dir / run_id / MANIFEST_FILE
+        if p.exists():
+            return p, True
+    if latest and job_dir.exists():
+        run_dirs = sorted((d for d in job_dir.iterdir() if d.is_dir()), key=_run_number, reverse=True)
+        for d in run_dirs:
+            if d.name != run_id and (d / MANIFEST_FILE).exists():
+                return d / MANIFEST_FILE, False
+    return None, False
+
+
+def index_manifest(manifest: dict, csv_dir: Path) -> dict:
+    """{csv Path: entry} — 실제 파일과 일치하는 항목만"""
+    out = {}
+    if not manifest:
+        return out
+    for entry in manifest.get("files", []):
+        p = Path(csv_dir) / entry.get("file", "")
+        if is_valid(entry, p):
+            out[p] = entry
+    return out
@@ -14,3 +14,12 @@ def resolve_path(ctx, path_str: str) -> Path:
         return p
 
     return ctx.work_dir / p
+
+
+def resolve_run_dir(ctx) -> Path:
+    """
+    run 단위 산출물 폴더: {export.out_dir}/{job}/{run_id}
+    (export의 run_info.json·manifest.json과 같은 위치)
+    """
+    export_cfg = ctx.job_config.get("export") or {}
+    return resolve_path(ctx, export_cfg.get("out_dir", "data/export")) / ctx.job_name / ctx.run_id
@@ -0,0 +1,227 @@
+# file: engine/profiling.py
+"""
+statement 단위 쿼리 프로파일링 (transform.profile / report.profile, 기본 off).
+
+  profile: true            # 또는
+  profile:
+    enabled: true
+    top_n: 10              # stage 종료 시 느린 statement 상위 N개 로그
+    plans: true            # DB 실행 계획/프로파일 저장 (false면 시간·row 수만)
+
+statement마다 소요 시간·row 수(DML/CTAS 영향 row, 알 수 있을 때만)를 기록하고
+{export.out_dir}/{job}/{run_id}/profile/{stage}/ 에 저장한다:
+  statements.json                 전체 statement 기록 (실행 순서)
+  {sql stem}__{statement번호}.json  DuckDB  enable_profiling='json' 출력 (operator별 시간·cardinality)
+  {sql stem}__{statement번호}.txt   Oracle  DBMS_XPLAN.DISPLAY_CURSOR(ALLSTATS LAST)
+                                  (세션 statistics_level=ALL → 실제 row/시간 포함, V$SQL_PLAN 권한 필요)
+                                  statistics_level은 report() 시 원래 값(모르면 TYPICAL)으로 되돌린다
+                                  (공유 연결이라 뒤 stage까지 ALL이 남지 않도록)
+SQLite / Vertica는 시간·row 수만 기록한다.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from engine.path_utils import resolve_run_dir
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = "profile"
+STATEMENTS_FILE = "statements.json"
+DEFAULT_TOP_N = 10
+
+_XPLAN_SQL = "SELECT plan_table_output FROM TABLE(DBMS_XPLAN.DISPLAY_CURSOR(NULL, NULL, 'ALLSTATS LAST'))"
+_STATS_LEVEL_SQL = "SELECT value FROM v$parameter WHERE name = 'statistics_level'"
+
+
+def create_profiler(ctx, stage: str, conn_type: str, profile_cfg):
+    """stage 설정의 profile 값 → QueryProfiler (비활성이면 None)"""
+    if isinstance(profile_cfg, dict):
+        if not profile_cfg.get("enabled", True):
+            return None
+    elif not profile_cfg:
+        return None
+    else:
+        profile_cfg = {}
+
+    out_dir = resolve_run_dir(ctx) / PROFILE_DIR / stage.lower()
+    return QueryProfiler(
+        stage, conn_type, out_dir,
+        top_n=int(profile_cfg.get("top_n", DEFAULT_TOP_N)),
+        plans=bool(profile_cfg.get("plans", True)),
+    )
+
+
+def statement_rows(conn_type: str, result):
+    """
+    실행 직후 영향 row 수 (모르면 None).
+    DuckDB: DML/CTAS 결과의 Count 컬럼, SQLite/Oracle: cursor.rowcount
+    """
+    try:
+        if conn_type == "duckdb":
+            desc = result.description
+            if desc and len(desc) == 1 and desc[0][0] == "Count":
+                row = result.fetchone()
+                return int(row[0]) if row else None
+            return None
+        rowcount = getattr(result, "rowcount", -1)
+        return rowcount if rowcount is not None and rowcount >= 0 else None
+    except Exception:
+        return None
+
+
+class QueryProfiler:
+    """statement 기록 수집 + DB별 프로파일 저장 (thread-safe, transform DAG worker 공유)"""
+
+    def __init__(self, stage: str, conn_type: str, out_dir: Path, top_n: int = DEFAULT_TOP_N, plans: bool = True):
+        self.stage = stage
+        self.conn_type = conn_type
+        self.out_dir = Path(out_dir)
+        self.top_n = top_n
+        self.plans = plans and conn_type in ("duckdb", "oracle")
+        self.records = []
+        self._lock = threading.Lock()
+        self._oracle_sessions = {}   # {연결 객체: 원래 statistics_level}
+        self._plan_warned = False
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def statement(self, conn, sql_name: str, stmt_no: int, sql_text: str):
+        """
+        with profiler.statement(conn, "01_x.sql", 1, stmt) as rec:
+            ...실행...
+            rec["rows"] = statement_rows(conn_type, cursor)
+        """
+        rec = {
+            "stage": self.stage,
+            "sql_file": sql_name,
+            "statement": stmt_no,
+            "sql": re.sub(r"\s+", " ", re.sub(r"--[^\n]*", " ", sql_text)).strip()[:500],
+            "rows": None,
+            "status": "ok",
+        }
+        plan_path = self._begin(conn, sql_name, stmt_no)
+        start = time.time()
+        try:
+            yield rec
+        except Exception as e:
+            rec["status"] = "failed"
+            rec["error"] = str(e)[:500]
+            raise
+        finally:
+            rec["elapsed"] = round(time.time() - start, 4)
+            self._end(conn, rec, plan_path)
+            with self._lock:
+                self.records.append(rec)
+
+    def _begin(self, conn, sql_name: str, stmt_no: int):
+        if not self.plans:
+            return None
+        stem = sql_name[:-4] if sql_name.lower().endswith(".sql") else sql_name
+        try:
+            if self.conn_type == "duckdb":
+                path = self.out_dir / f"{stem}__{stmt_no:02d}.json"
+                conn.execute("PRAGMA enable_profiling = 'json'")   # 형식 먼저 → output 확장자 검사 통과
+                output = path.as_posix().replace("'", "''")
+                conn.execute(f"SET profiling_output = '{output}'")
+                return path
+            if self.conn_type == "oracle":
+                if conn not in self._oracle_sessions:
+                    original = _oracle_stats_level(conn)
+                    cur = conn.cursor()
+                    try:
+                        cur.execute("ALTER SESSION SET statistics_level = ALL")
+                    finally:
+                        cur.close()
+                    with self._lock:
+                        self._oracle_sessions[conn] = original
+                return self.out_dir / f"{stem}__{stmt_no:02d}.txt"
+        except Exception as e:
+            self._warn_plan(e)
+        return None
+
+    def _end(self, conn, rec: dict, plan_path):
+        if plan_path is None:
+            return
+        try:
+            if self.conn_type == "duckdb":
+                conn.execute("PRAGMA disable_profiling")
+                if not plan_path.exists():   # DROP 등 물리 계획이 없는 statement
+                    return
+            elif self.conn_type == "oracle" and rec["status"] == "ok":
+                cur = conn.cursor()
+                try:
+                    cur.execute(_XPLAN_SQL)
+                    lines = [r[0] or "" for r in cur.fetchall()]
+                finally:
+                    cur.close()
+                plan_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            else:
+                return
+            rec["plan"] = plan_path.name
+        except Exception as e:
+            self._warn_plan(e)
+
+    def _warn_plan(self, e):
+        if not self._plan_warned:
+            self._plan_warned = True
+            logger.warning("%s profile: plan capture failed, timings only (%s)", self.stage, e)
+
+    def restore_sessions(self):
+        """ALL로 바꾼 Oracle 세션의 statistics_level 복원 (이미 닫힌 DAG worker 연결은 무시)"""
+        with self._lock:
+            sessions, self._oracle_sessions = self._oracle_sessions, {}
+        for conn, original in sessions.items():
+            try:
+                cur = conn.cursor()
+                try:
+                    cur.execute(f"ALTER SESSION SET statistics_level = {original}")
+                finally:
+                    cur.close()
+            except Exception as e:
+                logger.debug("%s profile: statistics_level restore skipped (%s)", self.stage, e)
+
+    def report(self, log):
+        """세션 설정 복원 + statements.json 저장 + 느린 statement top N 로그"""
+        self.restore_sessions()
+        with self._lock:
+            records = list(self.records)
+        if not records:
+            return
+        try:
+            with open(self.out_dir / STATEMENTS_FILE, "w", encoding="utf-8") as f:
+                json.dump(records, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            log.warning("%s profile save failed (%s): %s", self.stage, self.out_dir, e)
+
+        total = sum(r["elapsed"] for r in records)
+        log.info("%s profile | statements=%d total=%.2fs | saved → %s",
+                 self.stage, len(records), total, self.out_dir)
+        slowest = sorted(records, key=lambda r: r["elapsed"], reverse=True)[:self.top_n]
+        log.info("%s profile top %d slowest statements:", self.stage, len(slowest))
+        for rank, r in enumerate(slowest, 1):
+            log.info("  %2d. %8.2fs  rows=%-10s %s#%d%s  %s",
+                     rank, r["elapsed"], "-" if r["rows"] is None else r["rows"],
+                     r["sql_file"], r["statement"], " FAILED" if r["status"] != "ok" else "",
+                     r["sql"][:80])
+
+
+def _oracle_stats_level(conn) -> str:
+    """현재 statistics_level (v$parameter 권한이 없으면 TYPICAL)"""
+    try:
+        cur = conn.cursor()
+        try:
+            cur.execute(_STATS_LEVEL_SQL)
+            row = cur.fetchone()
+        finally:
+            cur.close()
+        if row and str(row[0]).upper() in ("BASIC", "TYPICAL", "ALL"):
+            return str(row[0]).upper()
+    except Exception:
+        pass
+    return "TYPICAL"
@@ -0,0 +1,127 @@
+# file: engine/resources.py
+"""
+run 단위 CPU·메모리 예산 (job.yml resources:, 설정이 없으면 기존 동작 그대로).
+
+  resources:
+    max_threads: 8              # run 전체 스레드 상한 (기본: CPU 코어 수)
+    max_memory: 8GB             # DuckDB memory_limit 상한 (단위 없으면 MB, 기본: DuckDB 기본값)
+    temp_directory: data/tmp    # DuckDB spill 폴더 (기본: DuckDB 기본값)
+
+stage가 바뀔 때마다(enter_stage) 구성요소별로 다시 나눈다 — max_threads(·max_memory) 대비 비율:
+  export    : worker 100%  (gzip 압축은 각 export worker 스레드에서 수행 → worker 수 = 압축 스레드 수)
+  load      : DuckDB 50% / worker·pyarrow 파싱 50% / 해시 25%
+  transform : DuckDB 100% / DAG worker 100% (worker는 쿼리 제출만 함)
+  report    : DuckDB 100% / pandas(numexpr) 50%  (Excel 변환은 SQL 실행 후)
+DuckDB threads / memory_limit / temp_directory는 connect_target()이 연결 시 적용한다.
+Oracle·SQLite·Vertica 연결은 서버/단일 스레드라 worker 수만 제한된다.
+"""
+
+import os
+import re
+import sys
+from dataclasses import dataclass
+
+from engine.path_utils import resolve_path
+
+_STAGE_SHARES = {
+    "export": {"workers": 1.0},
+    "load": {"duckdb": 0.5, "workers": 0.5, "arrow": 0.5, "hash": 0.25},
+    "transform": {"duckdb": 1.0, "workers": 1.0},
+    "report": {"duckdb": 1.0, "numexpr": 0.5},
+}
+_STAGE_SHARES["load_local"] = _STAGE_SHARES["load"]   # 하위 호환 stage 이름
+
+_SIZE_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "TB": 1024 ** 4}
+
+
+@dataclass
+class ResourceBudget:
+    max_threads: int
+    max_memory: int = None        # bytes, None이면 제한 없음
+    temp_directory: str = None    # 절대경로 문자열
+
+
+def parse_size(value) -> int:
+    """'8GB' / '512MB' / 1024 / '1024'(단위 없으면 MB) → bytes"""
+    if isinstance(value, (int, float)):
+        return int(value * 1024 ** 2)
+    m = re.fullmatch(r"\s*([\d.]+)\s*([KMGT]?B?)\s*", str(value).upper())
+    if not m:
+        raise ValueError(f"invalid memory size: {value}")
+    unit = m.group(2) or "MB"   # --set resources.max_memory=1024 는 문자열로 들어옴
+    if not unit.endswith("B"):
+        unit += "B"
+    return int(float(m.group(1)) * _SIZE_UNITS[unit])
+
+
+def create_budget(ctx, resources_cfg):
+    """job.yml resources → ResourceBudget (설정이 없으면 None)"""
+    if not resources_cfg:
+        return None
+    cpu = os.cpu_count() or 1
+    max_threads = max(1, int(resources_cfg.get("max_threads") or cpu))
+    max_memory = resources_cfg.get("max_memory")
+    temp_dir = resources_cfg.get("temp_directory")
+    return ResourceBudget(
+        max_threads=max_threads,
+        max_memory=parse_size(max_memory) if max_memory else None,
+        temp_directory=str(resolve_path(ctx, temp_dir)) if temp_dir else None,
+    )
+
+
+def describe_budget(budget) -> str:
+    if budget is None:
+        return "unlimited"
+    mem = f"{budget.max_memory // 1024 ** 2}MB" if budget.max_memory else "default"
+    return f"threads={budget.max_threads} memory={mem} temp={budget.temp_directory or 'default'}"
+
+
+def stage_threads(ctx, component: str, requested=None):
+    """
+    현재 stage에서 component(duckdb/workers/arrow/hash/numexpr)에 배정된 스레드 수.
+    requested가 있으면 min(requested, 배정량). 예산이 없으면 requested 그대로.
+    """
+    budget = getattr(ctx, "resources", None)
+    if budget is None:
+        return requested
+    share = _STAGE_SHARES.get(getattr(ctx, "stage", ""), {}).get(component, 1.0)
+    allowed = max(1, int(budget.max_threads * share))
+    if requested is None:
+        return allowed
+    return max(1, min(int(requested), allowed))
+
+
+def enter_stage(ctx, stage: str):
+    """stage 시작 시 호출 — ctx.stage 갱신 + 프로세스 단위 스레드 풀 재분배"""
+    ctx.stage = stage
+    budget = getattr(ctx, "resources", None)
+    if budget is None:
+        return
+
+    if "numexpr" not in sys.modules:   # numexpr는 import 시점에만 환경변수를 읽음
+        os.environ["NUMEXPR_MAX_THREADS"] = str(stage_threads(ctx, "numexpr"))
+    if stage in ("load", "load_local"):
+        try:
+            import pyarrow
+            pyarrow.set_cpu_count(stage_threads(ctx, "arrow"))
+        except ImportError:
+            pass
+
+    ctx.logger.info("RESOURCES %s | duckdb threads=%d | workers≤%d",
+                    stage.upper(), stage_threads(ctx, "duckdb"), stage_threads(ctx, "workers"))
+
+
+def apply_duckdb_settings(ctx, conn):
+    """DuckDB 연결에 현재 stage 몫의 threads / memory_limit / temp_directory 적용"""
+    budget = getattr(ctx, "resources", None)
+    if budget is None:
+        return
+    threads = stage_threads(ctx, "duckdb")
+    conn.execute(f"SET threads = {threads}")
+    if budget.max_memory:
+        share = _STAGE_SHARES.get(getattr(ctx, "stage", ""), {}).get("duckdb", 1.0)
+        conn.execute(f"SET memory_limit = '{max(64, int(budget.max_memory * share) // 1024 ** 2)}MiB'")
+    if budget.temp_directory:
+        os.makedirs(budget.temp_directory, exist_ok=True)
+        temp_dir = budget.temp_directory.replace("'", "''")
+        conn.execute(f"SET temp_directory = '{temp_dir}'")
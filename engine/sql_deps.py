@@ -0,0 +1,272 @@
+# file: engine/sql_deps.py
+"""
+transform SQL 파일 간 의존성(DAG) 분석 (transform.parallel_workers).
+
+각 파일이 쓰는 테이블(CREATE/INSERT/UPDATE/DELETE/MERGE/DROP/TRUNCATE/ALTER)과
+읽는 테이블(FROM/JOIN/USING)을 추출한다. FROM 목록은 콤마로 구분된 테이블 전부를 읽는다
+(FROM a, (subquery) q, b — WHERE/GROUP/ORDER 등 절 키워드나 닫는 괄호까지).
+FROM 뒤를 테이블/서브쿼리로 해석할 수 없으면 barrier로 취급한다. 파일 i는 앞 번호 파일 j 중
+  - i가 읽는 테이블을 j가 쓰거나 (read-after-write)
+  - i가 쓰는 테이블을 j가 읽거나 쓰면 (write-after-read / write-after-write)
+j 이후에 실행된다 → 의존성이 있는 파일끼리는 기존 번호 순서가 유지된다.
+
+SQL 첫 부분의 힌트 주석이 추론보다 우선한다:
+  --depends: 01_base, 02_dim.sql     (파일명, 확장자 생략 가능)
+  --depends:                         (의존 없음)
+PL/SQL 블록(BEGIN/DECLARE)·CALL 등 테이블을 알 수 없는 파일은 barrier로 취급
+(앞 파일 전부 끝난 뒤 실행, 뒤 파일은 전부 이 파일 이후).
+테이블명은 스키마를 떼고 대문자로 비교한다 (과잉 의존은 순서만 보수적으로 유지).
+"""
+
+import re
+
+DEPENDS_PATTERN = re.compile(r"^--\s*depends\s*:(.*)$", re.IGNORECASE)
+
+_NAME = r'((?:"[^"]+"|[\w$#]+)(?:\s*\.\s*(?:"[^"]+"|[\w$#]+))*)'
+
+_WRITE_PATTERNS = [
+    re.compile(r"\bCREATE\s+(?:OR\s+REPLACE\s+)?(?:(?:GLOBAL\s+|LOCAL\s+)?(?:TEMP|TEMPORARY)\s+)?"
+               r"(?:TABLE|VIEW|MATERIALIZED\s+VIEW)\s+(?:IF\s+NOT\s+EXISTS\s+)?" + _NAME, re.IGNORECASE),
+    re.compile(r"\bINSERT\s+(?:OR\s+\w+\s+)?(?:/\*.*?\*/\s*)?(?:INTO|OVERWRITE)\s+" + _NAME, re.IGNORECASE),
+    re.compile(r"\bUPDATE\s+" + _NAME, re.IGNORECASE),
+    re.compile(r"\bDELETE\s+(?:FROM\s+)?" + _NAME, re.IGNORECASE),
+    re.compile(r"\bMERGE\s+INTO\s+" + _NAME, re.IGNORECASE),
+    re.compile(r"\bDROP\s+(?:TABLE|VIEW|MATERIALIZED\s+VIEW)\s+(?:IF\s+EXISTS\s+)?" + _NAME, re.IGNORECASE),
+    re.compile(r"\bTRUNCATE\s+TABLE\s+" + _NAME, re.IGNORECASE),
+    re.compile(r"\bALTER\s+TABLE\s+" + _NAME, re.IGNORECASE),
+]
+_TOKEN = re.compile(r'"[^"]+"|[\w$#]+|\S')
+_IDENT = re.compile(r'"[^"]+"|[\w$#]+')
+_CTE_PATTERN = re.compile(r"(?:\bWITH\s+(?:RECURSIVE\s+)?|,\s*)" + _NAME + r"\s+AS\s*(?:NOT\s+)?(?:MATERIALIZED\s*)?\(",
+                          re.IGNORECASE)
+_BARRIER_PATTERN = re.compile(r"^\s*(?:BEGIN|DECLARE|CALL|EXEC|EXECUTE|ATTACH|DETACH|USE|COPY|IMPORT|EXPORT)\b",
+                              re.IGNORECASE)
+# FROM/DELETE 뒤에 와도 테이블이 아닌 키워드
+_NOT_TABLES = {"SELECT", "WHERE", "LATERAL", "UNNEST", "TABLE", "ONLY", "DUAL", "VALUES", "SET"}
+# FROM 목록이 끝나는 절 키워드 (괄호 깊이 0에서)
+_FROM_END = {"WHERE", "GROUP", "ORDER", "HAVING", "UNION", "INTERSECT", "EXCEPT", "MINUS", "LIMIT", "OFFSET",
+             "FETCH", "QUALIFY", "WINDOW", "CONNECT", "START", "RETURNING", "SELECT", "FOR", "SET", "WHEN"}
+# 함수 인자 안의 FROM (EXTRACT(YEAR FROM col), TRIM(x FROM col), IS DISTINCT FROM)
+_FUNC_FROM = re.compile(r"\b(?:EXTRACT|TRIM|SUBSTRING|OVERLAY|POSITION)\s*\([^()]*\)|\bDISTINCT\s+FROM\b",
+                        re.IGNORECASE)
+
+
+def _strip(sql_text: str) -> str:
+    """주석·문자열 리터럴 제거 (리터럴 안의 FROM 등 오인 방지)"""
+    sql_text = re.sub(r"/\*.*?\*/", " ", sql_text, flags=re.DOTALL)
+    sql_text = re.sub(r"--[^\n]*", " ", sql_text)
+    sql_text = re.sub(r"'(?:[^']|'')*'", "''", sql_text)
+    return _FUNC_FROM.sub(" ", sql_text)
+
+
+def _table_key(name: str) -> str:
+    """스키마 제거 + 따옴표 제거 + 대문자"""
+    last = re.split(r"\s*\.\s*", name)[-1]
+    return last.strip('"').upper()
+
+
+def _skip_parens(tokens: list, pos: int) -> int:
+    """tokens[pos] == "(" → 짝이 맞는 ")" 다음 위치"""
+    depth = 0
+    while pos < len(tokens):
+        if tokens[pos] == "(":
+            depth += 1
+        elif tokens[pos] == ")":
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        pos += 1
+    return pos
+
+
+def _table_ref(tokens: list, pos: int):
+    """
+    FROM/JOIN/USING 뒤 항목 하나 → (테이블명 또는 None, 다음 위치)
+    서브쿼리·테이블 함수는 None (안쪽 FROM은 따로 추출됨), 해석 불가면 테이블명 자리에 False
+    """
+    if pos >= len(tokens):
+        return False, pos
+    if tokens[pos] == "(":
+        return None, _skip_parens(tokens, pos)
+    if not _IDENT.fullmatch(tokens[pos]):
+        return False, pos
+    parts = [tokens[pos]]
+    pos += 1
+    while pos + 1 < len(tokens) and tokens[pos] == "." and _IDENT.fullmatch(tokens[pos + 1]):
+        parts.append(tokens[pos + 1])
+        pos += 2
+    if pos < len(tokens) and tokens[pos] == "(":   # read_csv(...) 같은 테이블 함수
+        return None, _skip_parens(tokens, pos)
+    return _table_key(".".join(parts)), pos
+
+
+def _next_from_item(tokens: list, pos: int):
+    """FROM 목록에서 다음 콤마 항목 위치 (alias·JOIN ... ON 등은 건너뜀), 목록이 끝나면 None"""
+    depth = 0
+    while pos < len(tokens):
+        tok = tokens[pos]
+        if tok == "(":
+            depth += 1
+        elif tok == ")":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif depth == 0:
+            if tok == ",":
+                return pos + 1
+            if tok == ";" or tok.upper() in _FROM_END:
+                return None
+        pos += 1
+    return None
+
+
+def _read_tables(text: str):
+    """FROM 목록(콤마 구분 전부)·JOIN·USING 대상 테이블 → (reads, 해석 성공 여부)"""
+    tokens = _TOKEN.findall(text)
+    reads, ok = set(), True
+    for i, tok in enumerate(tokens):
+        kw = tok.upper()
+        if kw not in ("FROM", "JOIN", "USING"):
+            continue
+        pos = i + 1
+        while pos is not None:
+            name, pos = _table_ref(tokens, pos)
+            if name is False:
+                ok = False
+                break
+            if name:
+                reads.add(name)
+            pos = _next_from_item(tokens, pos) if kw == "FROM" else None
+    return reads, ok
+
+
+def parse_depends_hint(sql_text: str):
+    """--depends: 힌트 → 파일명(stem) 목록. 힌트가 없으면 None"""
+    for line in sql_text.splitlines():
+        s = line.strip()
+        if not s:
+            continue
+        m = DEPENDS_PATTERN.match(s)
+        if m:
+            names = [n.strip() for n in re.split(r"[,\s]+", m.group(1)) if n.strip()]
+            return [n[:-4] if n.lower().endswith(".sql") else n for n in names]
+        if not s.startswith("--"):
+            break
+    return None
+
+
+def extract_tables(sql_text: str):
+    """
+    SQL 텍스트 → (writes, reads, barrier)
+    writes/reads: 테이블명(대문자) 집합, barrier: 테이블을 알 수 없는 문장 포함 여부
+    """
+    text = _strip(sql_text)
+    writes = set()
+    for pattern in _WRITE_PATTERNS:
+        writes.update(_table_key(m.group(1)) for m in pattern.finditer(text))
+    ctes = {_table_key(m.group(1)) for m in _CTE_PATTERN.finditer(text)}
+    reads, parsed = _read_tables(text)
+    writes -= _NOT_TABLES
+    reads -= _NOT_TABLES | ctes
+    statements = [s for s in text.split(";") if s.strip()]
+    barrier = not parsed or any(_BARRIER_PATTERN.match(s) for s in statements) or not (writes or reads)
+    return writes, reads, barrier
+
+
+def build_dependencies(files: list) -> list:
+    """
+    files: [(sql 파일 stem, 렌더링된 SQL 텍스트), ...] — 번호 순서
+    반환: 파일별 선행 파일 index 집합 [set, ...]
+    힌트 대상 파일이 없으면 ValueError, 순환이 있으면 ValueError
+    """
+    index_of = {stem: i for i, (stem, _) in enumerate(files)}
+    parsed = [extract_tables(sql) for _, sql in files]
+    deps = []
+    for i, (stem, sql) in enumerate(files):
+        hint = parse_depends_hint(sql)
+        if hint is not None:
+            missing = [n for n in hint if n not in index_of]
+            if missing:
+                raise ValueError(f"--depends target not found: {stem} → {missing}")
+            deps.append({index_of[n] for n in hint} - {i})
+            continue
+
+        writes, reads, barrier = parsed[i]
+        d = set()
+        for j in range(i):
+            w, r, b = parsed[j]
+            if barrier or b or (reads & w) or (writes & (w | r)):
+                d.add(j)
+        deps.append(d)
+
+    _check_acyclic(deps, [stem for stem, _ in files])
+    return deps
+
+
+def _check_acyclic(deps: list, names: list):
+    state = [0] * len(deps)   # 0: 미방문, 1: 방문 중, 2: 완료
+
+    def visit(i, path):
+        if state[i] == 1:
+            raise ValueError("--depends cycle: " + " → ".join(names[k] for k in path + [i]))
+        if state[i] == 2:
+            return
+        state[i] = 1
+        for j in deps[i]:
+            visit(j, path + [i])
+        state[i] = 2
+
+    for i in range(len(deps)):
+        visit(i, [])
+
+
+def critical_path(deps: list, durations: list):
+    """
+    실측 소요 시간 기준 최장 경로 분석.
+    반환: (경로 index 목록, 경로 총 시간, 파일별 slack 목록)
+      slack: 전체 시간을 늘리지 않고 늦어질 수 있는 시간 (0이면 critical path 위)
+    """
+    n = len(deps)
+    order = _topological(deps)
+    finish = [0.0] * n
+    prev = [None] * n
+    for i in order:
+        start = 0.0
+        for j in deps[i]:
+            if finish[j] > start:
+                start, prev[i] = finish[j], j
+        finish[i] = start + durations[i]
+
+    total = max(finish, default=0.0)
+    dependents = [[] for _ in range(n)]
+    for i, d in enumerate(deps):
+        for j in d:
+            dependents[j].append(i)
+    latest = [total] * n
+    for i in reversed(order):
+        for k in dependents[i]:
+            latest[i] = min(latest[i], latest[k] - durations[k])
+    slack = [max(latest[i] - finish[i], 0.0) for i in range(n)]
+
+    path = []
+    i = max(range(n), key=lambda k: finish[k]) if n else None
+    while i is not None:
+        path.append(i)
+        i = prev[i]
+    return list(reversed(path)), total, slack
+
+
+def _topological(deps: list) -> list:
+    order, done = [], set()
+
+    def visit(i):
+        if i in done:
+            return
+        done.add(i)
+        for j in sorted(deps[i]):
+            visit(j)
+        order.append(i)
+
+    for i in range(len(deps)):
+        visit(i)
+    return order
@@ -4,7 +4,8 @@ import re
 from pathlib import Path
 
 SQL_PREFIX_PATTERN = re.compile(r"^(\d+)_.*\.sql$", re.IGNORECASE)
-TABLE_HINT_PATTERN = re.compile(r"^--\[(.+)\]$")
+TABLE_HINT_PATTERN = re.compile(r"^--\[([^\]]+)\](.*)$")
+FORMAT_HINT_PATTERN = re.compile(r"^--\s*format\s*:\s*(.+?)\s*=\s*(.+?)\s*$", re.IGNORECASE)
 
 
 def sort_sql_files(sql_dir: Path):
@@ -32,10 +33,11 @@ def sort_sql_files(sql_dir: Path):
     return sorted(files, key=lambda f: f.name.lower())
 
 
-def resolve_table_name(sql_file: Path) -> str:
+def parse_table_hint(sql_file: Path):
     """
-    SQL 첫 줄(정확히는 첫 non-empty line)에 --[table_name] 이 있으면 그 값을 테이블명으로 사용.
-    없으면 sql_file.stem 사용.
+    SQL 첫 non-empty line의 --[table_name] 힌트와 뒤따르는 옵션(key=value, 공백 구분) 파싱.
+    예: --[TB_CONTRACT] keys=CONTRACT_ID,CLS_YYMM
+    반환: (table_name 또는 None, {옵션})
     """
     with open(sql_file, "r", encoding="utf-8") as f:
         for line in f:
@@ -45,11 +47,52 @@ def resolve_table_name(sql_file: Path) -> str:
 
             m = TABLE_HINT_PATTERN.match(s)
             if m:
-                return m.group(1).strip()
+                options = {}
+                for token in m.group(2).split():
+                    key, sep, val = token.partition("=")
+                    if sep:
+                        options[key.strip().lower()] = val.strip()
+                return m.group(1).strip(), options
 
             break
 
-    return sql_file.stem
+    return None, {}
+
+
+def resolve_table_name(sql_file: Path) -> str:
+    """
+    SQL 첫 줄(정확히는 첫 non-empty line)에 --[table_name] 이 있으면 그 값을 테이블명으로 사용.
+    없으면 sql_file.stem 사용.
+    """
+    table_name, _ = parse_table_hint(sql_file)
+    return table_name or sql_file.stem
+
+
+def resolve_table_keys(sql_file: Path) -> list:
+    """--[table_name] keys=COL1,COL2 힌트의 키 컬럼 목록 (load.mode=merge용). 없으면 []"""
+    _, options = parse_table_hint(sql_file)
+    return [k.strip() for k in options.get("keys", "").split(",") if k.strip()]
+
+
+def parse_format_hints(sql_file: Path) -> dict:
+    """
+    SQL 앞부분 주석의 --format: 컬럼 = Excel 서식 힌트 (report Excel 컬럼 서식, 줄당 1개).
+    예: --format: 계약금액 = #,##0
+        --format: 손해율(%) = 0.00
+    반환: {컬럼명: 서식}
+    """
+    formats = {}
+    with open(sql_file, "r", encoding="utf-8") as f:
+        for line in f:
+            s = line.strip()
+            if not s:
+                continue
+            if not s.startswith("--"):
+                break
+            m = FORMAT_HINT_PATTERN.match(s)
+            if m:
+                formats[m.group(1).strip('"')] = m.group(2)
+    return formats
 
 
 def extract_sqlname_from_csv(csv_path: Path) -> str:
@@ -100,6 +143,25 @@ def extract_params_from_csv(csv_path: Path) -> dict:
     return params
 
 
+def match_param_columns(params: dict, table_cols: list):
+    """
+    CSV 파일명 파라미터 → 테이블 컬럼 매칭 (load.mode=delete의 WHERE 조건용).
+    대소문자 무시, 없으면 밑줄 제거 정규화로 매칭 (clsYymm → CLS_YYMM).
+    반환: ([(컬럼명, 값), ...], 매칭 실패한 파라미터 키 목록)
+    """
+    by_upper = {col.upper(): col for col in table_cols}
+    norm_map = {col.replace("_", "").lower(): col for col in table_cols}
+    matched = []
+    unmatched = []
+    for key, val in params.items():
+        col = by_upper.get(key.upper()) or norm_map.get(key.replace("_", "").lower())
+        if col:
+            matched.append((col, val))
+        else:
+            unmatched.append(key)
+    return matched, unmatched
+
+
 def _strip_sql_comments(sql_text: str) -> str:
     """SQL 단일행 주석(-- ...) 제거. 문자열 리터럴 내부의 --는 보존."""
     lines = sql_text.splitlines()
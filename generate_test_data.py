@@ -1,243 +1,384 @@
 """
-ELT Runner — 통합 테스트 데이터 생성
-보험계약 관리 시나리오 (10개 테이블, ~25만 행)
+ELT Runner — 통합 테스트 데이터 생성 (scale factor)
+보험계약 관리 시나리오 (10개 테이블, SF=1 기준 ~21만 행)
 
-사용법:  python generate_test_data.py
-결과:    data/export/test/ 에 CSV 22개 생성
+사용법:
+  python generate_test_data.py                              # SF=1, CSV
+  python generate_test_data.py --sf 100 --format csv.gz --workers 8
+  python generate_test_data.py --sf 10 --format parquet --out data/export/test/test_insurance
+
+  --sf       scale factor (TPC 방식). 고객/설계사/분기별 계약 수가 SF에 비례
+             SF=1 ≈ 21만 행, SF=100 ≈ 2,100만 행, SF=500 ≈ 1억 행
+  --format   csv | csv.gz | parquet  (parquet은 pyarrow 필요)
+  --workers  병렬 프로세스 수 (default: CPU 수)
+  --seed     난수 seed (같은 seed/SF면 같은 데이터)
+
+결과:    {out}/ 에 파일 22개 생성
+         파일명 규칙은 export와 동일: {sql}__{host}[__{param}_{value}].{ext}
 
 이후:    python runner.py --job jobs/test_insurance.yml
+
+컬럼은 NumPy로 벡터 생성하고, 큰 테이블은 CHUNK_ROWS 단위로 나눠 같은 파일에 이어 쓴다
+(메모리 사용량은 SF와 무관하게 chunk 크기로 제한). 파일 1개 = 작업 1개로 프로세스 병렬 처리.
+필요 패키지: numpy, pandas (parquet: pyarrow)
 """
 
-import csv
-import random
+import argparse
+import gzip
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime, timedelta
 
-random.seed(42)
+import numpy as np
+import pandas as pd
 
 OUT_DIR = Path("data/export/test/test_insurance")
 HOST = "local"
 QUARTERS = ["202303", "202306", "202309", "202312"]
+CHUNK_ROWS = 1_000_000       # 분기 테이블 chunk 크기 (계약 기준)
+
+# SF=1 기준 규모
+N_CUSTOMERS = 10_000
+N_AGENTS = 200
+N_CONTRACTS_PER_Q = 12_500
+CLAIM_RATIO = 0.15
+
+REGIONS = ["서울","경기","인천","부산","대구","광주","대전","울산","강원","충북","충남","전북","전남","경북","경남","제주"]
+LAST_NAMES = ["김","이","박","최","정","강","조","윤","장","임","한","오","서","신","권","황","안","송","류","홍"]
+FIRST_NAMES = ["민","서","지","현","수","영","은","예","도","하","준","우","재","성","태"]
+CATEGORIES = ["종신","정기","연금","건강","실손","운전자","화재","여행","저축","변액"]
+BRANCHES = [
+    ("BR01","서울본부","서울"),("BR02","강남지점","서울"),("BR03","서초지점","서울"),
+    ("BR04","영등포지점","서울"),("BR05","마포지점","서울"),
+    ("BR06","경기본부","경기"),("BR07","수원지점","경기"),("BR08","성남지점","경기"),
+    ("BR09","인천지점","인천"),("BR10","부산본부","부산"),
+    ("BR11","대구지점","대구"),("BR12","광주지점","광주"),
+    ("BR13","대전지점","대전"),("BR14","울산지점","울산"),
+    ("BR15","강원지점","강원"),("BR16","충북지점","충북"),
+    ("BR17","전북지점","전북"),("BR18","전남지점","전남"),
+    ("BR19","경북지점","경북"),("BR20","제주지점","제주"),
+]
+CODES = [
+    ("STATUS","01","정상"),("STATUS","02","해지"),("STATUS","03","만기"),
+    ("STATUS","04","실효"),("STATUS","05","취소"),
+    ("PAY_TYPE","01","계좌이체"),("PAY_TYPE","02","카드납"),("PAY_TYPE","03","가상계좌"),
+    ("CLAIM_TYPE","01","사망"),("CLAIM_TYPE","02","입원"),("CLAIM_TYPE","03","수술"),
+    ("CLAIM_TYPE","04","통원"),("CLAIM_TYPE","05","진단"),
+    ("CLAIM_ST","01","접수"),("CLAIM_ST","02","심사중"),("CLAIM_ST","03","지급완료"),
+    ("CLAIM_ST","04","반려"),("CLAIM_ST","05","취소"),
+    ("GENDER","M","남성"),("GENDER","F","여성"),
+    ("REGION","11","서울"),("REGION","41","경기"),("REGION","28","인천"),
+    ("REGION","26","부산"),("REGION","27","대구"),("REGION","29","광주"),
+    ("REGION","30","대전"),("REGION","31","울산"),("REGION","36","세종"),
+] + [("ETC", f"E{i:02d}", f"기타코드_{i}") for i in range(29, 50)]
+
+EXT = {"csv": "csv", "csv.gz": "csv.gz", "parquet": "parquet"}
+TABLE_IDS = {name: i for i, name in enumerate([
+    "02_customer", "03_product", "06_agent", "07_branch", "09_rate", "10_code",
+    "01_contract", "04_payment", "05_claim", "08_contract_agent",
+])}
+
+
+# ────────────────────────────────────────
+# 벡터 생성 유틸
+# ────────────────────────────────────────
+
+def _rng(seed, table, quarter_idx=0, chunk_idx=0):
+    """(table, 분기, chunk)별 독립 난수열 → 프로세스 분할과 무관하게 같은 결과"""
+    return np.random.default_rng([seed, TABLE_IDS[table], quarter_idx, chunk_idx])
+
+
+def _ids(prefix: str, seq: np.ndarray, width: int) -> np.ndarray:
+    return np.char.add(prefix, np.char.zfill(seq.astype(str), width))
+
+
+def _names(rng, n, last, first) -> np.ndarray:
+    last = np.asarray(last)
+    first = np.asarray(first)
+    return np.char.add(np.char.add(last[rng.integers(0, len(last), n)],
+                                   first[rng.integers(0, len(first), n)]),
+                       first[rng.integers(0, len(first), n)])
+
+
+def _dates(rng, start: str, end: str, n) -> np.ndarray:
+    s = np.datetime64(start, "D")
+    span = (np.datetime64(end, "D") - s).astype(int)
+    return (s + rng.integers(0, span + 1, n)).astype(str)
 
 
-def write_csv(filename, headers, rows):
-    path = OUT_DIR / filename
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(headers)
-        w.writerows(rows)
-    print(f"  {filename}: {len(rows):,} rows")
+def _quarter_range(quarter: str):
+    yy, mm = int(quarter[:4]), int(quarter[4:])
+    return f"{yy:04d}-{max(1, mm - 2):02d}-01", f"{yy:04d}-{mm:02d}-28"
+
+
+def _contract_width(n_contracts: int) -> int:
+    # SF=1 에서 기존 포맷(CT + 분기 + 5자리)과 동일
+    return max(5, len(str(n_contracts)))
+
 
+def _weighted(rng, values, weights, n) -> np.ndarray:
+    p = np.asarray(weights, dtype=float)
+    return np.asarray(values)[rng.choice(len(values), size=n, p=p / p.sum())]
 
-def rand_date(start, end):
-    return start + timedelta(days=random.randint(0, (end - start).days))
 
-def fmt(d):
-    return d.strftime("%Y-%m-%d")
+# ────────────────────────────────────────
+# 파일 writer (chunk 이어쓰기, tmp → rename)
+# ────────────────────────────────────────
+
+class _ChunkWriter:
+    def __init__(self, path: Path, fmt: str):
+        self.path = path
+        self.tmp = path.with_name(path.name + ".tmp")
+        self.fmt = fmt
+        self.rows = 0
+        self._f = None
+        self._pq = None
+
+    def write(self, df: pd.DataFrame):
+        if self.fmt == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._pq is None:
+                self._pq = pq.ParquetWriter(self.tmp, table.schema)
+            self._pq.write_table(table)
+        else:
+            if self._f is None:
+                if self.fmt == "csv.gz":
+                    self._f = gzip.open(self.tmp, "wt", encoding="utf-8", newline="", compresslevel=6)
+                else:
+                    self._f = open(self.tmp, "w", encoding="utf-8", newline="")
+            df.to_csv(self._f, index=False, header=(self.rows == 0), lineterminator="\r\n")
+        self.rows += len(df)
+
+    def close(self):
+        if self._pq is not None:
+            self._pq.close()
+        if self._f is not None:
+            self._f.close()
+        self.tmp.replace(self.path)
+
+
+def _file_name(sql: str, fmt: str, quarter: str = None) -> str:
+    name = f"{sql}__{HOST}"
+    if quarter:
+        name += f"__clsYymm_{quarter}"
+    return f"{name}.{EXT[fmt]}"
 
 
 # ────────────────────────────────────────
 # 마스터 테이블 (파라미터 없음)
 # ────────────────────────────────────────
 
-def gen_customers(n=10000):
-    regions = ["서울","경기","인천","부산","대구","광주","대전","울산","강원","충북","충남","전북","전남","경북","경남","제주"]
-    last = ["김","이","박","최","정","강","조","윤","장","임","한","오","서","신","권","황","안","송","류","홍"]
-    first = ["민","서","지","현","수","영","은","예","도","하","준","우","재","성","태"]
-    rows = []
-    for i in range(1, n + 1):
-        rows.append([
-            f"C{i:06d}",
-            random.choice(last) + random.choice(first) + random.choice(first),
-            fmt(rand_date(datetime(1950,1,1), datetime(2000,12,31))),
-            random.choice(["M","F"]),
-            random.choice(regions),
-        ])
-    write_csv(f"02_customer__{HOST}.csv",
-              ["CUSTOMER_ID","CUSTOMER_NAME","BIRTH_DATE","GENDER","REGION"], rows)
-    return [r[0] for r in rows]
-
-
-def gen_products():
-    cats = ["종신","정기","연금","건강","실손","운전자","화재","여행","저축","변액"]
-    rows = []
-    for i, cat in enumerate(cats):
-        for j in range(1, 4):
-            idx = i * 3 + j
-            rows.append([
-                f"P{idx:03d}", f"{cat}보험_{j}형", cat,
-                random.choice([100000,200000,500000,1000000]),
-                random.choice([5000000,10000000,50000000,100000000]),
-            ])
-    write_csv(f"03_product__{HOST}.csv",
-              ["PRODUCT_CD","PRODUCT_NAME","CATEGORY","MIN_AMT","MAX_AMT"], rows)
-    return [r[0] for r in rows]
-
-
-def gen_branches():
-    data = [
-        ("BR01","서울본부","서울"),("BR02","강남지점","서울"),("BR03","서초지점","서울"),
-        ("BR04","영등포지점","서울"),("BR05","마포지점","서울"),
-        ("BR06","경기본부","경기"),("BR07","수원지점","경기"),("BR08","성남지점","경기"),
-        ("BR09","인천지점","인천"),("BR10","부산본부","부산"),
-        ("BR11","대구지점","대구"),("BR12","광주지점","광주"),
-        ("BR13","대전지점","대전"),("BR14","울산지점","울산"),
-        ("BR15","강원지점","강원"),("BR16","충북지점","충북"),
-        ("BR17","전북지점","전북"),("BR18","전남지점","전남"),
-        ("BR19","경북지점","경북"),("BR20","제주지점","제주"),
-    ]
-    rows = [list(b) for b in data]
-    write_csv(f"07_branch__{HOST}.csv",
-              ["BRANCH_CD","BRANCH_NAME","REGION"], rows)
-    return [r[0] for r in rows]
-
-
-def gen_agents(branch_cds, n=200):
-    last = ["김","이","박","최","정","강","조","윤","장","임"]
-    first = ["민","서","지","현","수","영","은","예","도","하","준"]
-    rows = []
-    for i in range(1, n + 1):
-        rows.append([
-            f"A{i:04d}",
-            random.choice(last) + random.choice(first) + random.choice(first),
-            random.choice(branch_cds),
-            fmt(rand_date(datetime(2015,1,1), datetime(2023,6,30))),
-        ])
-    write_csv(f"06_agent__{HOST}.csv",
-              ["AGENT_ID","AGENT_NAME","BRANCH_CD","JOIN_DATE"], rows)
-    return [r[0] for r in rows]
-
-
-def gen_rates(product_cds):
-    rows = []
-    for pcd in product_cds:
-        for rc in ["0000", "0001"]:
-            rows.append([pcd, rc, round(random.uniform(0.01, 0.15), 4), "2023-01-01"])
-    write_csv(f"09_rate__{HOST}.csv",
-              ["PRODUCT_CD","RATE_CODE","RATE_VALUE","EFFECTIVE_DATE"], rows)
-
-
-def gen_codes():
-    data = [
-        ("STATUS","01","정상"),("STATUS","02","해지"),("STATUS","03","만기"),
-        ("STATUS","04","실효"),("STATUS","05","취소"),
-        ("PAY_TYPE","01","계좌이체"),("PAY_TYPE","02","카드납"),("PAY_TYPE","03","가상계좌"),
-        ("CLAIM_TYPE","01","사망"),("CLAIM_TYPE","02","입원"),("CLAIM_TYPE","03","수술"),
-        ("CLAIM_TYPE","04","통원"),("CLAIM_TYPE","05","진단"),
-        ("CLAIM_ST","01","접수"),("CLAIM_ST","02","심사중"),("CLAIM_ST","03","지급완료"),
-        ("CLAIM_ST","04","반려"),("CLAIM_ST","05","취소"),
-        ("GENDER","M","남성"),("GENDER","F","여성"),
-        ("REGION","11","서울"),("REGION","41","경기"),("REGION","28","인천"),
-        ("REGION","26","부산"),("REGION","27","대구"),("REGION","29","광주"),
-        ("REGION","30","대전"),("REGION","31","울산"),("REGION","36","세종"),
-    ]
-    for i in range(len(data), 50):
-        data.append(("ETC", f"E{i:02d}", f"기타코드_{i}"))
-    write_csv(f"10_code__{HOST}.csv",
-              ["CODE_TYPE","CODE","CODE_NAME"], [list(d) for d in data])
+def gen_customers(sf, seed):
+    n = N_CUSTOMERS * sf
+    for ci, start in enumerate(range(0, n, CHUNK_ROWS)):
+        rng = _rng(seed, "02_customer", 0, ci)
+        m = min(CHUNK_ROWS, n - start)
+        yield pd.DataFrame({
+            "CUSTOMER_ID": _ids("C", np.arange(start + 1, start + m + 1), max(6, len(str(n)))),
+            "CUSTOMER_NAME": _names(rng, m, LAST_NAMES, FIRST_NAMES),
+            "BIRTH_DATE": _dates(rng, "1950-01-01", "2000-12-31", m),
+            "GENDER": np.array(["M", "F"])[rng.integers(0, 2, m)],
+            "REGION": np.asarray(REGIONS)[rng.integers(0, len(REGIONS), m)],
+        })
+
+
+def gen_products(sf, seed):
+    rng = _rng(seed, "03_product")
+    n = len(CATEGORIES) * 3
+    yield pd.DataFrame({
+        "PRODUCT_CD": _ids("P", np.arange(1, n + 1), 3),
+        "PRODUCT_NAME": [f"{cat}보험_{j}형" for cat in CATEGORIES for j in range(1, 4)],
+        "CATEGORY": [cat for cat in CATEGORIES for _ in range(3)],
+        "MIN_AMT": np.array([100000, 200000, 500000, 1000000])[rng.integers(0, 4, n)],
+        "MAX_AMT": np.array([5000000, 10000000, 50000000, 100000000])[rng.integers(0, 4, n)],
+    })
+
+
+def gen_branches(sf, seed):
+    yield pd.DataFrame(BRANCHES, columns=["BRANCH_CD", "BRANCH_NAME", "REGION"])
+
+
+def gen_agents(sf, seed):
+    rng = _rng(seed, "06_agent")
+    n = N_AGENTS * sf
+    branch_cds = np.array([b[0] for b in BRANCHES])
+    yield pd.DataFrame({
+        "AGENT_ID": _ids("A", np.arange(1, n + 1), max(4, len(str(n)))),
+        "AGENT_NAME": _names(rng, n, LAST_NAMES[:10], FIRST_NAMES[:11]),
+        "BRANCH_CD": branch_cds[rng.integers(0, len(branch_cds), n)],
+        "JOIN_DATE": _dates(rng, "2015-01-01", "2023-06-30", n),
+    })
+
+
+def gen_rates(sf, seed):
+    rng = _rng(seed, "09_rate")
+    product_cds = _ids("P", np.arange(1, len(CATEGORIES) * 3 + 1), 3)
+    n = len(product_cds) * 2
+    yield pd.DataFrame({
+        "PRODUCT_CD": np.repeat(product_cds, 2),
+        "RATE_CODE": np.tile(["0000", "0001"], len(product_cds)),
+        "RATE_VALUE": np.round(rng.uniform(0.01, 0.15, n), 4),
+        "EFFECTIVE_DATE": "2023-01-01",
+    })
+
+
+def gen_codes(sf, seed):
+    yield pd.DataFrame(CODES, columns=["CODE_TYPE", "CODE", "CODE_NAME"])
 
 
 # ────────────────────────────────────────
 # 분기별 테이블 (clsYymm 파라미터)
+# 계약 seq를 기준으로 chunk를 나누고, 파생 테이블은 같은 chunk의 계약만 참조한다.
 # ────────────────────────────────────────
 
-def gen_contracts(customer_ids, product_cds, quarter, n=12500):
-    yy, mm = int(quarter[:4]), int(quarter[4:])
-    q_start = datetime(yy, max(1, mm - 2), 1)
-    q_end = datetime(yy, mm, 28)
-    statuses = ["01"]*70 + ["02"]*15 + ["03"]*10 + ["04"]*3 + ["05"]*2
-
-    rows = []
-    for i in range(n):
-        seq = int(quarter) * 100000 + i + 1
-        rows.append([
-            f"CT{seq}", random.choice(customer_ids), random.choice(product_cds),
-            fmt(rand_date(q_start, q_end)), quarter,
-            random.choice(statuses), random.randint(1, 500) * 10000,
-        ])
-    write_csv(f"01_contract__{HOST}__clsYymm_{quarter}.csv",
-              ["CONTRACT_ID","CUSTOMER_ID","PRODUCT_CD","CONTRACT_DATE","CLS_YYMM","STATUS","CONTRACT_AMT"],
-              rows)
-    return [r[0] for r in rows]
-
-
-def gen_payments(contract_ids, quarter):
-    yy, mm = int(quarter[:4]), int(quarter[4:])
-    q_start = datetime(yy, max(1, mm - 2), 1)
-    q_end = datetime(yy, mm, 28)
-    pay_types = ["01","02","03"]
-
-    rows = []
-    pid = int(quarter) * 1000000
-    for cid in contract_ids:
-        for _ in range(random.choices([1,2,3], weights=[30,50,20])[0]):
-            pid += 1
-            rows.append([
-                f"PM{pid}", cid, fmt(rand_date(q_start, q_end)),
-                random.randint(1, 100) * 10000, random.choice(pay_types),
-            ])
-    write_csv(f"04_payment__{HOST}__clsYymm_{quarter}.csv",
-              ["PAYMENT_ID","CONTRACT_ID","PAYMENT_DATE","PAYMENT_AMT","PAYMENT_TYPE"],
-              rows)
-
-
-def gen_claims(contract_ids, quarter, ratio=0.15):
-    yy, mm = int(quarter[:4]), int(quarter[4:])
-    q_start = datetime(yy, max(1, mm - 2), 1)
-    q_end = datetime(yy, mm, 28)
-    claim_types = ["01","02","03","04","05"]
-    claim_st = ["01"]*10 + ["02"]*20 + ["03"]*60 + ["04"]*5 + ["05"]*5
-
-    selected = random.sample(contract_ids, int(len(contract_ids) * ratio))
-    rows = []
-    clid = int(quarter) * 100000
-    for cid in selected:
-        clid += 1
-        rows.append([
-            f"CL{clid}", cid, fmt(rand_date(q_start, q_end)),
-            random.randint(10, 5000) * 10000,
-            random.choice(claim_types), random.choice(claim_st),
-        ])
-    write_csv(f"05_claim__{HOST}__clsYymm_{quarter}.csv",
-              ["CLAIM_ID","CONTRACT_ID","CLAIM_DATE","CLAIM_AMT","CLAIM_TYPE","STATUS"],
-              rows)
-
-
-def gen_contract_agent(contract_ids, agent_ids, quarter):
-    rows = [[cid, random.choice(agent_ids)] for cid in contract_ids]
-    write_csv(f"08_contract_agent__{HOST}__clsYymm_{quarter}.csv",
-              ["CONTRACT_ID","AGENT_ID"], rows)
+def _contract_chunks(sf, quarter):
+    n = N_CONTRACTS_PER_Q * sf
+    for ci, start in enumerate(range(0, n, CHUNK_ROWS)):
+        yield ci, np.arange(start + 1, min(start + CHUNK_ROWS, n) + 1), _contract_width(n)
+
+
+def gen_contracts(sf, seed, quarter, qi):
+    q_start, q_end = _quarter_range(quarter)
+    n_cust = N_CUSTOMERS * sf
+    for ci, seq, width in _contract_chunks(sf, quarter):
+        rng = _rng(seed, "01_contract", qi, ci)
+        m = len(seq)
+        yield pd.DataFrame({
+            "CONTRACT_ID": _ids(f"CT{quarter}", seq, width),
+            "CUSTOMER_ID": _ids("C", rng.integers(1, n_cust + 1, m), max(6, len(str(n_cust)))),
+            "PRODUCT_CD": _ids("P", rng.integers(1, len(CATEGORIES) * 3 + 1, m), 3),
+            "CONTRACT_DATE": _dates(rng, q_start, q_end, m),
+            "CLS_YYMM": quarter,
+            "STATUS": _weighted(rng, ["01", "02", "03", "04", "05"], [70, 15, 10, 3, 2], m),
+            "CONTRACT_AMT": rng.integers(1, 501, m) * 10000,
+        })
+
+
+def gen_payments(sf, seed, quarter, qi):
+    q_start, q_end = _quarter_range(quarter)
+    for ci, seq, width in _contract_chunks(sf, quarter):
+        rng = _rng(seed, "04_payment", qi, ci)
+        counts = _weighted(rng, [1, 2, 3], [30, 50, 20], len(seq))
+        pay_seq = np.repeat(seq, counts)
+        # 계약 내 순번 (1..count)
+        sub = np.arange(len(pay_seq)) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+        m = len(pay_seq)
+        yield pd.DataFrame({
+            "PAYMENT_ID": np.char.add(_ids(f"PM{quarter}", pay_seq, width), sub.astype(str)),
+            "CONTRACT_ID": _ids(f"CT{quarter}", pay_seq, width),
+            "PAYMENT_DATE": _dates(rng, q_start, q_end, m),
+            "PAYMENT_AMT": rng.integers(1, 101, m) * 10000,
+            "PAYMENT_TYPE": np.array(["01", "02", "03"])[rng.integers(0, 3, m)],
+        })
+
+
+def gen_claims(sf, seed, quarter, qi):
+    q_start, q_end = _quarter_range(quarter)
+    for ci, seq, width in _contract_chunks(sf, quarter):
+        rng = _rng(seed, "05_claim", qi, ci)
+        sel = seq[rng.random(len(seq)) < CLAIM_RATIO]
+        m = len(sel)
+        yield pd.DataFrame({
+            "CLAIM_ID": _ids(f"CL{quarter}", sel, width),
+            "CONTRACT_ID": _ids(f"CT{quarter}", sel, width),
+            "CLAIM_DATE": _dates(rng, q_start, q_end, m),
+            "CLAIM_AMT": rng.integers(10, 5001, m) * 10000,
+            "CLAIM_TYPE": np.array(["01", "02", "03", "04", "05"])[rng.integers(0, 5, m)],
+            "STATUS": _weighted(rng, ["01", "02", "03", "04", "05"], [10, 20, 60, 5, 5], m),
+        })
+
+
+def gen_contract_agent(sf, seed, quarter, qi):
+    n_agents = N_AGENTS * sf
+    for ci, seq, width in _contract_chunks(sf, quarter):
+        rng = _rng(seed, "08_contract_agent", qi, ci)
+        yield pd.DataFrame({
+            "CONTRACT_ID": _ids(f"CT{quarter}", seq, width),
+            "AGENT_ID": _ids("A", rng.integers(1, n_agents + 1, len(seq)), max(4, len(str(n_agents)))),
+        })
+
+
+MASTER_TABLES = {
+    "02_customer": gen_customers,
+    "03_product": gen_products,
+    "06_agent": gen_agents,
+    "07_branch": gen_branches,
+    "09_rate": gen_rates,
+    "10_code": gen_codes,
+}
+QUARTER_TABLES = {
+    "01_contract": gen_contracts,
+    "04_payment": gen_payments,
+    "05_claim": gen_claims,
+    "08_contract_agent": gen_contract_agent,
+}
 
 
 # ────────────────────────────────────────
+# 작업 단위: 파일 1개
+# ────────────────────────────────────────
+
+def _run_task(out_dir: str, fmt: str, sf: int, seed: int, sql: str, quarter: str = None, qi: int = 0):
+    path = Path(out_dir) / _file_name(sql, fmt, quarter)
+    start = time.time()
+    if quarter:
+        frames = QUARTER_TABLES[sql](sf, seed, quarter, qi)
+    else:
+        frames = MASTER_TABLES[sql](sf, seed)
+
+    writer = _ChunkWriter(path, fmt)
+    try:
+        for df in frames:
+            writer.write(df)
+    finally:
+        writer.close()
+    return path.name, writer.rows, time.time() - start
+
 
 def main():
-    print(f"출력: {OUT_DIR.resolve()}\n")
-
-    print("=== 마스터 테이블 ===")
-    customer_ids = gen_customers(10000)
-    product_cds = gen_products()
-    branch_cds = gen_branches()
-    agent_ids = gen_agents(branch_cds, 200)
-    gen_rates(product_cds)
-    gen_codes()
-
-    print("\n=== 분기별 테이블 ===")
-    for q in QUARTERS:
-        print(f"\n--- {q} ---")
-        cids = gen_contracts(customer_ids, product_cds, q, 12500)
-        gen_payments(cids, q)
-        gen_claims(cids, q)
-        gen_contract_agent(cids, agent_ids, q)
-
-    total_files = len(list(OUT_DIR.glob("*.csv")))
+    ap = argparse.ArgumentParser(description="ELT Runner test data generator (scale factor)")
+    ap.add_argument("--sf", type=int, default=1, help="scale factor (default 1 ≈ 21만 행)")
+    ap.add_argument("--format", choices=list(EXT), default="csv", help="csv | csv.gz | parquet")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="병렬 프로세스 수")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--out", default=str(OUT_DIR), help=f"출력 폴더 (default {OUT_DIR})")
+    args = ap.parse_args()
+
+    if args.sf < 1:
+        ap.error("--sf must be >= 1")
+    if args.format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            ap.error("--format parquet requires pyarrow (pip install pyarrow)")
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    print(f"출력: {out_dir.resolve()}")
+    print(f"SF={args.sf} format={args.format} workers={args.workers} seed={args.seed}\n")
+
+    # 큰 작업(분기 테이블)부터 제출 → 프로세스 부하 균형
+    tasks = [(sql, q, qi) for sql in ("04_payment", "01_contract", "08_contract_agent", "05_claim")
+             for qi, q in enumerate(QUARTERS)]
+    tasks += [(sql, None, 0) for sql in MASTER_TABLES]
+
+    start = time.time()
     total_rows = 0
-    for f in OUT_DIR.glob("*.csv"):
-        with open(f, encoding="utf-8") as fh:
-            total_rows += sum(1 for _ in fh) - 1
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        futures = [executor.submit(_run_task, str(out_dir), args.format, args.sf, args.seed, sql, q, qi)
+                   for sql, q, qi in tasks]
+        for f in as_completed(futures):
+            name, rows, elapsed = f.result()
+            total_rows += rows
+            print(f"  {name}: {rows:,} rows ({elapsed:.1f}s)")
+
+    elapsed = time.time() - start
     print(f"\n{'='*50}")
-    print(f"완료: CSV {total_files}개 | 총 {total_rows:,}행")
+    print(f"완료: 파일 {len(tasks)}개 | 총 {total_rows:,}행 | {elapsed:.1f}s "
+          f"({total_rows / elapsed if elapsed else 0:,.0f} rows/s)")
     print(f"\n다음 단계:")
     print(f"  python runner.py --job jobs/test_insurance.yml")
 
@@ -16,7 +16,9 @@ if "NUMEXPR_MAX_THREADS" not in os.environ:
 
 from engine.stage_registry import STAGE_REGISTRY
 from engine.runtime_state import stop_event
+from engine.connection import ConnectionManager
 from engine.context import RunContext
+from engine.resources import create_budget, describe_budget, enter_stage
 import signal
 
 
@@ -252,6 +254,7 @@ def run_pipeline(ctx: RunContext):
 
         ctx.logger.info("[%d/%d] %s", idx, len(stages), stage_name.upper())
         ctx.logger.info("-" * 60)
+        enter_stage(ctx, stage_name)
 
         start = time.time()
         stage_func(ctx)
@@ -407,6 +410,8 @@ def main():
         include_patterns=args.include_patterns or [],
         stage_filter=args.stage_filter or [],
     )
+    ctx.resources = create_budget(ctx, job_config.get("resources"))
+    ctx.connections = ConnectionManager(ctx)
 
     # ── JOB START 헤더 로그 ──────────────────────────────
     source_sel = job_config.get("source", {})
@@ -431,6 +436,8 @@ def main():
     logger.info(" Overwrite : %s", export_cfg.get("overwrite", False))
     logger.info(" Workers   : %s", export_cfg.get("parallel_workers", 1))
     logger.info(" Timeout   : %ss", export_cfg.get("timeout_seconds", 1800))
+    if ctx.resources:
+        logger.info(" Resources : %s", describe_budget(ctx.resources))
 
     if params:
         logger.info(" Params    : %s", ", ".join(f"{k}={v}" for k, v in params.items()))
@@ -491,7 +498,10 @@ def main():
     run_dir = export_base / job_name / run_id
     write_run_info(run_dir, ctx, start_time_str)
 
-    run_pipeline(ctx)
+    try:
+        run_pipeline(ctx)
+    finally:
+        ctx.connections.close_all()
     elapsed = time.time() - job_start_time   
     logger.info("Job finished | elapsed=%.2fs", elapsed)  
 
@@ -12,8 +12,11 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from adapters.sources.oracle_client import init_oracle_client, get_oracle_conn
 from adapters.sources.vertica_client import get_vertica_conn
 from engine.context import RunContext
+from engine.hash_utils import resolve_hash_algo
+from engine.manifest import MANIFEST_FILE, file_entry, find_manifest, index_manifest, read_manifest, write_manifest
 from engine.path_utils import resolve_path
-from engine.sql_utils import sort_sql_files, render_sql, detect_used_params, _strip_sql_comments
+from engine.resources import stage_threads
+from engine.sql_utils import sort_sql_files, render_sql, detect_used_params, resolve_table_name, _strip_sql_comments
 from engine.runtime_state import stop_event
 
 
@@ -48,6 +51,12 @@ def get_thread_connection(source_type, env_cfg, host_name):
         host_cfg = vertica_cfg["hosts"].get(host_name)
         conn = get_vertica_conn(host_cfg)
 
+    elif source_type == "simulated":
+        # 벤치마크용 가짜 소스 (bench_export.py)
+        from adapters.sources.simulated_client import get_simulated_conn
+        sim_cfg = env_cfg.get("sources", {}).get("simulated", {})
+        conn = get_simulated_conn((sim_cfg.get("hosts") or {}).get(host_name))
+
     else:
         raise ValueError(f"Unsupported source type: {source_type}")
 
@@ -293,6 +302,7 @@ def run_plan(ctx, sql_files, export_cfg, out_dir, ext, name_style="full"):
             "compression": export_cfg.get("compression", "none"),
             "overwrite": export_cfg.get("overwrite", False),
             "parallel_workers": export_cfg.get("parallel_workers", 1),
+            "fetch_size": export_cfg.get("fetch_size", 10000),
         },
         "total_tasks": len(tasks),
         "warning_count": sum(1 for t in tasks if t["warnings"]),
@@ -503,8 +513,9 @@ def run(ctx: RunContext):
     compression = export_cfg.get("compression", "none")
     overwrite = export_cfg.get("overwrite", False)
     backup_keep = export_cfg.get("backup_keep", 10)
-    parallel_workers = export_cfg.get("parallel_workers", 1)
+    parallel_workers = stage_threads(ctx, "workers", export_cfg.get("parallel_workers", 1))
     name_style = export_cfg.get("csv_name_style", "full")
+    fetch_size = int(export_cfg.get("fetch_size", 10000))
 
     ext = "csv.gz" if compression == "gzip" else "csv"
 
@@ -528,6 +539,23 @@ def run(ctx: RunContext):
 
     stall_seconds = export_cfg.get("timeout_seconds", 1800)
 
+    # ── manifest: load stage와 같은 해시 알고리즘으로 쓰면서 계산 ──
+    hash_algo = resolve_hash_algo(job_cfg.get("load", {}).get("hash", "sha256"))
+    manifest_path = run_info_path.parent / MANIFEST_FILE
+    manifest_entries = {}
+    manifest_lock = threading.Lock()
+    prev_manifest_path, _ = find_manifest(export_base / ctx.job_name, ctx.run_id)
+    prev_entries = index_manifest(read_manifest(prev_manifest_path), out_dir) if prev_manifest_path else {}
+    table_names = {}
+
+    def _carry_forward(out_file, base):
+        """이번 run에서 export하지 않은 기존 파일 → 이전 manifest 항목(없으면 stat만) 유지"""
+        if not out_file.exists():
+            return
+        entry = prev_entries.get(out_file) or file_entry(out_file, **base)
+        with manifest_lock:
+            manifest_entries[out_file.name] = entry
+
     def _export_one(sql_file, param_set, idx, total_sql, param_idx, total_param):
 
         if stop_event.is_set():
@@ -537,9 +565,21 @@ def run(ctx: RunContext):
         task_key = _make_task_key(sql_file, param_set)
         prefix = build_log_prefix(sql_file, param_set)
 
+        csv_name = build_csv_name(
+            sqlname=sql_file.stem,
+            host=host_name,
+            params=param_set,
+            ext=ext,
+            name_style=name_style,
+        )
+        out_file = out_dir / csv_name
+        entry_base = {"sql_file": sql_file.name, "table": table_names.get(sql_file),
+                      "params": param_set}
+
         # retry 모드: failed_task_keys에 없으면 skip
         if failed_task_keys is not None and task_key not in failed_task_keys:
             logger.info("%s RETRY skip (succeeded in previous run)", prefix)
+            _carry_forward(out_file, entry_base)
             return
 
         # task 시작 상태 기록
@@ -553,18 +593,9 @@ def run(ctx: RunContext):
             else:
                 from adapters.sources.oracle_source import export_sql_to_csv as export_func
 
-            csv_name = build_csv_name(
-                sqlname=sql_file.stem,
-                host=host_name,
-                params=param_set,
-                ext=ext,
-                name_style=name_style,
-            )
-
-            out_file = out_dir / csv_name
-
             if out_file.exists() and not overwrite and ctx.mode != "retry":
                 logger.info("%s skip (already exists)", prefix)
+                _carry_forward(out_file, entry_base)
                 _update_task_status(run_info_path, task_key, "skipped")
                 return
 
@@ -580,6 +611,7 @@ def run(ctx: RunContext):
             rendered_sql = sanitize_sql(render_sql(sql_text, param_set))
 
             start_time = time.time()
+            meta = {}
 
             rows = export_func(
                 conn=conn,
@@ -587,14 +619,20 @@ def run(ctx: RunContext):
                 out_file=out_file,
                 logger=logger,
                 compression=compression,
-                fetch_size=10000,
+                fetch_size=fetch_size,
                 stall_seconds=stall_seconds,
                 log_prefix=prefix,
+                hash_algo=hash_algo,
+                meta=meta,
             )
 
             elapsed = time.time() - start_time
             size_mb = out_file.stat().st_size / (1024 * 1024) if out_file.exists() else 0
 
+            if "hash" in meta and out_file.exists():
+                with manifest_lock:
+                    manifest_entries[out_file.name] = file_entry(out_file, **entry_base, **meta)
+
             logger.info(
                 "%s EXPORT done rows=%d size=%.2fMB elapsed=%.2fs",
                 prefix,
@@ -616,6 +654,7 @@ def run(ctx: RunContext):
 
     tasks = []
     for idx, sql_file in enumerate(sql_files, 1):
+        table_names[sql_file] = resolve_table_name(sql_file)
         sql_text_raw = sql_file.read_text(encoding="utf-8")
         used_keys = detect_used_params(sql_text_raw, ctx.params)
         relevant_params = {k: v for k, v in ctx.params.items() if k in used_keys}
@@ -645,4 +684,10 @@ def run(ctx: RunContext):
                         break
                     f.result()
     finally:
-        _close_all_connections(logger)
\ No newline at end of file
+        _close_all_connections(logger)
+        if manifest_entries:
+            try:
+                write_manifest(manifest_path, ctx.job_name, ctx.run_id, list(manifest_entries.values()))
+                logger.info("EXPORT manifest written | files=%d | %s", len(manifest_entries), manifest_path)
+            except Exception as e:
+                logger.warning("EXPORT manifest write failed: %s", e)
\ No newline at end of file
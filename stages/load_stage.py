@@ -1,24 +1,61 @@
 # file: v2/stages/load_stage.py
 
-import hashlib
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from engine.connection import connect_target
+from engine.connection import acquire_target, release_target
 from engine.context import RunContext
+from engine.csv_reader import resolve_csv_reader
+from engine.hash_utils import HashCache, cached_hash_file, resolve_hash_algo
+from engine.manifest import find_manifest, index_manifest, read_manifest
 from engine.path_utils import resolve_path
-from engine.sql_utils import sort_sql_files, resolve_table_name, extract_sqlname_from_csv, extract_params_from_csv
-
-
-def _sha256_file(path: Path, chunk_size: int = 8 * 1024 * 1024) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        while True:
-            b = f.read(chunk_size)
-            if not b:
-                break
-            h.update(b)
-    return h.hexdigest()
+from engine.resources import stage_threads
+from engine.sql_utils import (sort_sql_files, resolve_table_name, resolve_table_keys,
+                              extract_sqlname_from_csv, extract_params_from_csv)
+
+HASH_CACHE_FILE = "_hash_cache.json"
+
+
+def _start_hashing(logger, csv_files, export_dir, load_cfg, manifest_index=None, max_workers=None):
+    """
+    CSV 해시를 백그라운드 스레드에서 loader보다 앞서 계산한다.
+    load.hash          : sha256(기본) | xxh3 | blake3 | blake2b
+    load.hash_cache    : true(기본) — (path, size, mtime_ns) 캐시로 변경 없는 파일은 재해시 안 함
+    load.hash_workers  : 해시 스레드 수 (기본 2, max_workers로 상한 — resources 예산)
+    manifest에 같은 알고리즘의 해시가 있는 파일은 읽지 않는다.
+    반환: (hash_of(path) -> str, close())
+    """
+    algo = resolve_hash_algo(load_cfg.get("hash", "sha256"))
+    cache = HashCache(export_dir / HASH_CACHE_FILE) if load_cfg.get("hash_cache", True) else None
+    workers = max(1, int(load_cfg.get("hash_workers", 2)))
+    if max_workers:
+        workers = min(workers, max_workers)
+
+    known = {
+        p: e["hash"] for p, e in (manifest_index or {}).items()
+        if e.get("hash") and e.get("hash_algo") == algo
+    }
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hash")
+    futures = {p: executor.submit(cached_hash_file, p, algo, cache) for p in csv_files if p not in known}
+    logger.info("LOAD hash=%s | cache=%s | workers=%d | from_manifest=%d",
+                algo, "on" if cache else "off", workers, len(csv_files) - len(futures))
+
+    def hash_of(path):
+        if path in known:
+            return known[path]
+        fut = futures.get(path)
+        return fut.result() if fut else cached_hash_file(path, algo, cache)
+
+    def close():
+        for f in futures.values():
+            f.cancel()
+        executor.shutdown(wait=True)
+        if cache:
+            cache.prune()
+            cache.save()
+
+    return hash_of, close
 
 
 def _human_size(nbytes: int) -> str:
@@ -29,18 +66,200 @@ def _human_size(nbytes: int) -> str:
     return f"{nbytes:.1f}TB"
 
 
-def _collect_csv_info(csv_files, sql_map):
+def _table_resolver(sql_map, manifest_index=None):
+    """
+    csv → target 테이블명 함수. manifest 항목에 table이 있으면 SQL 파일을 열지 않는다.
+    SQL 매핑이 없으면 None.
+    """
+    manifest_index = manifest_index or {}
+    cache = {}
+
+    def table_of(csv_path):
+        entry = manifest_index.get(csv_path)
+        if entry and entry.get("table"):
+            return entry["table"]
+        sqlname = extract_sqlname_from_csv(csv_path)
+        if sqlname not in cache:
+            sql_file = sql_map.get(sqlname)
+            cache[sqlname] = resolve_table_name(sql_file) if sql_file else None
+        return cache[sqlname]
+
+    return table_of
+
+
+def _keys_resolver(logger, sql_map, table_of, merge_keys_cfg=None):
+    """
+    csv → merge 키 컬럼 목록 함수.
+    load.merge_keys({테이블: [컬럼] 또는 "A,B"}, 테이블명 대소문자 무시)가 SQL 힌트(--[TABLE] keys=A,B)보다 우선.
+    형식이 잘못된 설정(예: --set load.merge_keys=CONTRACT_ID)은 경고 후 무시 → SQL 힌트만 사용.
+    """
+    if merge_keys_cfg and not isinstance(merge_keys_cfg, dict):
+        logger.warning("load.merge_keys must be a mapping {TABLE: [COL, ...]} (got %r) → ignored, "
+                       "using SQL hints only", merge_keys_cfg)
+        merge_keys_cfg = None
+    configured = {}
+    for table, keys in (merge_keys_cfg or {}).items():
+        if isinstance(keys, str):
+            keys = keys.split(",")
+        elif not isinstance(keys, (list, tuple)):
+            logger.warning("load.merge_keys.%s must be a list or \"A,B\" (got %r) → ignored", table, keys)
+            continue
+        configured[str(table).upper()] = [str(k).strip() for k in keys if str(k).strip()]
+    cache = {}
+
+    def keys_of(csv_path):
+        table = table_of(csv_path)
+        if table and table.upper() in configured:
+            return configured[table.upper()]
+        sqlname = extract_sqlname_from_csv(csv_path)
+        if sqlname not in cache:
+            sql_file = sql_map.get(sqlname)
+            cache[sqlname] = resolve_table_keys(sql_file) if sql_file else None
+        return cache[sqlname]
+
+    return keys_of
+
+
+def _post_load_specs(post_cfg: dict, tables: list) -> list:
+    """
+    load.post_load 설정 → [(table, indexes, analyze), ...] (이번 load 대상 테이블만, 할 일 없는 테이블 제외)
+      post_load:
+        analyze: true                     # 적재한 모든 테이블 통계 갱신 (테이블별 analyze로 override)
+        tables:
+          TB_CONTRACT:                    # 테이블명 대소문자 무시
+            indexes:
+              - [CUSTOMER_ID, CLS_YYMM]   # 또는 "CUSTOMER_ID,CLS_YYMM"
+              - {columns: [CONTRACT_ID], unique: true, name: UX_CONTRACT}
+    인덱스 이름 생략 시 IX_{테이블}_{순번}
+    """
+    post_cfg = post_cfg or {}
+    table_cfgs = {str(t).upper(): c or {} for t, c in (post_cfg.get("tables") or {}).items()}
+    specs = []
+    for table in tables:
+        tcfg = table_cfgs.get(table.upper(), {})
+        indexes = []
+        for i, idx in enumerate(tcfg.get("indexes") or [], 1):
+            if not isinstance(idx, dict):
+                idx = {"columns": idx}
+            cols = idx.get("columns") or []
+            if isinstance(cols, str):
+                cols = cols.split(",")
+            cols = [str(c).strip() for c in cols if str(c).strip()]
+            if cols:
+                indexes.append({"name": idx.get("name") or f"IX_{table.upper()[:24]}_{i}",
+                                "columns": cols, "unique": bool(idx.get("unique", False))})
+        analyze = bool(tcfg.get("analyze", post_cfg.get("analyze", False)))
+        if indexes or analyze:
+            specs.append((table, indexes, analyze))
+    return specs
+
+
+def _run_post_load(logger, specs: list, post_fn, workers: int = 1):
+    """
+    post_fn(table, indexes, analyze) → {"indexes": n, "analyze": bool} 를 테이블별 실행.
+    workers>1 이면 테이블 단위 병렬 (post_fn이 테이블마다 별도 커넥션을 써야 함).
+    """
+    if not specs:
+        return
+    start = time.time()
+
+    def _one(table, indexes, analyze):
+        t0 = time.time()
+        try:
+            res = post_fn(table, indexes, analyze)
+        except Exception as e:
+            logger.error("POST_LOAD failed | table=%s | %s", table, e)
+            return False
+        logger.info("POST_LOAD done | table=%s indexes=%d analyze=%s elapsed=%.2fs",
+                    table, res["indexes"], res["analyze"], time.time() - t0)
+        return True
+
+    if workers > 1 and len(specs) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(specs))) as executor:
+            results = list(executor.map(lambda s: _one(*s), specs))
+    else:
+        results = [_one(*s) for s in specs]
+    failed = results.count(False)
+
+    logger.info("POST_LOAD summary | tables=%d failed=%d elapsed=%.2fs",
+                len(specs), failed, time.time() - start)
+
+
+def _discover_csv_files(ctx, logger, export_dir, use_manifest: bool, extensions=(".csv", ".csv.gz")):
+    """
+    로드 대상 CSV 목록 + manifest 인덱스.
+    이번 run의 manifest가 있고 모든 항목이 유효하면 디렉토리 스캔 없이 manifest 목록을 사용,
+    아니면 디렉토리를 스캔하고 (가장 최근) manifest는 메타데이터(테이블·해시)로만 사용한다.
+    extensions: 디렉토리 스캔 대상 확장자 (load.mode=view는 .parquet 포함)
+    반환: (csv_files, {Path: entry})
+    """
+    manifest_index = {}
+    if use_manifest:
+        m_path, is_current = find_manifest(export_dir, ctx.run_id)
+        manifest = read_manifest(m_path) if m_path else None
+        if manifest:
+            manifest_index = index_manifest(manifest, export_dir)
+            if is_current and len(manifest_index) == len(manifest["files"]):
+                logger.info("LOAD using manifest | files=%d | %s", len(manifest_index), m_path)
+                return sorted(manifest_index), manifest_index
+            logger.debug("LOAD manifest metadata only | valid=%d/%d | %s",
+                         len(manifest_index), len(manifest["files"]), m_path)
+
+    csv_files = sorted([
+        p for p in export_dir.iterdir()
+        if p.is_file() and p.name.endswith(tuple(extensions))
+    ])
+    return csv_files, manifest_index
+
+
+def _view_glob(path: Path) -> str:
+    """export 파일 → 같은 SQL 파일의 모든 export를 가리키는 glob ({sqlname}__*{확장자})"""
+    name = path.name
+    ext = next((e for e in (".csv.gz", ".csv", ".parquet") if name.endswith(e)), path.suffix)
+    return (path.parent / f"{extract_sqlname_from_csv(path)}__*{ext}").as_posix()
+
+
+def _run_view_load(logger, conn, job_name, csv_files, table_of, schema, with_params: bool):
+    """
+    load.mode=view (DuckDB): 테이블마다 export 파일 glob 위에 VIEW 생성 — 데이터 복사·해시·적재 이력 없음.
+    glob은 SQL 파일 단위라 조회 시점에 있는 해당 SQL의 export 파일 전체가 보인다.
+    with_params: 파일명 파라미터를 컬럼으로 추가 (load.view_params)
+    """
+    from adapters.targets.duckdb_target import create_view, _ensure_schema, _ensure_history
+    if schema:
+        _ensure_schema(conn, schema)
+    _ensure_history(conn, schema)   # 테이블 → VIEW 전환 시 이력 삭제용
+
+    groups, no_sql = _group_csv_by_table(csv_files, table_of)
+    for csv_path in no_sql:
+        logger.warning("CSV skip (sql not found): %s", csv_path.name)
+
+    created = 0
+    failed = 0
+    for table_name, paths in groups:
+        sources = sorted({_view_glob(p) for p in paths})
+        param_keys = list(dict.fromkeys(k for p in paths for k in extract_params_from_csv(p))) \
+            if with_params else []
+        try:
+            create_view(conn, table_name, sources, schema, param_keys, job_name=job_name)
+            created += 1
+        except Exception as e:
+            failed += 1
+            logger.error("VIEW failed | table=%s | %s", table_name, e)
+
+    logger.info("LOAD summary | views=%d skipped=%d failed=%d", created, len(no_sql), failed)
+
+
+def _collect_csv_info(csv_files, table_of):
     """CSV 파일 목록에 대해 테이블 매핑·크기 정보를 수집한다 (stat만 사용, 파일 내용 미읽음)."""
     items = []
     for csv_path in csv_files:
-        sqlname = extract_sqlname_from_csv(csv_path)
-        sql_file = sql_map.get(sqlname)
-        table_name = resolve_table_name(sql_file) if sql_file else None
+        table_name = table_of(csv_path)
         size = csv_path.stat().st_size
         items.append({
             "csv_file": csv_path.name,
             "table": table_name,
-            "sql_found": sql_file is not None,
+            "sql_found": table_name is not None,
             "size": size,
             "size_h": _human_size(size),
         })
@@ -71,10 +290,28 @@ def run(ctx: RunContext):
             return
         export_dir = export_base
 
-    csv_files = sorted([
-        p for p in export_dir.iterdir()
-        if p.is_file() and p.name.endswith((".csv", ".csv.gz"))
-    ])
+    load_cfg = job_cfg.get("load", {})
+    tgt_type = (target_cfg.get("type") or "").strip().lower()
+    schema = (target_cfg.get("schema") or "").strip() or None  # None이면 스키마 없음
+
+    # ── load.mode 결정 (target 기본값: Oracle delete / 그 외 replace) ──
+    default_mode = "delete" if tgt_type == "oracle" else "replace"
+    load_mode = load_cfg.get("mode", default_mode)
+    if load_mode == "view" and tgt_type != "duckdb":
+        logger.warning("load.mode=view is DuckDB only (target=%s), using %s", tgt_type, default_mode)
+        load_mode = default_mode
+    if tgt_type == "oracle" and load_mode in ("replace", "truncate"):
+        logger.warning("Oracle: load.mode=%s not supported, falling back to delete", load_mode)
+        load_mode = "delete"
+    if load_mode not in ("replace", "truncate", "append", "delete", "merge", "view"):
+        logger.warning("Unknown load.mode=%s, using %s", load_mode, default_mode)
+        load_mode = default_mode
+
+    # parquet은 DuckDB view 모드에서만 (그 외 loader는 CSV만 읽음)
+    extensions = ((".csv", ".csv.gz", ".parquet") if load_mode == "view" and tgt_type == "duckdb"
+                  else (".csv", ".csv.gz"))
+    csv_files, manifest_index = _discover_csv_files(ctx, logger, export_dir,
+                                                    load_cfg.get("use_manifest", True), extensions)
     if not csv_files:
         if ctx.mode == "plan":
             logger.info("LOAD [PLAN] CSV 파일 없음 — export 실행 후 확인 가능 (%s)", export_dir)
@@ -85,6 +322,7 @@ def run(ctx: RunContext):
     sql_dir = resolve_path(ctx, export_cfg.get("sql_dir", "sql/export"))
     sql_files = sort_sql_files(sql_dir)
     sql_map = {p.stem: p for p in sql_files}
+    table_of = _table_resolver(sql_map, manifest_index)
 
     # ── --include 필터: export와 동일하게 CSV도 필터링 ──
     include_patterns = getattr(ctx, "include_patterns", []) or []
@@ -102,25 +340,9 @@ def run(ctx: RunContext):
                            include_patterns)
             return
 
-    tgt_type = (target_cfg.get("type") or "").strip().lower()
-    schema = (target_cfg.get("schema") or "").strip() or None  # None이면 스키마 없음
-
-    # ── load.mode 결정 ──
-    load_cfg = job_cfg.get("load", {})
-    if tgt_type == "oracle":
-        load_mode = load_cfg.get("mode", "delete")
-        if load_mode in ("replace", "truncate"):
-            logger.warning("Oracle: load.mode=%s not supported, falling back to delete", load_mode)
-            load_mode = "delete"
-    else:
-        load_mode = load_cfg.get("mode", "replace")
-    if load_mode not in ("replace", "truncate", "append", "delete"):
-        logger.warning("Unknown load.mode=%s, using replace", load_mode)
-        load_mode = "replace"
-
     # ── PLAN 모드: 사전 확인 리포트 ──
     if ctx.mode == "plan":
-        _run_load_plan(ctx, logger, csv_files, sql_map, tgt_type, schema, load_mode)
+        _run_load_plan(ctx, logger, csv_files, table_of, tgt_type, schema, load_mode)
         return
 
     if schema:
@@ -133,46 +355,236 @@ def run(ctx: RunContext):
     # ----------------------------------------
     # 연결 팩토리 사용 + Adapter별 초기화
     # ----------------------------------------
-    conn, conn_type, label = connect_target(ctx, target_cfg)
+    conn, conn_type, label = acquire_target(ctx, target_cfg)
     logger.info("LOAD target=%s", label)
 
+    if load_mode == "view":
+        try:
+            _run_view_load(logger, conn, ctx.job_name, csv_files, table_of, schema,
+                           bool(load_cfg.get("view_params", False)))
+        finally:
+            release_target(ctx, conn)
+        return
+
+    hashable = [p for p in csv_files if table_of(p)]
+    hash_of, close_hashing = _start_hashing(logger, hashable, export_dir, load_cfg, manifest_index,
+                                            max_workers=stage_threads(ctx, "hash"))
+
+    # 소스 컬럼 타입 (export manifest) → 테이블 자동 생성 시 사용
+    def columns_of(csv_path):
+        return (manifest_index.get(csv_path) or {}).get("columns")
+
+    workers = max(1, stage_threads(ctx, "workers", int(load_cfg.get("parallel_workers", 1))))
+    if workers > 1:
+        logger.info("LOAD parallel_workers=%d", workers)
+
+    # replace/truncate: 마지막 적재와 파일 해시가 모두 같은 테이블은 DROP·재적재 생략
+    skip_unchanged = (bool(load_cfg.get("skip_unchanged", False))
+                      and load_mode in ("replace", "truncate") and ctx.mode != "retry")
+    if skip_unchanged:
+        logger.info("LOAD skip_unchanged=true (tables identical to last load are kept)")
+
+    # append/merge skip 판단용 적재 이력은 파일마다 조회하지 않고 시작 시 한 번에 가져온다
+    prefetch_history = load_mode in ("append", "merge") and ctx.mode != "retry"
+
+    # 적재 완료 후 인덱스·통계 (load.post_load) — 이번 실행에서 적재된 테이블만
+    post_cfg = load_cfg.get("post_load")
+
+    # merge: 테이블별 키 컬럼 (SQL 힌트 / load.merge_keys)
+    keys_of = _keys_resolver(logger, sql_map, table_of, load_cfg.get("merge_keys"))
+    if load_mode == "merge":
+        for table, csv_paths in _group_csv_by_table(csv_files, table_of)[0]:
+            keys = keys_of(csv_paths[0])
+            if keys:
+                logger.info("LOAD merge keys | %s | %s", table, ",".join(keys))
+            else:
+                logger.warning("LOAD merge keys not declared | %s (--[%s] keys=... or load.merge_keys)",
+                               table, table)
+
     try:
         if conn_type == "duckdb":
-            from adapters.targets.duckdb_target import load_csv, _ensure_schema, _ensure_history
+            from adapters.targets.duckdb_target import (load_csv, load_csv_group, parse_csv_group,
+                                                        is_unchanged, load_catalog, post_load,
+                                                        drop_views, has_unique_index,
+                                                        _ensure_schema, _ensure_history)
             if schema:
                 _ensure_schema(conn, schema)
             _ensure_history(conn, schema)
-            _run_load_loop(ctx, logger, csv_files, sql_map, conn_type,
-                           load_fn=lambda table, csv_path, file_hash:
-                               load_csv(conn, ctx.job_name, table, csv_path, file_hash,
-                                        ctx.mode, schema, load_mode=load_mode))
+            drop_views(conn, [t for t, _ in _group_csv_by_table(csv_files, table_of)[0]], schema,
+                       job_name=ctx.job_name)
+            catalog = load_catalog(conn, ctx.job_name, schema, prefetch=prefetch_history)
+            # delete: 그룹 적재는 1 트랜잭션 안에서 같은 키를 DELETE 후 다시 INSERT →
+            # UNIQUE 인덱스/PK가 있는 테이블은 DuckDB가 키 중복으로 거부하므로 처음부터 파일 단위로 적재
+            # (prepare worker 스레드에서 연결을 쓰지 않도록 시작 전에 한 번 조회)
+            per_file_tables = set()
+            if load_mode == "delete":
+                per_file_tables = {t for t, _ in _group_csv_by_table(csv_files, table_of)[0]
+                                   if has_unique_index(conn, t, schema)}
+                for t in sorted(per_file_tables):
+                    logger.info("LOAD mode=delete | %s has unique index → per-file load", t)
+
+            def _per_file(table):
+                return table in per_file_tables
+
+            def load_fn(table, csv_path, file_hash, lm):
+                return load_csv(conn, ctx.job_name, table, csv_path, file_hash,
+                                _history_mode(ctx, load_mode, lm), schema,
+                                load_mode=lm, run_id=ctx.run_id, catalog=catalog,
+                                merge_keys=keys_of(csv_path),
+                                params=extract_params_from_csv(csv_path))
+
+            def load_group_fn(table, csv_paths, file_hashes, prepared):
+                if _per_file(table):
+                    return _load_files(logger, table, csv_paths, file_hashes, load_mode, load_fn)
+                return load_csv_group(conn, ctx.job_name, table, csv_paths, file_hashes,
+                                      ctx.mode, schema, load_mode=load_mode,
+                                      staged=prepared, run_id=ctx.run_id, catalog=catalog,
+                                      file_params=[extract_params_from_csv(p) for p in csv_paths])
+
+            # 병렬: cursor들이 다음 테이블 CSV를 Arrow로 미리 파싱, 적재(write)는 단일 커넥션
+            prepare_fn = None
+            if workers > 1 and load_mode != "merge":
+                try:
+                    import pyarrow  # noqa: F401  (fetch_arrow_table)
+                    prepare_fn = (lambda table, csv_paths:
+                                  None if _per_file(table) else parse_csv_group(conn, csv_paths))
+                except ImportError:
+                    logger.warning("DuckDB: parallel_workers requires pyarrow → serial load")
+            loaded_tables = _run_group_load_loop(
+                ctx, logger, csv_files, table_of, load_mode, hash_of,
+                # merge는 파일 단위(키 기준 upsert)로 적재 → 그룹 일괄 적재 미사용
+                load_group_fn=None if load_mode == "merge" else load_group_fn,
+                load_fn=load_fn,
+                prepare_fn=prepare_fn, workers=workers,
+                unchanged_fn=(lambda table, file_hashes:
+                              is_unchanged(conn, ctx.job_name, table, file_hashes, schema))
+                if skip_unchanged else None)
+            # 단일 커넥션 → 순차 (인덱스 생성·ANALYZE는 DuckDB 내부에서 병렬 처리)
+            _run_post_load(logger, _post_load_specs(post_cfg, loaded_tables),
+                           lambda table, indexes, analyze: post_load(conn, table, indexes, analyze, schema))
 
         elif conn_type == "sqlite3":
-            from adapters.targets.sqlite_target import load_csv, _ensure_history
+            from contextlib import nullcontext
+            from adapters.targets.sqlite_target import (load_csv, bulk_session, is_unchanged, load_catalog,
+                                                        post_load, _ensure_history)
             _ensure_history(conn)
+            catalog = load_catalog(conn, ctx.job_name, prefetch=prefetch_history)
+            csv_reader = resolve_csv_reader(load_cfg.get("csv_reader"))
             if schema:
                 logger.info("SQLite: schema not supported, ignoring schema setting (schema=%s)", schema)
-            _run_load_loop(ctx, logger, csv_files, sql_map, conn_type,
-                           load_fn=lambda table, csv_path, file_hash:
-                               load_csv(conn, ctx.job_name, table, csv_path, file_hash,
-                                        ctx.mode, load_mode=load_mode))
+            bulk = bool(target_cfg.get("bulk_mode", False))
+            batch_size = target_cfg.get("batch_size")
+            batch_size = int(batch_size) if batch_size else None
+            session = (bulk_session(conn, int(target_cfg.get("cache_size_mb", 256)))
+                       if bulk else nullcontext())
+            unchanged_fn = ((lambda table, file_hashes: is_unchanged(conn, ctx.job_name, table, file_hashes))
+                            if skip_unchanged else None)
+            with session:
+                if workers > 1 and load_cfg.get("sqlite_shards", False) and load_mode != "merge":
+                    db_path = resolve_path(ctx, target_cfg.get("db_path", "data/local/result.sqlite"))
+                    loaded_tables = _run_sqlite_shard_load(
+                        ctx, logger, conn, csv_files, table_of, load_mode, hash_of,
+                        db_path, workers, bulk, batch_size, columns_of, unchanged_fn, catalog, csv_reader)
+                else:
+                    if workers > 1 and load_mode == "merge":
+                        logger.info("SQLite: load.mode=merge → serial load (sqlite_shards ignored)")
+                    elif workers > 1:
+                        logger.info("SQLite: single writer → serial load "
+                                    "(load.sqlite_shards: true for sharded parallel load)")
+                    loaded_tables = _run_group_load_loop(
+                        ctx, logger, csv_files, table_of, load_mode, hash_of,
+                        load_fn=lambda table, csv_path, file_hash, lm:
+                            load_csv(conn, ctx.job_name, table, csv_path, file_hash,
+                                     _history_mode(ctx, load_mode, lm),
+                                     load_mode=lm, bulk=bulk,
+                                     batch_size=batch_size,
+                                     columns=columns_of(csv_path),
+                                     run_id=ctx.run_id, catalog=catalog,
+                                     csv_reader=csv_reader,
+                                     merge_keys=keys_of(csv_path),
+                                     params=extract_params_from_csv(csv_path)),
+                        unchanged_fn=unchanged_fn)
+            # SQLite writer는 1개 → 순차
+            _run_post_load(logger, _post_load_specs(post_cfg, loaded_tables),
+                           lambda table, indexes, analyze: post_load(conn, table, indexes, analyze))
 
         elif conn_type == "oracle":
-            from adapters.targets.oracle_target import load_csv
-            _run_load_loop(ctx, logger, csv_files, sql_map, conn_type,
-                           load_fn=lambda table, csv_path, file_hash:
-                               load_csv(conn, ctx.job_name, table, csv_path, file_hash,
-                                        ctx.mode, schema, load_mode=load_mode,
-                                        params=extract_params_from_csv(csv_path)))
+            from adapters.targets.oracle_target import load_csv, create_pool, load_catalog, post_load
+            batch_size = int(target_cfg.get("batch_size", 1000))
+            direct_path = bool(target_cfg.get("direct_path", False))
+            if direct_path and load_mode == "append":
+                # batch마다 commit → 중간 실패 시 commit된 row가 남고 이력이 없어 재실행 때 중복 적재
+                logger.warning("Oracle: direct_path is not supported with load.mode=append "
+                               "(partial commits are reloaded on rerun) → conventional insert")
+                direct_path = False
+            batch_errors = bool(target_cfg.get("batch_errors", False))
+            # 대용량 단일 파일 chunk 병렬 적재
+            chunk_workers = int(load_cfg.get("chunk_workers", 1))
+            chunk_min_bytes = int(float(load_cfg.get("chunk_min_mb", 256)) * 1024 * 1024)
+            csv_reader = resolve_csv_reader(load_cfg.get("csv_reader"))
+            # delete 조건 컬럼 = 파티션 키인 테이블은 TRUNCATE PARTITION (row 단위 undo/redo 없음)
+            partition_aware = bool(load_cfg.get("partition_aware", False))
+            logger.info("LOAD oracle | batch_size=%d direct_path=%s batch_errors=%s chunk_workers=%d "
+                        "csv_reader=%s partition_aware=%s", batch_size, direct_path, batch_errors,
+                        chunk_workers, csv_reader, partition_aware)
+
+            # 테이블 worker당 커넥션 1개 + worker마다 chunk 커넥션 → pool 고갈(대기) 없음
+            pool_size = ((workers if workers > 1 else 0)
+                         + (workers * chunk_workers if chunk_workers > 1 else 0))
+            pool = create_pool(ctx.env_config, pool_size) if pool_size else None
+
+            # _LOAD_HISTORY 확인·이력 조회 1회, 딕셔너리 조회는 load 동안 캐시 (병렬 worker 공유)
+            catalog = load_catalog(conn, ctx.job_name, schema, prefetch=prefetch_history)
+
+            def _load_oracle_group(table, csv_paths, file_hashes, prepared=None):
+                c = pool.acquire() if workers > 1 else conn
+                try:
+                    return _load_files(logger, table, csv_paths, file_hashes, load_mode,
+                                       lambda t, csv_path, file_hash, lm:
+                                           load_csv(c, ctx.job_name, t, csv_path, file_hash,
+                                                    _history_mode(ctx, load_mode, lm), schema,
+                                                    load_mode=lm,
+                                                    params=extract_params_from_csv(csv_path),
+                                                    batch_size=batch_size, direct_path=direct_path,
+                                                    batch_errors=batch_errors, pool=pool,
+                                                    chunk_workers=chunk_workers,
+                                                    chunk_min_bytes=chunk_min_bytes,
+                                                    columns=columns_of(csv_path), catalog=catalog,
+                                                    csv_reader=csv_reader,
+                                                    merge_keys=keys_of(csv_path),
+                                                    partition_aware=partition_aware))
+                finally:
+                    if workers > 1:
+                        pool.release(c)
+
+            # post_load: 테이블 단위 병렬 (worker당 pool 커넥션), 인덱스·통계는 degree로 서버 병렬
+            degree = max(1, int((load_cfg.get("post_load") or {}).get("degree", 1)))
+
+            def _post_load_oracle(table, indexes, analyze):
+                c = pool.acquire() if workers > 1 else conn
+                try:
+                    return post_load(c, table, indexes, analyze, schema, degree)
+                finally:
+                    if workers > 1:
+                        pool.release(c)
+
+            try:
+                loaded_tables = _run_group_load_loop(ctx, logger, csv_files, table_of, load_mode, hash_of,
+                                                     load_group_fn=_load_oracle_group, workers=workers)
+                _run_post_load(logger, _post_load_specs(post_cfg, loaded_tables), _post_load_oracle, workers)
+            finally:
+                if pool is not None:
+                    pool.close(force=True)
     finally:
-        conn.close()
+        close_hashing()
+        release_target(ctx, conn)
 
     # logger.info("LOAD stage end")
 
 
-def _run_load_plan(ctx, logger, csv_files, sql_map, tgt_type, schema, load_mode):
+def _run_load_plan(ctx, logger, csv_files, table_of, tgt_type, schema, load_mode):
     """PLAN 모드: 로드 대상 파일 목록·테이블 매핑을 사전 확인한다."""
-    items = _collect_csv_info(csv_files, sql_map)
+    items = _collect_csv_info(csv_files, table_of)
 
     loadable = [it for it in items if it["sql_found"]]
     no_sql   = [it for it in items if not it["sql_found"]]
@@ -203,34 +615,231 @@ def _run_load_plan(ctx, logger, csv_files, sql_map, tgt_type, schema, load_mode)
     logger.info("LOAD [PLAN] 완료 — 실제 로드는 run 모드에서 실행하세요.")
 
 
-def _run_load_loop(ctx, logger, csv_files, sql_map, tgt_type, load_fn):
-    total = len(csv_files)
-    loaded = 0
-    skipped = 0
-    failed = 0
+def _group_csv_by_table(csv_files, table_of):
+    """
+    CSV를 target 테이블별로 묶는다. 테이블 순서·테이블 내 파일 순서는 csv_files 순서를 따른다.
+    반환: ([(table_name, [csv_path, ...]), ...], sql 매핑 없는 csv 목록)
+    """
+    groups = {}
+    no_sql = []
+    for csv_path in csv_files:
+        table_name = table_of(csv_path)
+        if not table_name:
+            no_sql.append(csv_path)
+            continue
+        groups.setdefault(table_name, []).append(csv_path)
+    return list(groups.items()), no_sql
 
-    for i, csv_path in enumerate(csv_files, 1):
-        sqlname = extract_sqlname_from_csv(csv_path)
-        sql_file = sql_map.get(sqlname)
 
-        if not sql_file:
-            logger.warning("CSV[%d/%d] skip (sql not found): %s", i, total, csv_path.name)
-            skipped += 1
-            continue
+def _file_load_mode(load_mode: str, j: int) -> str:
+    """그룹 내 두 번째 파일부터 append (replace/truncate는 테이블당 1회). delete는 파일별 params 기준이라 유지"""
+    return "append" if j > 0 and load_mode in ("replace", "truncate") else load_mode
+
 
-        table_name = resolve_table_name(sql_file)
-        file_hash = _sha256_file(csv_path)
+def _history_mode(ctx, load_mode: str, file_load_mode: str) -> str:
+    """
+    replace/truncate 그룹의 두 번째 이후 파일(append)은 이력 체크 없이 적재
+    (이번 run에서 테이블을 비웠으므로 이전 적재 이력과 무관). 이력 체크를 생략하는 retry로 전달.
+    """
+    return "retry" if file_load_mode != load_mode else ctx.mode
 
-        logger.info("LOAD [%d/%d] | table=%s | file=%s", i, total, table_name, csv_path.name)
 
+def _load_files(logger, table_name, csv_paths, file_hashes, load_mode, load_fn):
+    """파일 단위 순차 적재. load_fn(table, csv_path, file_hash, load_mode). 실패 파일은 None"""
+    results = []
+    for j, (csv_path, file_hash) in enumerate(zip(csv_paths, file_hashes)):
         try:
-            result = load_fn(table_name, csv_path, file_hash)
-            if result == -1:
-                skipped += 1
-            else:
-                loaded += 1
+            results.append(load_fn(table_name, csv_path, file_hash, _file_load_mode(load_mode, j)))
         except Exception as e:
             logger.exception("LOAD failed | table=%s | file=%s | %s", table_name, csv_path.name, e)
-            failed += 1
+            results.append(None)
+    return results
+
+
+def _run_group_load_loop(ctx, logger, csv_files, table_of, load_mode, hash_of,
+                         load_group_fn=None, load_fn=None, prepare_fn=None, workers=1,
+                         unchanged_fn=None):
+    """
+    테이블 단위 적재. 테이블 내 파일 순서는 유지한다.
+      load_group_fn(table, csv_paths, file_hashes, prepared) → 파일별 결과 리스트
+                     (예외 시 load_fn이 있으면 파일 단위로 재시도)
+      load_fn(table, csv_path, file_hash, load_mode) — 그룹의 첫 파일만 load_mode, 이후 append
+      prepare_fn(table, csv_paths) — workers>1이면 다음 그룹들을 미리 준비(파싱), 적재는 순서대로 1개씩
+      workers>1 + prepare_fn 없음 → 그룹(테이블)들을 동시에 적재 (load_group_fn이 thread-safe해야 함)
+      unchanged_fn(table, file_hashes) — True면 그룹 전체 skip (load.skip_unchanged)
+    결과: int(row 수) / -1(skip) / None(실패)
+    반환: 파일이 1개 이상 적재된 테이블 목록 (post_load 대상)
+    """
+    groups, no_sql = _group_csv_by_table(csv_files, table_of)
+    loaded = 0
+    skipped = len(no_sql)
+    failed = 0
 
-    logger.info("LOAD summary | loaded=%d skipped=%d failed=%d", loaded, skipped, failed)
\ No newline at end of file
+    for csv_path in no_sql:
+        logger.warning("CSV skip (sql not found): %s", csv_path.name)
+
+    unchanged = {}
+
+    def _is_unchanged(table_name, csv_paths):
+        if unchanged_fn is None:
+            return False
+        if table_name not in unchanged:
+            unchanged[table_name] = unchanged_fn(table_name, [hash_of(p) for p in csv_paths])
+        return unchanged[table_name]
+
+    def _load_group(i, table_name, csv_paths, prepared=None):
+        file_hashes = [hash_of(p) for p in csv_paths]
+        logger.info("LOAD [%d/%d] | table=%s | files=%d", i, len(groups), table_name, len(csv_paths))
+        for p in csv_paths:
+            logger.debug("  file=%s", p.name)
+        if _is_unchanged(table_name, csv_paths):
+            logger.info("LOAD skip (unchanged since last load) | %s | files=%d", table_name, len(csv_paths))
+            return [-1] * len(csv_paths)
+
+        if load_group_fn is None:
+            return _load_files(logger, table_name, csv_paths, file_hashes, load_mode, load_fn)
+        try:
+            return load_group_fn(table_name, csv_paths, file_hashes, prepared)
+        except Exception as e:
+            if load_fn is None:
+                logger.exception("LOAD failed | table=%s | %s", table_name, e)
+                return [None] * len(csv_paths)
+            logger.warning("LOAD group failed, retrying per file | table=%s | %s", table_name, e)
+            return _load_files(logger, table_name, csv_paths, file_hashes, load_mode, load_fn)
+
+    all_results = []
+    if workers > 1 and prepare_fn is not None:
+        # 준비(파싱)는 병렬, 적재는 단일 writer — 메모리 보호를 위해 workers개까지만 앞서 준비
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="load-prep") as executor:
+            futures = {}
+            for i, (table_name, csv_paths) in enumerate(groups):
+                for k in range(i, min(i + workers, len(groups))):
+                    if k not in futures:
+                        futures[k] = (None if _is_unchanged(*groups[k])
+                                      else executor.submit(prepare_fn, *groups[k]))
+                try:
+                    fut = futures.pop(i)
+                    prepared = fut.result() if fut is not None else None
+                except Exception as e:
+                    logger.warning("LOAD prepare failed, loading directly | table=%s | %s", table_name, e)
+                    prepared = None
+                all_results.append(_load_group(i + 1, table_name, csv_paths, prepared))
+    elif workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="load") as executor:
+            futures = [executor.submit(_load_group, i, table_name, csv_paths)
+                       for i, (table_name, csv_paths) in enumerate(groups, 1)]
+            all_results = [f.result() for f in futures]
+    else:
+        all_results = [_load_group(i, table_name, csv_paths)
+                       for i, (table_name, csv_paths) in enumerate(groups, 1)]
+
+    loaded_tables = []
+    for (table_name, _), results in zip(groups, all_results):
+        for result in results:
+            if result is None:
+                failed += 1
+            elif result == -1:
+                skipped += 1
+            else:
+                loaded += 1
+        if any(r is not None and r != -1 for r in results):
+            loaded_tables.append(table_name)
+
+    logger.info("LOAD summary | loaded=%d skipped=%d failed=%d", loaded, skipped, failed)
+    return loaded_tables
+
+
+def _run_sqlite_shard_load(ctx, logger, conn, csv_files, table_of, load_mode, hash_of,
+                           db_path: Path, workers: int, bulk: bool, batch_size, columns_of,
+                           unchanged_fn=None, catalog=None, csv_reader="python"):
+    """
+    SQLite 병렬 적재: 테이블 그룹을 shard DB(프로세스별)로 나눠 적재한 뒤 본 DB로 병합.
+    SQLite는 writer가 1개뿐이므로 CSV 파싱·INSERT를 shard 프로세스에서 병렬로 하고
+    본 DB에는 ATTACH + INSERT SELECT만 수행한다. 테이블 1개는 항상 shard 1개에서 순서대로 적재.
+    반환: 파일이 1개 이상 적재된 테이블 목록
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from adapters.targets.sqlite_target import load_shard, merge_shard, _already_loaded
+
+    groups, no_sql = _group_csv_by_table(csv_files, table_of)
+    loaded = 0
+    skipped = len(no_sql)
+    failed = 0
+    for csv_path in no_sql:
+        logger.warning("CSV skip (sql not found): %s", csv_path.name)
+
+    # append 이력 체크는 본 DB 기준으로 미리 (shard의 _LOAD_HISTORY는 비어 있음)
+    work = []
+    for table_name, csv_paths in groups:
+        if unchanged_fn is not None and unchanged_fn(table_name, [hash_of(p) for p in csv_paths]):
+            logger.info("LOAD skip (unchanged since last load) | %s | files=%d", table_name, len(csv_paths))
+            skipped += len(csv_paths)
+            continue
+        files = []
+        for csv_path in csv_paths:
+            file_hash = hash_of(csv_path)
+            if load_mode == "append" and ctx.mode != "retry" \
+                    and _already_loaded(conn, ctx.job_name, table_name, file_hash, catalog):
+                logger.info("LOAD skip (already loaded) | %s | %s", table_name, csv_path.name)
+                skipped += 1
+                continue
+            files.append((str(csv_path), file_hash, columns_of(csv_path)))
+        if files:
+            work.append((table_name, files))
+
+    if not work:
+        logger.info("LOAD summary | loaded=%d skipped=%d failed=%d", loaded, skipped, failed)
+        return []
+
+    # 파일 크기 기준으로 shard에 분배 (큰 테이블부터 가장 가벼운 shard로)
+    n_shards = min(workers, len(work))
+    shards = [[] for _ in range(n_shards)]
+    shard_bytes = [0] * n_shards
+    for table_name, files in sorted(work, key=lambda g: -sum(Path(f[0]).stat().st_size for f in g[1])):
+        k = shard_bytes.index(min(shard_bytes))
+        shards[k].append((table_name, files))
+        shard_bytes[k] += sum(Path(f[0]).stat().st_size for f in files)
+
+    shard_paths = [db_path.with_name(f"{db_path.name}.shard{k}") for k in range(n_shards)]
+    for k, shard_groups in enumerate(shards):
+        logger.info("LOAD shard %d/%d | tables=%s", k + 1, n_shards, ", ".join(t for t, _ in shard_groups))
+
+    with ProcessPoolExecutor(max_workers=n_shards) as executor:
+        futures = [executor.submit(load_shard, str(shard_paths[k]), ctx.job_name, shards[k], bulk, batch_size,
+                                   ctx.run_id, csv_reader)
+                   for k in range(n_shards)]
+        shard_results = []
+        for k, fut in enumerate(futures):
+            try:
+                shard_results.append(fut.result())
+            except Exception as e:
+                logger.error("LOAD shard %d failed: %s", k + 1, e)
+                shard_results.append({t: [f"{type(e).__name__}: {e}"] * len(files) for t, files in shards[k]})
+
+    loaded_tables = []
+    for k, results in enumerate(shard_results):
+        tables = []
+        for table_name, files in shards[k]:
+            res = results.get(table_name, [])
+            for (csv_path, _, _), r in zip(files, res):
+                if isinstance(r, str):
+                    logger.error("LOAD failed | table=%s | file=%s | %s", table_name, Path(csv_path).name, r)
+            if any(isinstance(r, int) for r in res):
+                tables.append(table_name)
+
+        merged = merge_shard(conn, shard_paths[k], tables, load_mode, bulk) if shard_paths[k].exists() else {}
+        for table_name, files in shards[k]:
+            res = results.get(table_name, [])
+            merge_error = merged.get(table_name)
+            if isinstance(merge_error, Exception):
+                logger.error("LOAD merge failed | table=%s | %s", table_name, merge_error)
+            for r in res:
+                if isinstance(r, int) and not isinstance(merge_error, Exception):
+                    loaded += 1
+                else:
+                    failed += 1
+            if table_name in merged and not isinstance(merge_error, Exception):
+                loaded_tables.append(table_name)
+
+    logger.info("LOAD summary | loaded=%d skipped=%d failed=%d", loaded, skipped, failed)
+    return loaded_tables
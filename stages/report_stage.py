@@ -9,6 +9,7 @@ job.yml 설정:
     source: target          # target(기본) / oracle / vertica
     skip_sql: false         # true: DB 연결 없이 csv_union_dir의 CSV만 사용
     csv_union_dir: data/export  # skip_sql=true 시 union할 CSV 소스 폴더
+    profile: false          # true: SQL별 시간·row 수 + DB 실행 계획 저장 (engine/profiling.py)
     export_csv:
       enabled: true
       sql_dir: sql/report/
@@ -18,19 +19,37 @@ job.yml 설정:
       enabled: true
       out_dir: data/report/
       max_files: 10
+      sample_rows: 1000     # 숫자 컬럼 판단·컬럼 너비 계산에 쓰는 앞부분 row 수 (CSV는 스트리밍 기록)
+      overflow: sheets      # sheet당 1,048,575 row 초과 시: sheets(기본, SHEET_2 ...) / workbooks(별도 xlsx) / skip
+      max_rows_per_sheet: 1048575   # 분할 기준 row 수 (Excel 상한 이하)
+      number_formats:       # 컬럼 서식 (컬럼 단위 스타일 1개를 공유 → 서식 없는 sheet와 속도 동일)
+        auto: true          # 샘플 기준 자동: 정수 "#,##0" / 소수 "#,##0.0.." (샘플 소수 자릿수)
+                            #   YYYY-MM-DD[ HH:MI:SS] 문자열 컬럼 → 날짜 값 + 날짜 서식
+        int: "#,##0"
+        float: null         # 지정 시 모든 소수 컬럼에 사용
+        date: yyyy-mm-dd
+        datetime: yyyy-mm-dd hh:mm:ss
+        columns:            # 컬럼명별 지정 (모든 sheet 공통)
+          손해율(%): "0.00"
+    report SQL 앞부분 주석 --format: 컬럼 = 서식 (줄당 1개) 이 가장 우선한다.
 """
 
 import csv
 import gzip
 import re
 import time
-from datetime import datetime
+from datetime import datetime, date
+from itertools import chain, islice
 from pathlib import Path
 
-from engine.connection import connect_target
+from engine.column_types import infer_kinds
+from engine.connection import acquire_target, release_target
 from engine.context import RunContext
+from engine.manifest import (MANIFEST_FILE, describe_columns, file_entry, find_manifest,
+                             index_manifest, read_manifest, write_manifest)
 from engine.path_utils import resolve_path
-from engine.sql_utils import sort_sql_files, render_sql
+from engine.profiling import create_profiler
+from engine.sql_utils import parse_format_hints, sort_sql_files, render_sql
 
 
 def run(ctx: RunContext):
@@ -110,7 +129,9 @@ def _run_csv_export(ctx, report_cfg, cfg) -> list:
     )
 
     generated = []
+    manifest_entries = []
     total = len(sql_files)
+    profiler = create_profiler(ctx, "REPORT", conn_type, report_cfg.get("profile"))
 
     try:
         for i, sql_file in enumerate(sql_files, 1):
@@ -123,13 +144,27 @@ def _run_csv_export(ctx, report_cfg, cfg) -> list:
             logger.info("REPORT [%d/%d] %s → %s", i, total, sql_file.name, out_file.name)
             start = time.time()
             try:
-                rows = _export_to_csv(conn, conn_type, rendered, out_file, compression)
+                meta = {}
+                if profiler:
+                    with profiler.statement(conn, sql_file.name, 1, rendered) as rec:
+                        rows = rec["rows"] = _export_to_csv(conn, conn_type, rendered, out_file, compression, meta)
+                else:
+                    rows = _export_to_csv(conn, conn_type, rendered, out_file, compression, meta)
                 logger.info("REPORT [%d/%d] done | rows=%d elapsed=%.2fs", i, total, rows, time.time() - start)
                 generated.append(out_file)
+                manifest_entries.append(file_entry(out_file, sql_file=sql_file.name, rows=rows, **meta))
             except Exception as e:
                 logger.error("REPORT [%d/%d] FAILED (%.2fs): %s", i, total, time.time() - start, e)
     finally:
-        conn.close()
+        if profiler:
+            profiler.report(logger)   # 공유 연결 반납 전에 세션 설정 복원
+        release_target(ctx, conn)
+
+    if manifest_entries:
+        try:
+            write_manifest(out_dir / MANIFEST_FILE, ctx.job_name, ctx.run_id, manifest_entries)
+        except Exception as e:
+            logger.warning("REPORT manifest write failed: %s", e)
 
     return generated
 
@@ -145,7 +180,7 @@ def _open_connection(ctx, report_source: str):
 
     if report_source == "target":
         target_cfg = ctx.job_config.get("target", {})
-        return connect_target(ctx, target_cfg)
+        return acquire_target(ctx, target_cfg)
 
     # source DB (oracle / vertica)
     from adapters.sources.oracle_client import init_oracle_client, get_oracle_conn
@@ -178,14 +213,17 @@ def _open_connection(ctx, report_source: str):
         raise ValueError(f"REPORT: unsupported source type: {src_type}")
 
 
-def _export_to_csv(conn, conn_type: str, sql_text: str, out_file: Path, compression: str) -> int:
-    """SQL 실행 결과를 CSV 저장. row 수 반환."""
+def _export_to_csv(conn, conn_type: str, sql_text: str, out_file: Path, compression: str,
+                   meta: dict = None) -> int:
+    """SQL 실행 결과를 CSV 저장. row 수 반환. meta가 주어지면 컬럼 정보를 채운다."""
     open_fn = gzip.open if compression == "gzip" else open
     row_count = 0
 
     if conn_type == "duckdb":
         rel = conn.execute(sql_text)
         columns = [d[0] for d in rel.description]
+        if meta is not None:
+            meta["columns"] = describe_columns(rel.description)
         with open_fn(out_file, "wt", encoding="utf-8", newline="") as f:
             writer = csv.writer(f)
             writer.writerow(columns)
@@ -203,6 +241,8 @@ def _export_to_csv(conn, conn_type: str, sql_text: str, out_file: Path, compress
                 cur.arraysize = 10000
             cur.execute(sql_text)
             columns = [d[0] for d in cur.description]
+            if meta is not None:
+                meta["columns"] = describe_columns(cur.description)
             with open_fn(out_file, "wt", encoding="utf-8", newline="") as f:
                 writer = csv.writer(f)
                 writer.writerow(columns)
@@ -220,9 +260,12 @@ def _export_to_csv(conn, conn_type: str, sql_text: str, out_file: Path, compress
 
 
 # ────────────────────────────────────────────────────────────
-# Excel Export (pandas 기반, csv_to_excel 로직)
+# Excel Export (openpyxl write-only 스트리밍)
 # ────────────────────────────────────────────────────────────
 
+EXCEL_MAX_ROWS = 1_048_575   # sheet당 데이터 row 상한 (Excel 1,048,576행 - 헤더)
+
+
 def _get_excel_output_path(ctx, out_dir: Path, job_name: str, max_files: int) -> Path:
     logger = ctx.logger
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -242,17 +285,41 @@ def _get_excel_output_path(ctx, out_dir: Path, job_name: str, max_files: int) ->
     existing_sorted = sorted(existing, key=lambda x: x[1].stat().st_mtime)
     while len(existing_sorted) >= max_files:
         _, old = existing_sorted.pop(0)
-        old.unlink()
-        logger.info("REPORT excel: deleting old file %s", old.name)
+        for f in [old] + list(out_dir.glob(f"{old.stem}__*.xlsx")):   # overflow=workbooks 분할 파일 포함
+            f.unlink()
+            logger.info("REPORT excel: deleting old file %s", f.name)
 
     return out
 
 
+def _manifest_rows(csv_files: list) -> dict:
+    """
+    CSV 폴더의 manifest(report: {dir}/manifest.json, export: {dir}/{run_id}/manifest.json)에서
+    row 수 조회. 파일이 manifest 기록 이후 바뀌었으면 제외 → 스트리밍 중에 판단한다.
+    """
+    rows = {}
+    for d in {Path(p).parent for p in csv_files}:
+        index = index_manifest(read_manifest(d / MANIFEST_FILE), d)
+        latest, _ = find_manifest(d)
+        if latest:
+            index = {**index_manifest(read_manifest(latest), d), **index}
+        rows.update({p: e["rows"] for p, e in index.items() if e.get("rows") is not None})
+    return rows
+
+
 def _run_excel_export(ctx, report_cfg, cfg, csv_files: list):
     logger = ctx.logger
     out_dir_str = cfg.get("out_dir") or report_cfg.get("export_csv", {}).get("out_dir", "data/report")
     out_dir = resolve_path(ctx, out_dir_str)
     max_files = int(cfg.get("max_files", 10))
+    sample_rows = int(cfg.get("sample_rows", 1000))
+    nf_cfg = cfg.get("number_formats") or {}
+    declared = _declared_formats(ctx, report_cfg)
+    max_rows = min(int(cfg.get("max_rows_per_sheet", EXCEL_MAX_ROWS)), EXCEL_MAX_ROWS)
+    overflow = (cfg.get("overflow") or "sheets").strip().lower()
+    if overflow not in ("sheets", "workbooks", "skip"):
+        logger.warning("REPORT excel: unknown overflow=%s, using sheets", overflow)
+        overflow = "sheets"
 
     if not csv_files:
         if out_dir.exists():
@@ -270,98 +337,272 @@ def _run_excel_export(ctx, report_cfg, cfg, csv_files: list):
     start = time.time()
 
     try:
-        import pandas as pd
-        from pandas.api.types import is_integer_dtype, is_float_dtype
-        from openpyxl.styles import Font, PatternFill
-        from openpyxl.utils import get_column_letter
+        from openpyxl import Workbook
 
         summary_rows = []
-
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-
-            for csv_file in csv_files:
-                sheet_name = csv_file.stem.replace(".csv", "").upper()[:31]
-
-                open_fn = gzip.open if str(csv_file).endswith(".gz") else open
-
-                # 행 수 사전 체크 (OOM 방지)
-                with open_fn(csv_file, "rt", encoding="utf-8") as f:
-                    row_count = sum(1 for _ in f) - 1  # 헤더 제외
-                if row_count > 1_048_576:
-                    logger.warning("REPORT excel: row limit exceeded, skip | %s rows=%d", sheet_name, row_count)
-                    continue
-
-                with open_fn(csv_file, "rt", encoding="utf-8") as f:
-                    df = pd.read_csv(f)
-
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                summary_rows.append({"sheet_name": sheet_name, "rows": row_count})
-
-                ws = writer.book[sheet_name]
-                ws.freeze_panes = "A2"
-                ws.auto_filter.ref = ws.dimensions
-
-                # 헤더 스타일
-                header_fill = PatternFill("solid", fgColor="D9E1F2")
-                header_font = Font(bold=True)
-                for col_idx in range(1, len(df.columns) + 1):
-                    c = ws.cell(row=1, column=col_idx)
-                    c.fill = header_fill
-                    c.font = header_font
-
-                # 컬럼 너비
-                for col_idx, col_name in enumerate(df.columns, start=1):
-                    col_series = df.iloc[:, col_idx - 1].astype(str)
-                    str_max = col_series.str.len().max()
-                    max_len = max(str_max if pd.notna(str_max) else 0, len(str(col_name)))
-                    ws.column_dimensions[get_column_letter(col_idx)].width = min(int(max_len * 1.2) + 2, 50)
-
-
-                # 숫자 컬럼 포맷
-                # for col_idx, col_name in enumerate(df.columns, start=1):
-                #     if is_integer_dtype(df[col_name]) or is_float_dtype(df[col_name]):
-                #         for row in range(2, ws.max_row + 1):
-                #             ws.cell(row=row, column=col_idx).number_format = "#,##0"
-
-                logger.info("REPORT excel sheet: %s (%d rows)", sheet_name, row_count)
-
-            # SUMMARY 시트
-            if summary_rows:
-                import pandas as pd
-                summary_df = pd.DataFrame(summary_rows)
-                summary_df.insert(0, "no", range(1, len(summary_df) + 1))
-                summary_df.to_excel(writer, sheet_name="SUMMARY", index=False)
-
-                ws_sum = writer.book["SUMMARY"]
-                ws_sum.freeze_panes = "A2"
-                ws_sum.auto_filter.ref = ws_sum.dimensions
-
-                h_fill = PatternFill("solid", fgColor="BDD7EE")
-                h_font = Font(bold=True)
-                for col_idx in range(1, summary_df.shape[1] + 1):
-                    c = ws_sum.cell(row=1, column=col_idx)
-                    c.fill = h_fill
-                    c.font = h_font
-
-                for col_idx, col_name in enumerate(summary_df.columns, start=1):
-                    values = [len(str(col_name))]
-                    values += [len(str(v)) for v in summary_df[col_name] if pd.notna(v)]
-                    max_len = max(values)
-                    ws_sum.column_dimensions[get_column_letter(col_idx)].width = min(int(max_len * 1.2) + 2, 30)
-
-                existing_sheets = set(writer.book.sheetnames)
-                for row_idx in range(2, ws_sum.max_row + 1):
-                    sheet_val = ws_sum.cell(row=row_idx, column=2).value
-                    if sheet_val and sheet_val in existing_sheets:
-                        ws_sum.cell(row=row_idx, column=2).hyperlink = f"#'{sheet_val}'!A1"
-                        ws_sum.cell(row=row_idx, column=2).style = "Hyperlink"
-
-                wb = writer.book
-                wb._sheets.insert(0, wb._sheets.pop(wb._sheets.index(ws_sum)))
+        known_rows = _manifest_rows(csv_files) if overflow == "skip" else {}
+
+        # write-only: row를 바로 임시 파일로 흘려보냄 → 메모리 사용량이 sheet 크기와 무관
+        # SUMMARY는 맨 앞에 만들어 두고 내용은 마지막에 채운다
+        wb = Workbook(write_only=True)
+        ws_sum = wb.create_sheet("SUMMARY")
+
+        for csv_file in csv_files:
+            sheet_name = csv_file.stem.replace(".csv", "").upper()[:31]
+
+            # overflow=skip: manifest에 row 수가 있으면 파일을 읽지 않고 건너뜀 (없으면 스트리밍 중 판단)
+            known = known_rows.get(Path(csv_file))
+            if overflow == "skip" and known is not None and known > max_rows:
+                logger.warning("REPORT excel: row limit exceeded, skip | %s rows=%d", sheet_name, known)
+                continue
+
+            formats = {**(nf_cfg.get("columns") or {}), **declared.get(_csv_stem(csv_file), {})}
+            parts = _write_csv_sheet(wb, sheet_name, csv_file, sample_rows, nf_cfg, formats,
+                                     max_rows=max_rows, overflow=overflow, output_path=output_path)
+            if not parts:
+                logger.warning("REPORT excel: row limit exceeded, skip | %s rows>%d", sheet_name, max_rows)
+                continue
+            summary_rows.extend(parts)
+            for part_name, row_count, file_name in parts:
+                logger.info("REPORT excel sheet: %s (%d rows)%s", part_name, row_count,
+                            f" → {file_name}" if file_name else "")
+
+        if not summary_rows:
+            logger.warning("REPORT excel: no sheet written, skip")
+            return
+
+        _write_summary_sheet(ws_sum, summary_rows)
+        wb.save(output_path)
 
         logger.info("REPORT excel done | %s (%.2fs)", output_path.name, time.time() - start)
 
     except ImportError as e:
-        logger.error("REPORT excel: package not installed (%s) -> pip install pandas openpyxl", e)
+        logger.error("REPORT excel: package not installed (%s) -> pip install openpyxl", e)
     except Exception as e:
         logger.exception("REPORT excel generation failed: %s", e)
+
+
+def _open_csv_text(csv_file: Path):
+    open_fn = gzip.open if str(csv_file).endswith(".gz") else open
+    return open_fn(csv_file, "rt", encoding="utf-8", newline="")
+
+
+def _header_cells(ws, headers: list, fg_color: str) -> list:
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill
+
+    fill = PatternFill("solid", fgColor=fg_color)
+    font = Font(bold=True)
+    cells = []
+    for h in headers:
+        c = WriteOnlyCell(ws, value=h)
+        c.fill = fill
+        c.font = font
+        cells.append(c)
+    return cells
+
+
+def _csv_stem(csv_file: Path) -> str:
+    name = csv_file.name
+    return name[:-len(".csv.gz")] if name.endswith(".csv.gz") else name[:-len(".csv")] if name.endswith(".csv") else csv_file.stem
+
+
+def _declared_formats(ctx, report_cfg) -> dict:
+    """report SQL의 --format: 힌트 → {sql stem(= CSV 파일명): {컬럼: 서식}}"""
+    sql_dir = resolve_path(ctx, report_cfg.get("export_csv", {}).get("sql_dir", "sql/report"))
+    if not sql_dir.exists():
+        return {}
+    out = {}
+    for f in sort_sql_files(sql_dir):
+        formats = parse_format_hints(f)
+        if formats:
+            out[f.stem] = formats
+    return out
+
+
+_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DATETIME_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(\.\d+)?")
+_PERIOD_PATTERN = re.compile(r"(19|20)\d{2}(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])?")   # YYYYMM / YYYYMMDD
+
+
+def _sample_column(values: list, kind):
+    """
+    샘플 값 → (kind, 소수 자릿수). 날짜 문자열 컬럼은 kind=date / datetime,
+    YYYYMM·YYYYMMDD 정수 컬럼(CLS_YYMM 등)은 kind=period → 자동 서식 없음 ("202,303" 방지)
+    """
+    values = [v for v in values if v and not v.isspace()]
+    if kind == "int" and values and all(_PERIOD_PATTERN.fullmatch(v) for v in values):
+        return "period", 0
+    if kind == "float":
+        return kind, min(max((len(v.partition(".")[2]) for v in values), default=0), 6)
+    if kind == "string" and values:
+        if all(_DATE_PATTERN.fullmatch(v) for v in values):
+            return "date", 0
+        if all(_DATETIME_PATTERN.fullmatch(v) for v in values):
+            return "datetime", 0
+    return kind, 0
+
+
+def _column_format(kind, decimals: int, nf_cfg: dict, auto: bool):
+    if not auto:
+        return None
+    if kind == "int":
+        return nf_cfg.get("int", "#,##0")
+    if kind == "float":
+        return nf_cfg.get("float") or ("#,##0." + "0" * decimals if decimals else "#,##0")
+    if kind == "date":
+        return nf_cfg.get("date", "yyyy-mm-dd")
+    if kind == "datetime":
+        return nf_cfg.get("datetime", "yyyy-mm-dd hh:mm:ss")
+    return None
+
+
+def _to_date(v):
+    d = datetime.fromisoformat(v)
+    return d if len(v) > 10 else date(d.year, d.month, d.day)
+
+
+def _cell_converter(kind):
+    """샘플 기준 숫자·날짜 컬럼은 값 변환 (샘플 이후 변환 안 되는 값은 문자열 그대로)"""
+    cast = {"int": int, "period": int, "float": float, "date": _to_date, "datetime": _to_date}.get(kind)
+
+    def convert(v):
+        if v == "":
+            return None
+        if cast is not None:
+            try:
+                return cast(v)
+            except ValueError:
+                return v
+        return v
+
+    return convert
+
+
+def _part_sheet_name(sheet_name: str, part: int) -> str:
+    """continuation sheet 이름: SHEET_2, SHEET_3, ... (31자 제한 안에서)"""
+    suffix = f"_{part}"
+    return sheet_name[:31 - len(suffix)] + suffix
+
+
+def _write_csv_sheet(wb, sheet_name: str, csv_file: Path, sample_rows: int,
+                     nf_cfg: dict = None, formats: dict = None,
+                     max_rows: int = EXCEL_MAX_ROWS, overflow: str = "sheets", output_path: Path = None) -> list:
+    """
+    CSV → write-only sheet 스트리밍. 앞부분 sample_rows개 row로 숫자 컬럼·컬럼 너비·서식을 정한다
+    (column_dimensions는 첫 append 전에 지정해야 함).
+
+    서식: 컬럼마다 number_format을 지정한 WriteOnlyCell 1개를 만들어 모든 row에서 재사용
+    (write-only writer는 cell을 append 즉시 기록 → 셀마다 스타일을 만들지 않음).
+
+    sheet당 max_rows 초과 시 (스트리밍 중 판단, 파일을 미리 세지 않음) overflow:
+      sheets    — 같은 workbook에 SHEET_2, SHEET_3 ... 로 이어서 기록
+      workbooks — {output}__SHEET_2.xlsx ... 별도 workbook으로 분할
+      skip      — 이미 쓴 sheet를 버리고 건너뜀
+    반환: [(sheet 이름, row 수, 별도 workbook 파일명 또는 None), ...] — skip 시 []
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+
+    nf_cfg = nf_cfg or {}
+    formats = formats or {}
+    auto = bool(nf_cfg.get("auto", False))
+
+    with _open_csv_text(csv_file) as f:
+        reader = csv.reader(f)
+        headers = next(reader, [])
+        sample = list(islice(reader, sample_rows))
+        ncols = len(headers)
+
+        converters = []
+        fmts = []
+        for col_idx, kind in enumerate(infer_kinds(sample, ncols)):
+            detected, decimals = _sample_column([r[col_idx] for r in sample if col_idx < len(r)], kind)
+            fmt = formats.get(headers[col_idx]) or _column_format(detected, decimals, nf_cfg, auto)
+            if detected in ("date", "datetime") and not fmt:
+                detected = kind   # 서식이 없으면 날짜 문자열 그대로
+            converters.append(_cell_converter(detected))
+            fmts.append(fmt)
+        widths = [
+            min(int(max([len(str(col_name))] + [len(r[col_idx]) for r in sample if col_idx < len(r)]) * 1.2) + 2, 50)
+            for col_idx, col_name in enumerate(headers)
+        ]
+
+        def start_sheet(book, name):
+            ws = book.create_sheet(name)
+            for col_idx, width in enumerate(widths, 1):
+                ws.column_dimensions[get_column_letter(col_idx)].width = width
+            ws.freeze_panes = "A2"
+            ws.append(_header_cells(ws, headers, "D9E1F2"))
+            styled = []   # [(컬럼 index, 서식 cell)] — 서식 cell은 workbook마다 따로 (스타일 등록 위치)
+            for col_idx, fmt in enumerate(fmts):
+                if fmt:
+                    proto = WriteOnlyCell(ws)
+                    proto.number_format = fmt
+                    styled.append((col_idx, proto))
+            return ws, styled
+
+        def finish_sheet(ws, count):
+            ws.auto_filter.ref = f"A1:{get_column_letter(max(ncols, 1))}{count + 1}"
+
+        parts = []
+        book, name, file_name = wb, sheet_name, None
+        ws, styled = start_sheet(book, name)
+        row_count = 0
+        for row in chain(sample, reader):
+            if row_count == max_rows:
+                if overflow == "skip":
+                    ws.close()
+                    wb.remove(ws)
+                    return []
+                finish_sheet(ws, row_count)
+                parts.append((name, row_count, file_name))
+                name = _part_sheet_name(sheet_name, len(parts) + 1)
+                if overflow == "workbooks":
+                    if book is not wb:
+                        book.save(output_path.with_name(file_name))
+                    book = Workbook(write_only=True)
+                    file_name = f"{output_path.stem}__{name}.xlsx"
+                ws, styled = start_sheet(book, name)
+                row_count = 0
+
+            values = [conv(v) for conv, v in zip(converters, row)]
+            for col_idx, proto in styled:
+                if col_idx < len(values) and values[col_idx] is not None:
+                    proto.value = values[col_idx]
+                    values[col_idx] = proto
+            ws.append(values)
+            row_count += 1
+
+    finish_sheet(ws, row_count)
+    parts.append((name, row_count, file_name))
+    if book is not wb:
+        book.save(output_path.with_name(file_name))
+    return parts
+
+
+def _write_summary_sheet(ws_sum, summary_rows: list):
+    """
+    SUMMARY: no / sheet_name(해당 sheet 하이퍼링크) / rows
+    summary_rows: [(sheet 이름, row 수, 별도 workbook 파일명 또는 None)] — 분할 workbook이 있으면 file 컬럼 추가
+    """
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+
+    with_file = any(file_name for _, _, file_name in summary_rows)
+    headers = ["no", "sheet_name", "rows"] + (["file"] if with_file else [])
+    rows = [(i, name, cnt) + ((file_name or "",) if with_file else ())
+            for i, (name, cnt, file_name) in enumerate(summary_rows, 1)]
+    for col_idx, col_name in enumerate(headers):
+        max_len = max([len(col_name)] + [len(str(r[col_idx])) for r in rows])
+        ws_sum.column_dimensions[get_column_letter(col_idx + 1)].width = min(int(max_len * 1.2) + 2, 30)
+    ws_sum.freeze_panes = "A2"
+
+    ws_sum.append(_header_cells(ws_sum, headers, "BDD7EE"))
+    for no, name, cnt, *file_col in rows:
+        link = WriteOnlyCell(ws_sum, value=name)
+        link.hyperlink = f"{file_col[0] if file_col else ''}#'{name}'!A1"
+        link.style = "Hyperlink"
+        ws_sum.append([no, link, cnt] + file_col)
+    ws_sum.auto_filter.ref = f"A1:{get_column_letter(len(headers))}{len(rows) + 1}"
@@ -7,13 +7,24 @@ job.yml 설정:
   transform:
     sql_dir: sql/transform/duckdb    # target DB에서 실행할 SQL 디렉토리
     on_error: stop                   # stop(기본) / continue
+    parallel_workers: 4              # 1(기본)=번호 순서대로 순차 실행
+                                     # >1: 파일이 읽고 쓰는 테이블로 의존성 DAG를 만들어 독립 파일 동시 실행
+                                     #     (DuckDB: cursor, Oracle: 커넥션 worker당 1개, SQLite: 순차)
+                                     #     SQL 첫 부분 --depends: 01_a, 02_b 힌트가 추론보다 우선
+    profile: true                    # statement별 시간·row 수 + DB 실행 계획 저장, 느린 statement top N
+                                     # (상세 옵션은 engine/profiling.py 참고)
 """
 
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-from engine.connection import connect_target
+from engine.connection import acquire_target, connect_target, release_target
 from engine.context import RunContext
 from engine.path_utils import resolve_path
+from engine.profiling import create_profiler, statement_rows
+from engine.resources import stage_threads
+from engine.sql_deps import build_dependencies, critical_path
 from engine.sql_utils import sort_sql_files, render_sql
 
 
@@ -54,7 +65,7 @@ def run(ctx: RunContext):
         logger.warning("TRANSFORM stage skipped (no target config)")
         return
 
-    conn, conn_type, label = connect_target(ctx, target_cfg)
+    conn, conn_type, label = acquire_target(ctx, target_cfg)
 
     # schema 결정: transform.schema 우선, 없으면 target.schema fallback
     schema = (transform_cfg.get("schema") or "").strip() \
@@ -71,17 +82,37 @@ def run(ctx: RunContext):
     # @{schema} 사용 시: 값이 있으면 "schema." 으로, 없으면 "" 으로 치환
     ctx.params.setdefault("schema", schema)
 
-    logger.info("TRANSFORM target=%s | sql_count=%d | on_error=%s", label, len(sql_files), on_error)
+    workers = max(1, stage_threads(ctx, "workers", int(transform_cfg.get("parallel_workers", 1))))
+    if workers > 1 and conn_type == "sqlite3":
+        logger.info("TRANSFORM SQLite: single writer → sequential (parallel_workers ignored)")
+        workers = 1
+
+    logger.info("TRANSFORM target=%s | sql_count=%d | on_error=%s%s", label, len(sql_files), on_error,
+                f" | parallel_workers={workers}" if workers > 1 else "")
+
+    def conn_factory():
+        """DAG worker용 커넥션 (worker 스레드마다 1개)"""
+        if conn_type == "duckdb":
+            c = conn.cursor()
+            if schema:
+                c.execute(f'SET schema = \'{schema}\'')
+            return c
+        return connect_target(ctx, target_cfg)[0]
+
+    profiler = create_profiler(ctx, "TRANSFORM", conn_type, transform_cfg.get("profile"))
 
     try:
-        _run_sql_loop(ctx, conn, conn_type, sql_files, on_error)
+        if workers <= 1 or not _run_sql_dag(ctx, conn_factory, conn_type, sql_files, on_error, workers, profiler):
+            _run_sql_loop(ctx, conn, conn_type, sql_files, on_error, profiler)
     finally:
-        conn.close()
+        if profiler:
+            profiler.report(logger)   # 공유 연결 반납 전에 세션 설정 복원
+        release_target(ctx, conn)
 
     # logger.info("TRANSFORM stage end")
 
 
-def _run_sql_loop(ctx, conn, conn_type, sql_files, on_error):
+def _run_sql_loop(ctx, conn, conn_type, sql_files, on_error, profiler=None):
     logger = ctx.logger
     total = len(sql_files)
     success = failed = 0
@@ -93,7 +124,7 @@ def _run_sql_loop(ctx, conn, conn_type, sql_files, on_error):
         logger.info("TRANSFORM [%d/%d] %s", i, total, sql_file.name)
         start = time.time()
         try:
-            _execute(conn, conn_type, rendered)
+            _execute(conn, conn_type, rendered, profiler, sql_file.name)
             logger.info("TRANSFORM [%d/%d] done (%.2fs)", i, total, time.time() - start)
             success += 1
         except Exception as e:
@@ -106,28 +137,123 @@ def _run_sql_loop(ctx, conn, conn_type, sql_files, on_error):
     logger.info("TRANSFORM summary | success=%d failed=%d total=%d", success, failed, total)
 
 
-def _execute(conn, conn_type, sql_text):
-    """세미콜론으로 분리해서 순차 실행. 주석·공백 statement 제거."""
-    statements = [s.strip() for s in sql_text.split(";") if s.strip()]
+def _run_sql_dag(ctx, conn_factory, conn_type, sql_files, on_error, workers, profiler=None) -> bool:
+    """
+    의존성 DAG 기준 병렬 실행. 선행 파일이 모두 끝난 파일부터 번호 순으로 시작한다.
+    on_error=stop: 실패 시 새 파일을 시작하지 않고 실행 중인 파일만 마저 끝냄
+    on_error=continue: 순차 실행과 같이 실패한 파일의 후행 파일도 실행
+    반환: False면 DAG를 만들 수 없음 (--depends 오류 등) → 호출 측에서 순차 실행
+    """
+    logger = ctx.logger
+    rendered = [render_sql(f.read_text(encoding="utf-8"), ctx.params) for f in sql_files]
+    try:
+        deps = build_dependencies([(f.stem, sql) for f, sql in zip(sql_files, rendered)])
+    except ValueError as e:
+        logger.warning("TRANSFORM dependency graph unavailable (%s) → sequential", e)
+        return False
 
-    if conn_type == "duckdb":
-        for stmt in statements:
-            conn.execute(stmt)
+    total = len(sql_files)
+    names = [f.name for f in sql_files]
+    pending = dict(enumerate(deps))
+    done = set()
+    running = {}
+    starts = [None] * total
+    durations = [0.0] * total
+    success = failed = 0
+    stop = False
 
-    elif conn_type == "sqlite3":
-        cur = conn.cursor()
+    local = threading.local()
+    opened = []
+    lock = threading.Lock()
+
+    def _run(i):
+        c = getattr(local, "conn", None)
+        if c is None:
+            c = local.conn = conn_factory()
+            with lock:
+                opened.append(c)
+        start = time.time()
         try:
-            for stmt in statements:
-                cur.execute(stmt)
-            conn.commit()
+            _execute(c, conn_type, rendered[i], profiler, names[i])
         finally:
-            cur.close()
+            durations[i] = time.time() - start
+
+    t0 = time.time()
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transform") as executor:
+            while True:
+                if not stop:
+                    for i in sorted(i for i, d in pending.items() if d <= done):
+                        del pending[i]
+                        starts[i] = time.time() - t0
+                        after = ", ".join(names[j] for j in sorted(deps[i]))
+                        logger.info("TRANSFORM [%d/%d] %s%s", i + 1, total, names[i],
+                                    f" (after {after})" if after else "")
+                        running[executor.submit(_run, i)] = i
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    i = running.pop(fut)
+                    try:
+                        fut.result()
+                        logger.info("TRANSFORM [%d/%d] done (%.2fs)", i + 1, total, durations[i])
+                        success += 1
+                    except Exception as e:
+                        logger.error("TRANSFORM [%d/%d] FAILED (%.2fs): %s", i + 1, total, durations[i], e)
+                        failed += 1
+                        if on_error == "stop" and not stop:
+                            stop = True
+                            logger.error("TRANSFORM aborted (on_error=stop)")
+                    done.add(i)
+    finally:
+        for c in opened:
+            try:
+                c.close()
+            except Exception:
+                pass
+
+    _log_critical_path(logger, names, deps, durations, starts, time.time() - t0)
+    if pending:
+        logger.info("TRANSFORM not started (on_error=stop): %s", ", ".join(names[i] for i in sorted(pending)))
+    logger.info("TRANSFORM summary | success=%d failed=%d total=%d", success, failed, total)
+    return True
+
+
+def _log_critical_path(logger, names, deps, durations, starts, wall):
+    """파일별 시작 시각·소요 시간·slack + 실측 기준 critical path"""
+    path, length, slack = critical_path(deps, durations)
+    for i, name in enumerate(names):
+        if starts[i] is None:
+            continue
+        logger.info("TRANSFORM [DAG] %-40s start=+%.2fs elapsed=%.2fs slack=%.2fs%s",
+                    name, starts[i], durations[i], slack[i], " *" if i in path else "")
+    logger.info("TRANSFORM critical path | %s | %.2fs (wall %.2fs)",
+                " → ".join(f"{names[i]}({durations[i]:.2f}s)" for i in path), length, wall)
+
+
+def _execute(conn, conn_type, sql_text, profiler=None, sql_name=""):
+    """세미콜론으로 분리해서 순차 실행. 주석·공백 statement 제거. profiler가 있으면 statement별 기록."""
+    statements = [s.strip() for s in sql_text.split(";") if s.strip()]
+
+    if conn_type == "duckdb":
+        for no, stmt in enumerate(statements, 1):
+            if profiler is None:
+                conn.execute(stmt)
+                continue
+            with profiler.statement(conn, sql_name, no, stmt) as rec:
+                rec["rows"] = statement_rows(conn_type, conn.execute(stmt))
 
-    elif conn_type == "oracle":
+    elif conn_type in ("sqlite3", "oracle"):
         cur = conn.cursor()
         try:
-            for stmt in statements:
-                cur.execute(stmt)
+            for no, stmt in enumerate(statements, 1):
+                if profiler is None:
+                    cur.execute(stmt)
+                    continue
+                with profiler.statement(conn, sql_name, no, stmt) as rec:
+                    cur.execute(stmt)
+                    rec["rows"] = statement_rows(conn_type, cur)
             conn.commit()
         finally:
             cur.close()